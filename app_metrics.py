@@ -0,0 +1,312 @@
+# ==============================================================================
+# METRIK APLIKASI (SPAN WAKTU, CACHE HIT/MISS, MEMORI SESI)
+# ==============================================================================
+# Instrumentasi untuk aplikasi yang sedang berjalan di produksi:
+#   - span waktu: setiap bagian halaman (import, render, grafik) dan
+#     setiap panggilan model (predict_proba_batch),
+#   - hit/miss cache untuk loader st.cache_data / st.cache_resource,
+#   - antrean prediksi: kedalaman antrean, permintaan ditolak, waktu tunggu,
+#   - memori: ukuran session_state (jumlah sesi, total & terbesar) dan RSS proses.
+#     ID sesi tidak pernah diekspor, jadi jumlah seri metrik tetap kecil.
+#
+# Semua MATI secara default, dan saat mati fungsi di sini langsung kembali
+# tanpa mencatat apa-apa. Nyalakan dengan environment variable:
+#   DIABETES_APP_METRICS=1              nyalakan pencatatan
+#   DIABETES_APP_METRICS_PORT=9108      endpoint teks Prometheus di http://127.0.0.1:9108/metrics
+#   DIABETES_APP_METRICS_HOST=0.0.0.0   alamat endpoint (default 127.0.0.1, hanya dari mesin ini)
+#   DIABETES_APP_METRICS_LOG=metrics.jsonl   tulis snapshot JSON berkala ('-' = stderr)
+#   DIABETES_APP_METRICS_INTERVAL=60    jeda antar snapshot JSON (detik)
+# Jika port dan file log tidak di-set, snapshot JSON ditulis ke stderr.
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENV_VAR = 'DIABETES_APP_METRICS'
+PORT_ENV_VAR = 'DIABETES_APP_METRICS_PORT'
+HOST_ENV_VAR = 'DIABETES_APP_METRICS_HOST'
+DEFAULT_HOST = '127.0.0.1'
+LOG_ENV_VAR = 'DIABETES_APP_METRICS_LOG'
+INTERVAL_ENV_VAR = 'DIABETES_APP_METRICS_INTERVAL'
+ENABLED = os.environ.get(ENV_VAR, '') not in ('', '0')
+
+PREFIX = 'diabetes_app'
+# Batas atas bucket histogram (detik)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Jumlah sesi terakhir yang ukuran memorinya disimpan (hanya di memori, tidak diekspor per sesi)
+MAX_SESSIONS = 100
+
+_NULL_SPAN = nullcontext()
+
+
+class Registry:
+    """Tempat semua metrik disimpan. Aman dipakai dari banyak thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans = {}       # (nama, label) -> [jumlah per bucket..., count, sum, max]
+        self.counters = {}    # (nama, label) -> nilai
+        self.gauges = {}      # (nama, label) -> nilai terakhir
+        self.sessions = OrderedDict()  # session_id -> byte session_state (hanya untuk agregat)
+
+    def observe(self, name, seconds, labels=()):
+        key = (name, labels)
+        with self._lock:
+            stats = self.spans.get(key)
+            if stats is None:
+                stats = self.spans[key] = [0] * len(BUCKETS) + [0, 0.0, 0.0]
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stats[i] += 1
+            stats[-3] += 1
+            stats[-2] += seconds
+            stats[-1] = max(stats[-1], seconds)
+
+    def inc(self, name, labels=(), value=1):
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, labels=()):
+        with self._lock:
+            self.gauges[(name, labels)] = value
+
+    def set_session_bytes(self, session_id, n_bytes):
+        with self._lock:
+            self.sessions[session_id] = n_bytes
+            self.sessions.move_to_end(session_id)
+            while len(self.sessions) > MAX_SESSIONS:
+                self.sessions.popitem(last=False)
+
+    def snapshot(self):
+        with self._lock:
+            spans = [{'span': name, **dict(labels), 'count': s[-3],
+                      'sum_s': round(s[-2], 6), 'max_s': round(s[-1], 6)}
+                     for (name, labels), s in self.spans.items()]
+            counters = [{'counter': name, **dict(labels), 'value': value}
+                        for (name, labels), value in self.counters.items()]
+            gauges = [{'gauge': name, **dict(labels), 'value': value}
+                      for (name, labels), value in self.gauges.items()]
+            sessions = self._session_summary()
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'spans': spans,
+            'counters': counters,
+            'gauges': gauges,
+            'session_state': sessions,
+            'process_rss_bytes': process_rss_bytes(),
+        }
+
+    def prometheus_text(self):
+        with self._lock:
+            spans = {key: list(s) for key, s in self.spans.items()}
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            sessions = self._session_summary()
+
+        lines = [f'# TYPE {PREFIX}_span_seconds histogram']
+        for (name, labels), s in sorted(spans.items()):
+            base = _labels((('span', name),) + labels)
+            for bound, count in zip(BUCKETS, s):
+                lines.append(f'{PREFIX}_span_seconds_bucket{_labels((("span", name),) + labels + (("le", bound),))} {count}')
+            lines.append(f'{PREFIX}_span_seconds_bucket{_labels((("span", name),) + labels + (("le", "+Inf"),))} {s[-3]}')
+            lines.append(f'{PREFIX}_span_seconds_sum{base} {s[-2]}')
+            lines.append(f'{PREFIX}_span_seconds_count{base} {s[-3]}')
+        for metric in sorted({name for name, _ in counters}):
+            lines.append(f'# TYPE {PREFIX}_{metric}_total counter')
+            for (name, labels), value in sorted(counters.items()):
+                if name == metric:
+                    lines.append(f'{PREFIX}_{name}_total{_labels(labels)} {value}')
+        for metric in sorted({name for name, _ in gauges}):
+            lines.append(f'# TYPE {PREFIX}_{metric} gauge')
+            for (name, labels), value in sorted(gauges.items()):
+                if name == metric:
+                    lines.append(f'{PREFIX}_{name}{_labels(labels)} {value}')
+        lines.append(f'# TYPE {PREFIX}_session_state_sessions gauge')
+        lines.append(f'{PREFIX}_session_state_sessions {sessions["sessions"]}')
+        for stat in ('sum', 'max'):
+            lines.append(f'# TYPE {PREFIX}_session_state_bytes_{stat} gauge')
+            lines.append(f'{PREFIX}_session_state_bytes_{stat} {sessions[f"{stat}_bytes"]}')
+        lines.append(f'# TYPE {PREFIX}_process_rss_bytes gauge')
+        lines.append(f'{PREFIX}_process_rss_bytes {process_rss_bytes()}')
+        return '\n'.join(lines) + '\n'
+
+    def _session_summary(self):
+        # Dipanggil dengan lock terkunci
+        sizes = self.sessions.values()
+        return {'sessions': len(sizes), 'sum_bytes': sum(sizes), 'max_bytes': max(sizes, default=0)}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels) + '}'
+
+
+REGISTRY = Registry()
+
+
+# ==============================================================================
+# 1. API PENCATATAN (TIDAK MELAKUKAN APA-APA JIKA MATI)
+# ==============================================================================
+def span(name, **labels):
+    """Context manager yang mencatat lama sebuah bagian kode."""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _timed(name, tuple(sorted(labels.items())))
+
+
+@contextmanager
+def _timed(name, labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - start, labels)
+
+
+_cache_call = threading.local()
+
+
+def track_cache(name):
+    """Decorator untuk loader st.cache_*: hitung hit & miss.
+
+    Dipasang DI LUAR decorator Streamlit, dan body fungsi yang di-cache
+    memanggil cache_miss(name). Jika body tidak dijalankan, berarti hit.
+    """
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Loader bisa memanggil loader lain, jadi status pemanggil disimpan dulu
+            outer = getattr(_cache_call, 'missed', False)
+            _cache_call.missed = False
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                result = 'miss' if _cache_call.missed else 'hit'
+                _cache_call.missed = outer
+                REGISTRY.observe('loader', time.perf_counter() - start, (('loader', name), ('result', result)))
+                REGISTRY.inc('cache_requests', (('loader', name), ('result', result)))
+        return wrapper
+    return decorator
+
+
+def observe(name, seconds, **labels):
+    """Catat lama sesuatu yang diukur sendiri (misal waktu tunggu di antrean)."""
+    if ENABLED:
+        REGISTRY.observe(name, seconds, tuple(sorted(labels.items())))
+
+
+def gauge(name, value, **labels):
+    if ENABLED:
+        REGISTRY.set_gauge(name, value, tuple(sorted(labels.items())))
+
+
+def cache_miss(name):
+    if ENABLED:
+        _cache_call.missed = True
+
+
+def count(name, **labels):
+    if ENABLED:
+        REGISTRY.inc(name, tuple(sorted(labels.items())))
+
+
+def record_session(session_id, session_state):
+    """Catat perkiraan ukuran session_state sebuah sesi (byte)."""
+    if ENABLED:
+        REGISTRY.set_session_bytes(session_id, sum(deep_sizeof(v) for v in session_state.values()))
+
+
+def deep_sizeof(obj):
+    # Array NumPy & DataFrame: ukuran datanya, bukan hanya objek pembungkusnya
+    if hasattr(obj, 'memory_usage') and callable(obj.memory_usage):
+        try:
+            return int(obj.memory_usage(deep=True).sum())
+        except TypeError:
+            pass
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(deep_sizeof(k) + deep_sizeof(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(deep_sizeof(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def process_rss_bytes():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        # Bukan Linux: pakai RSS puncak (ru_maxrss dalam KB di Linux, byte di macOS)
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == 'darwin' else rss * 1024
+
+
+# ==============================================================================
+# 2. EKSPOR: ENDPOINT PROMETHEUS & LOG JSON BERKALA
+# ==============================================================================
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = REGISTRY.prometheus_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _flush_loop(path, interval):
+    while True:
+        time.sleep(interval)
+        line = json.dumps(REGISTRY.snapshot())
+        if path == '-':
+            print(line, file=sys.stderr, flush=True)
+        else:
+            with open(path, 'a') as f:
+                f.write(line + '\n')
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start_exporters():
+    """Nyalakan endpoint / log berkala SEKALI per proses (dipanggil di setiap rerun)."""
+    global _started
+    if not ENABLED or _started:
+        return
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+        port = os.environ.get(PORT_ENV_VAR)
+        log_path = os.environ.get(LOG_ENV_VAR) or (None if port else '-')
+        if port:
+            host = os.environ.get(HOST_ENV_VAR) or DEFAULT_HOST
+            server = ThreadingHTTPServer((host, int(port)), MetricsHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        if log_path:
+            interval = float(os.environ.get(INTERVAL_ENV_VAR, '60'))
+            threading.Thread(target=_flush_loop, args=(log_path, interval), daemon=True).start()
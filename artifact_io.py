@@ -0,0 +1,501 @@
+# ==============================================================================
+# FORMAT MODEL RINGKAS (NPY + MANIFEST JSON)
+# ==============================================================================
+# File 'diabetes_model.pkl' berisi objek sklearn yang di-pickle. Kelemahannya:
+# lambat saat pertama dibuka, setiap proses worker memuat salinannya sendiri,
+# dan sering rusak jika versi scikit-learn berbeda.
+#
+# Modul ini menyimpan isi model sebagai array NumPy biasa (satu file .npy per
+# array) ditambah 'manifest.json' yang berisi versi format, nama fitur, daftar
+# kelas encoder, dan checksum setiap file. File .npy dibuka dengan
+# memory-map, sehingga banyak proses bisa berbagi satu salinan di disk.
+# Prediksi cukup memakai NumPy, tanpa perlu import sklearn (kecuali KNN:
+# pencarian tetangganya memakai KD-tree sklearn di atas array tersebut).
+#
+# Isi folder:
+#   diabetes_model/CURRENT                   nama versi yang sedang aktif
+#   diabetes_model/versions/<versi>/         file .npy + manifest.json
+# Versi baru ditulis lengkap di folder versions/ dulu, lalu file CURRENT
+# diganti dengan os.replace (atomic). Pembaca selalu melihat versi lama atau
+# versi baru secara utuh, tidak pernah campuran keduanya.
+#
+# Cara pakai:
+#   python artifact_io.py diabetes_model.pkl diabetes_model   # konversi pkl -> folder
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from knn_index import KDTreeIndex, brute_kneighbors
+from explain import build_explainer
+from tree_kernel import build_kernel
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+POINTER_NAME = 'CURRENT'
+VERSIONS_DIR = 'versions'
+# Versi lama yang tetap disimpan (proses lain mungkin masih membacanya)
+KEEP_VERSIONS = 3
+DEFAULT_ARTIFACT_DIR = 'diabetes_model'
+DEFAULT_PICKLE_PATH = 'diabetes_model.pkl'
+
+# Nama kolom fitur -> kunci encoder di dalam artifact
+ENCODER_KEYS = {
+    'gender': 'encoder_gender',
+    'smoking_status': 'encoder_smoking',
+}
+
+
+# ==============================================================================
+# 1. KOMPONEN PREPROCESSING (PENGGANTI StandardScaler & LabelEncoder)
+# ==============================================================================
+class CompactScaler:
+    """Pengganti StandardScaler.transform: (X - mean) / scale."""
+
+    def __init__(self, mean, scale):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X):
+        X = np.array(X, dtype=np.float64)
+        X -= self.mean_
+        X /= self.scale_
+        return X
+
+
+class CompactLabelEncoder:
+    """Pengganti LabelEncoder.transform berdasarkan daftar `classes_` yang urut."""
+
+    def __init__(self, classes):
+        self.classes_ = np.asarray(classes, dtype=object)
+
+    def transform(self, values):
+        values = np.asarray(values, dtype=object)
+        codes = np.searchsorted(self.classes_, values)
+        codes = np.clip(codes, 0, len(self.classes_) - 1)
+        if not (self.classes_[codes] == values).all():
+            unknown = sorted(set(values[self.classes_[codes] != values]))
+            raise ValueError(f"y contains previously unseen labels: {unknown}")
+        return codes
+
+
+# ==============================================================================
+# 2. MODEL (HANYA NUMPY)
+# ==============================================================================
+class CompactModel:
+    """Dasar model ringkas: predict() diambil dari argmax predict_proba()."""
+
+    def __init__(self, arrays, params):
+        self.arrays = arrays
+        self.params = params
+        self.classes_ = arrays['classes']
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+class CompactDecisionTree(CompactModel):
+    """Decision Tree dari array `tree_` sklearn (children, feature, threshold, value)."""
+
+    model_type = 'decision_tree'
+
+    def apply(self, X):
+        # Telusuri pohon untuk semua baris sekaligus, satu level per iterasi.
+        # Sama seperti sklearn, nilai fitur dibandingkan dalam float32.
+        X = np.asarray(X, dtype=np.float32)
+        left = self.arrays['children_left']
+        right = self.arrays['children_right']
+        feature = self.arrays['feature']
+        threshold = self.arrays['threshold']
+
+        rows = np.arange(X.shape[0])
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        active = left[node] != -1
+        while active.any():
+            idx = rows[active]
+            cur = node[idx]
+            go_left = X[idx, feature[cur]] <= threshold[cur]
+            node[idx] = np.where(go_left, left[cur], right[cur])
+            active[idx] = left[node[idx]] != -1
+        return node
+
+    def predict_proba(self, X):
+        proba = np.array(self.arrays['value'][self.apply(X)], dtype=np.float64)
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+        return proba
+
+
+class CompactGaussianNB(CompactModel):
+    """Gaussian Naive Bayes dari array theta, var, dan class_prior."""
+
+    model_type = 'gaussian_nb'
+
+    def joint_log_likelihood(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        theta = self.arrays['theta']
+        var = self.arrays['var']
+        jll = []
+        for i in range(len(self.classes_)):
+            jointi = np.log(self.arrays['class_prior'][i])
+            n_ij = -0.5 * np.sum(np.log(2.0 * np.pi * var[i, :]))
+            n_ij -= 0.5 * np.sum(((X - theta[i, :]) ** 2) / (var[i, :]), 1)
+            jll.append(jointi + n_ij)
+        return np.array(jll).T
+
+    def predict_proba(self, X):
+        jll = self.joint_log_likelihood(X)
+        # logsumexp per baris agar stabil secara numerik
+        a_max = jll.max(axis=1, keepdims=True)
+        log_prob_x = np.log(np.sum(np.exp(jll - a_max), axis=1, keepdims=True)) + a_max
+        return np.exp(jll - log_prob_x)
+
+
+class CompactKNN(CompactModel):
+    """K-Nearest Neighbors (jarak Euclidean) dengan pencarian brute-force per chunk."""
+
+    model_type = 'knn'
+
+    def kneighbors(self, X):
+        return brute_kneighbors(X, self.arrays['fit_X'], self.params['n_neighbors'])
+
+    def predict_proba(self, X):
+        dist, ind = self.kneighbors(X)
+        return neighbor_votes(dist, self.arrays['y'][ind], len(self.classes_), self.params['weights'])
+
+
+class CompactKNNIndex(CompactModel):
+    """KNN yang mencari tetangga lewat KD-tree float32 yang di-memory-map (lihat knn_index.py)."""
+
+    model_type = 'knn_kdtree'
+
+    def __init__(self, arrays, params):
+        super().__init__(arrays, params)
+        self.index = KDTreeIndex.from_arrays(arrays)
+
+    def kneighbors(self, X):
+        return self.index.kneighbors(X, self.params['n_neighbors'])
+
+    def predict_proba(self, X):
+        dist, ind = self.kneighbors(X)
+        return neighbor_votes(dist, self.index.neighbor_labels(ind), len(self.classes_), self.params['weights'])
+
+
+def neighbor_votes(dist, neigh_y, n_classes, weights):
+    """Hitung probabilitas kelas dari label tetangga, sama seperti sklearn."""
+    if weights == 'distance':
+        with np.errstate(divide='ignore'):
+            w = 1.0 / dist
+        # Jika ada tetangga berjarak 0, hanya tetangga itu yang dihitung
+        exact = np.isinf(w).any(axis=1)
+        w[exact] = np.isinf(w[exact]).astype(np.float64)
+    else:
+        w = np.ones_like(dist)
+
+    proba = np.zeros((dist.shape[0], n_classes))
+    for c in range(n_classes):
+        proba[:, c] = (w * (neigh_y == c)).sum(axis=1)
+    normalizer = proba.sum(axis=1)[:, np.newaxis]
+    normalizer[normalizer == 0.0] = 1.0
+    return proba / normalizer
+
+
+MODEL_TYPES = {cls.model_type: cls for cls in (CompactDecisionTree, CompactGaussianNB, CompactKNN, CompactKNNIndex)}
+
+
+# ==============================================================================
+# 3. EKSPOR: OBJEK SKLEARN -> ARRAY
+# ==============================================================================
+def model_to_arrays(model, knn_index=True):
+    """Ambil array dan parameter penting dari model sklearn yang sudah dilatih.
+
+    KNN disimpan sebagai KD-tree float32 ('knn_kdtree'), atau sebagai matriks
+    train float64 apa adanya ('knn') jika `knn_index=False`.
+    """
+    name = type(model).__name__
+    arrays = {'classes': np.asarray(model.classes_)}
+
+    if name == 'DecisionTreeClassifier':
+        tree = model.tree_
+        arrays.update({
+            'children_left': tree.children_left,
+            'children_right': tree.children_right,
+            'feature': tree.feature,
+            'threshold': tree.threshold,
+            'value': tree.value[:, 0, :],
+        })
+        return 'decision_tree', arrays, {'max_depth': int(tree.max_depth)}
+
+    if name == 'GaussianNB':
+        arrays.update({
+            'theta': model.theta_,
+            'var': model.var_,
+            'class_prior': model.class_prior_,
+            'class_count': model.class_count_,
+        })
+        return 'gaussian_nb', arrays, {'var_smoothing': float(model.var_smoothing), 'epsilon': float(model.epsilon_)}
+
+    if name == 'KNeighborsClassifier':
+        if model.effective_metric_ != 'euclidean':
+            raise ValueError(f"Metric KNN '{model.effective_metric_}' belum didukung, hanya 'euclidean'")
+        if callable(model.weights):
+            raise ValueError("Fungsi weights kustom pada KNN tidak bisa diekspor")
+        params = {'n_neighbors': int(model.n_neighbors), 'weights': model.weights}
+        if knn_index:
+            arrays.update(KDTreeIndex.build(model._fit_X, model._y).to_arrays())
+            return 'knn_kdtree', arrays, params
+        arrays.update({'fit_X': model._fit_X, 'y': model._y})
+        return 'knn', arrays, params
+
+    raise ValueError(f"Tipe model '{name}' belum didukung oleh format ringkas")
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def write_artifact_dir(out_dir, manifest, arrays):
+    """Tulis array + manifest sebagai versi baru, lalu aktifkan versi itu sekaligus.
+
+    Checksum dihitung dari file yang sudah tertulis di disk, jadi isi folder
+    diperiksa sekali di sini, bukan setiap kali model dimuat.
+    """
+    out_dir = os.path.abspath(out_dir)
+    versions_dir = os.path.join(out_dir, VERSIONS_DIR)
+    os.makedirs(versions_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=versions_dir)
+    try:
+        manifest = dict(manifest, arrays={})
+        for key, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            if arr.dtype == object:
+                raise ValueError(f"Array '{key}' bertipe object dan tidak bisa di-memory-map")
+            filename = f'{key}.npy'
+            np.save(os.path.join(tmp_dir, filename), arr)
+            manifest['arrays'][key] = {
+                'file': filename,
+                'dtype': arr.dtype.str,
+                'shape': list(arr.shape),
+                'sha256': sha256_file(os.path.join(tmp_dir, filename)),
+            }
+        # Versi artifact = hash dari semua checksum, berubah jika isi model berubah
+        digest = hashlib.sha256(json.dumps(manifest['arrays'], sort_keys=True).encode()).hexdigest()
+        manifest['version'] = digest[:16]
+        with open(os.path.join(tmp_dir, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        version_dir = os.path.join(versions_dir, manifest['version'])
+        if os.path.isdir(version_dir):
+            # Isi model sama persis dengan versi yang sudah ada
+            shutil.rmtree(tmp_dir)
+        else:
+            os.replace(tmp_dir, version_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _write_pointer(out_dir, manifest['version'])
+    _remove_old_versions(out_dir, manifest['version'])
+    return manifest
+
+
+def _write_pointer(out_dir, version):
+    tmp_path = os.path.join(out_dir, f'.{POINTER_NAME}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(version + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(out_dir, POINTER_NAME))
+
+
+def _remove_old_versions(out_dir, current):
+    versions_dir = os.path.join(out_dir, VERSIONS_DIR)
+    old = [entry for entry in os.scandir(versions_dir)
+           if entry.is_dir() and not entry.name.startswith('.') and entry.name != current]
+    old.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in old[KEEP_VERSIONS - 1:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    # Folder format lama (manifest + .npy langsung di out_dir) sudah tidak dibaca lagi
+    legacy_manifest = os.path.join(out_dir, MANIFEST_NAME)
+    if os.path.exists(legacy_manifest):
+        with open(legacy_manifest) as f:
+            legacy_files = [meta['file'] for meta in json.load(f).get('arrays', {}).values()]
+        for filename in legacy_files:
+            path = os.path.join(out_dir, filename)
+            if os.path.exists(path):
+                os.remove(path)
+        os.remove(legacy_manifest)
+
+
+def export_artifact(artifact, out_dir=DEFAULT_ARTIFACT_DIR, knn_index=True):
+    """Simpan dict artifact (isi diabetes_model.pkl) ke format ringkas."""
+    model_type, model_arrays, params = model_to_arrays(artifact['model'], knn_index=knn_index)
+
+    arrays = {
+        'scaler_mean': artifact['scaler'].mean_,
+        'scaler_scale': artifact['scaler'].scale_,
+    }
+    arrays.update({f'model_{key}': value for key, value in model_arrays.items()})
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'model_type': model_type,
+        'model_name': artifact['model_name'],
+        'accuracy': float(artifact['accuracy']),
+        'feature_names': list(artifact['feature_names']),
+        'encoders': {col: [str(c) for c in artifact[key].classes_] for col, key in ENCODER_KEYS.items()},
+        'params': params,
+        'history': [{k: (float(v) if isinstance(v, (float, np.floating)) else v) for k, v in row.items()}
+                    for row in artifact.get('history', [])],
+        'updates': artifact.get('updates', []),
+    }
+    return write_artifact_dir(out_dir, manifest, arrays)
+
+
+# ==============================================================================
+# 4. LOAD: FOLDER -> DICT ARTIFACT (BENTUKNYA SAMA DENGAN ISI FILE PKL)
+# ==============================================================================
+def current_version(path=DEFAULT_ARTIFACT_DIR):
+    """Versi yang sedang aktif menurut file CURRENT, None untuk folder format lama."""
+    try:
+        with open(os.path.join(path, POINTER_NAME)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def resolve_artifact_dir(path=DEFAULT_ARTIFACT_DIR):
+    """Folder berisi manifest.json untuk versi yang sedang aktif."""
+    version = current_version(path)
+    if version is None:
+        # Folder format lama: manifest langsung di dalam folder
+        return path
+    return os.path.join(path, VERSIONS_DIR, version)
+
+
+def read_manifest(path=DEFAULT_ARTIFACT_DIR):
+    with open(os.path.join(resolve_artifact_dir(path), MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Versi format artifact {manifest.get('format_version')} tidak didukung "
+                         f"(diharapkan {FORMAT_VERSION})")
+    return manifest
+
+
+def load_arrays(path, manifest, verify=False, mmap_mode='r'):
+    """Buka semua array dari folder versi.
+
+    Checksum sudah diperiksa saat artifact ditulis; `verify=True` menghitung
+    ulang sha256 semua file (lambat untuk model besar, untuk pengecekan manual).
+    """
+    arrays = {}
+    for key, meta in manifest['arrays'].items():
+        file_path = os.path.join(path, meta['file'])
+        if verify and sha256_file(file_path) != meta['sha256']:
+            raise ValueError(f"Checksum file '{meta['file']}' tidak cocok, artifact rusak")
+        arrays[key] = np.load(file_path, mmap_mode=mmap_mode, allow_pickle=False)
+        if list(arrays[key].shape) != meta['shape'] or arrays[key].dtype.str != meta['dtype']:
+            raise ValueError(f"Isi file '{meta['file']}' tidak sesuai manifest, artifact rusak")
+    return arrays
+
+
+def load_compact_artifact(path=DEFAULT_ARTIFACT_DIR, verify=False):
+    """Muat artifact format ringkas tanpa sklearn.
+
+    Hasilnya dict dengan kunci yang sama seperti isi 'diabetes_model.pkl'
+    ('model', 'scaler', 'encoder_gender', ...), jadi kode aplikasi tidak perlu
+    dibedakan. Array dibuka dengan memory-map (read-only).
+    """
+    # Folder versi dipilih sekali: jika CURRENT berganti di tengah jalan,
+    # manifest dan array tetap berasal dari versi yang sama
+    path = resolve_artifact_dir(path)
+    manifest = read_manifest(path)
+    arrays = load_arrays(path, manifest, verify=verify)
+
+    model_arrays = {key[len('model_'):]: arr for key, arr in arrays.items() if key.startswith('model_')}
+    model = MODEL_TYPES[manifest['model_type']](model_arrays, manifest['params'])
+
+    artifact = {
+        'model': model,
+        'scaler': CompactScaler(arrays['scaler_mean'], arrays['scaler_scale']),
+        'model_name': manifest['model_name'],
+        'accuracy': manifest['accuracy'],
+        'feature_names': manifest['feature_names'],
+        'history': manifest['history'],
+        'updates': manifest.get('updates', []),
+        'version': manifest['version'],
+        'path': os.path.abspath(path),
+    }
+    for col, key in ENCODER_KEYS.items():
+        artifact[key] = CompactLabelEncoder(manifest['encoders'][col])
+    return artifact
+
+
+def default_artifact_path():
+    return DEFAULT_ARTIFACT_DIR if os.path.isdir(DEFAULT_ARTIFACT_DIR) else DEFAULT_PICKLE_PATH
+
+
+# Versi file pkl per path: (ukuran, waktu modifikasi) -> hash isi
+_pickle_versions = {}
+
+
+def artifact_version(path=None):
+    """Penanda versi artifact yang murah dicek (tanpa memuat model).
+
+    Sama untuk kedua format: potongan sha256 dari isi model. Folder ringkas:
+    isi file CURRENT. File pkl: hash isi file, dihitung ulang hanya jika
+    ukuran atau waktu modifikasinya berubah.
+    """
+    path = path or default_artifact_path()
+    if os.path.isdir(path):
+        return current_version(path) or read_manifest(path)['version']
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _pickle_versions.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, sha256_file(path)[:16])
+        _pickle_versions[path] = cached
+    return cached[1]
+
+
+def load_artifact(path=None):
+    """Muat model: utamakan folder format ringkas, jika tidak ada pakai file pkl.
+
+    Untuk Decision Tree, artifact juga diberi 'kernel' (lihat tree_kernel.py)
+    yang dipakai prediction.predict_proba_batch sebagai jalur cepat, dan
+    'explainer' (lihat explain.py) untuk kontribusi setiap fitur.
+    """
+    if path is None:
+        path = default_artifact_path()
+    if os.path.isdir(path):
+        artifact = load_compact_artifact(path)
+    else:
+        with open(path, 'rb') as f:
+            data = f.read()
+        artifact = pickle.loads(data)
+        # Versi dihitung dari byte yang sama dengan yang dimuat (lihat artifact_version)
+        artifact['version'] = hashlib.sha256(data).hexdigest()[:16]
+    artifact['kernel'] = build_kernel(artifact)
+    artifact['explainer'] = build_explainer(artifact)
+    return artifact
+
+
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PICKLE_PATH
+    dst = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_ARTIFACT_DIR
+    with open(src, 'rb') as f:
+        manifest = export_artifact(pickle.load(f), dst)
+    print(f"✅ Artifact '{src}' diekspor ke '{dst}' (versi {manifest['version']}, model {manifest['model_type']})")
@@ -0,0 +1,344 @@
+# ==============================================================================
+# BENCHMARK JALUR LOAD, PREPROCESSING & PREDIKSI
+# ==============================================================================
+# Mengukur waktu dan memori bagian-bagian yang dipakai aplikasi, tanpa browser
+# dan tanpa server Streamlit:
+#   - parse dataset: pd.read_csv vs cache Parquet (dingin & hangat) + memori puncak,
+#   - load artifact: dingin (proses Python baru) & hangat, format pkl & ringkas,
+#   - preprocessing: encode_features + scaler.transform,
+#   - prediksi: latency & throughput untuk 1, 100, 10 ribu dan 1 juta baris,
+#     untuk setiap model di MODEL_PARAMS (train.py) + memori puncak.
+# Semua data dibuat sintetis dengan skema yang sama seperti diabetes_dataset.csv,
+# jadi benchmark bisa dijalankan walaupun dataset asli tidak ada.
+#
+# Hasil ditambahkan ke benchmarks/history.jsonl dan dibandingkan dengan
+# benchmarks/baseline.json (jika ada). Metrik yang lebih lambat dari
+# baseline melebihi toleransi ditandai sebagai regresi.
+#
+# Cara pakai:
+#   python benchmark.py                    # jalankan + bandingkan dengan baseline
+#   python benchmark.py --quick            # versi cepat (maks. 10 ribu baris)
+#   python benchmark.py --save-baseline    # jadikan hasil ini baseline baru
+#   python benchmark.py --check            # exit code 1 jika ada regresi (untuk CI)
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+HISTORY_PATH = os.path.join('benchmarks', 'history.jsonl')
+BASELINE_PATH = os.path.join('benchmarks', 'baseline.json')
+
+PREDICT_SIZES = [1, 100, 10_000, 1_000_000]
+QUICK_PREDICT_SIZES = [1, 100, 10_000]
+DATASET_ROWS = 100_000
+QUICK_DATASET_ROWS = 20_000
+TRAIN_ROWS = 20_000
+# KNN menghitung jarak ke data train untuk setiap baris, 1 juta baris terlalu lama
+MAX_PREDICT_ROWS = {'K-Nearest Neighbors': 10_000}
+
+# Setiap pengukuran diulang sampai minimal MIN_REPEATS kali atau TIME_BUDGET detik
+MIN_REPEATS = 3
+TIME_BUDGET = 1.0
+# Regresi jika metrik lebih buruk dari baseline lebih dari 25%
+DEFAULT_TOLERANCE = 1.25
+
+
+# ==============================================================================
+# 1. DATA SINTETIS (SKEMA SAMA DENGAN diabetes_dataset.csv)
+# ==============================================================================
+def make_synthetic_dataset(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 90, n_rows),
+        'gender': rng.choice(['Female', 'Male', 'Other'], n_rows, p=[0.49, 0.49, 0.02]),
+        'ethnicity': rng.choice(['White', 'Asian', 'Black', 'Hispanic', 'Other'], n_rows),
+        'education_level': rng.choice(['Highschool', 'Graduate', 'Postgraduate', 'No formal'], n_rows),
+        'income_level': rng.choice(['Low', 'Lower-Middle', 'Middle', 'Upper-Middle', 'High'], n_rows),
+        'employment_status': rng.choice(['Employed', 'Unemployed', 'Retired', 'Student'], n_rows),
+        'smoking_status': rng.choice(['Never', 'Former', 'Current'], n_rows),
+        'alcohol_consumption_per_week': rng.integers(0, 10, n_rows),
+        'physical_activity_minutes_per_week': rng.integers(0, 600, n_rows),
+        'diet_score': rng.normal(6, 1.5, n_rows).round(1),
+        'sleep_hours_per_day': rng.normal(7, 1, n_rows).round(1),
+        'screen_time_hours_per_day': rng.normal(6, 2, n_rows).round(1),
+        'family_history_diabetes': rng.integers(0, 2, n_rows),
+        'hypertension_history': rng.integers(0, 2, n_rows),
+        'cardiovascular_history': rng.integers(0, 2, n_rows),
+        'bmi': rng.normal(25.6, 3.6, n_rows).round(1),
+        'waist_to_hip_ratio': rng.normal(0.86, 0.05, n_rows).round(2),
+        'systolic_bp': rng.integers(90, 180, n_rows),
+        'diastolic_bp': rng.integers(60, 110, n_rows),
+        'heart_rate': rng.integers(50, 100, n_rows),
+        'cholesterol_total': rng.integers(100, 300, n_rows),
+        'hdl_cholesterol': rng.integers(30, 90, n_rows),
+        'ldl_cholesterol': rng.integers(50, 200, n_rows),
+        'triglycerides': rng.integers(50, 300, n_rows),
+        'glucose_fasting': rng.integers(70, 180, n_rows),
+        'glucose_postprandial': rng.integers(90, 280, n_rows),
+        'insulin_level': rng.normal(9, 4, n_rows).round(2),
+        'hba1c': rng.normal(6.5, 0.8, n_rows).round(2),
+        'diabetes_risk_score': rng.normal(30, 9, n_rows).round(1),
+        'diabetes_stage': rng.choice(['No Diabetes', 'Pre-Diabetes', 'Type 2'], n_rows),
+    })
+    # Target bergantung pada gula darah & umur, agar model punya pola untuk dipelajari
+    noise = rng.normal(0, 1, n_rows)
+    df['diagnosed_diabetes'] = ((df['glucose_fasting'] - 110) / 14 + (df['age'] - 50) / 16 + noise > 0).astype(int)
+    return df
+
+
+# ==============================================================================
+# 2. ALAT UKUR
+# ==============================================================================
+def measure(fn, min_repeats=MIN_REPEATS, budget=TIME_BUDGET):
+    """Jalankan fn berulang kali, kembalikan median waktu (detik)."""
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_repeats or time.perf_counter() - start < budget:
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def peak_memory_mb(fn):
+    """Memori puncak (MB) yang dialokasikan selama fn berjalan."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+
+def cold_load_ms(path):
+    """Waktu import + load_artifact di proses Python baru (ms)."""
+    code = ("import time; t = time.perf_counter(); from artifact_io import load_artifact; "
+            f"load_artifact({path!r}); print((time.perf_counter() - t) * 1000)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"Gagal load artifact '{path}': {result.stderr.strip().splitlines()[-1]}")
+    return float(result.stdout.strip())
+
+
+# ==============================================================================
+# 3. BENCHMARK
+# ==============================================================================
+def bench_dataset(work_dir, n_rows):
+    from dataset_cache import load_dataset
+
+    csv_path = os.path.join(work_dir, 'diabetes_dataset.csv')
+    make_synthetic_dataset(n_rows).to_csv(csv_path, index=False)
+    cache_dir = os.path.join(work_dir, 'cache')
+
+    start = time.perf_counter()
+    load_dataset(csv_path, cache_dir)  # cache belum ada: parse CSV + tulis Parquet
+    cold = time.perf_counter() - start
+    return {
+        'dataset/read_csv_ms': measure(lambda: pd.read_csv(csv_path)) * 1000,
+        'dataset/read_csv_peak_mb': peak_memory_mb(lambda: pd.read_csv(csv_path)),
+        'dataset/cache_cold_ms': cold * 1000,
+        'dataset/cache_warm_ms': measure(lambda: load_dataset(csv_path, cache_dir)) * 1000,
+        'dataset/cache_warm_peak_mb': peak_memory_mb(lambda: load_dataset(csv_path, cache_dir)),
+    }
+
+
+def train_artifacts(work_dir, n_rows):
+    """Latih setiap model (parameter default) di data sintetis, simpan pkl + format ringkas."""
+    import pickle
+
+    from sklearn.base import clone
+
+    from artifact_io import export_artifact
+    from train import FEATURES, MODEL_PARAMS, prepare_data
+
+    data = prepare_data(make_synthetic_dataset(n_rows, seed=1))
+    paths = {}
+    for i, (name, config) in enumerate(MODEL_PARAMS.items()):
+        model = clone(config['model']).fit(data['X_train'], data['y_train'])
+        artifact = {
+            'model': model,
+            'scaler': data['scaler'],
+            'encoder_gender': data['encoder_gender'],
+            'encoder_smoking': data['encoder_smoking'],
+            'model_name': name,
+            'accuracy': float(model.score(data['X_test'], data['y_test'])),
+            'feature_names': FEATURES,
+            'history': [],
+        }
+        pkl_path = os.path.join(work_dir, f'model_{i}.pkl')
+        with open(pkl_path, 'wb') as f:
+            pickle.dump(artifact, f)
+        compact_path = os.path.join(work_dir, f'model_{i}')
+        export_artifact(artifact, compact_path)
+        paths[name] = {'pkl': pkl_path, 'compact': compact_path}
+    return paths
+
+
+def bench_model(name, paths, sizes):
+    from artifact_io import load_artifact
+    from prediction import encode_features, predict_proba_batch
+
+    metrics = {}
+    df = make_synthetic_dataset(max(sizes), seed=2)
+    for fmt, path in paths.items():
+        prefix = f'{name}/{fmt}'
+        metrics[f'{prefix}/load_cold_ms'] = cold_load_ms(path)
+        metrics[f'{prefix}/load_warm_ms'] = measure(lambda: load_artifact(path)) * 1000
+        artifact = load_artifact(path)
+
+        for size in sizes:
+            if size > MAX_PREDICT_ROWS.get(name, size):
+                continue
+            batch = df.iloc[:size]
+            X = encode_features(batch, artifact)
+            metrics[f'{prefix}/encode_{size}_ms'] = measure(lambda: encode_features(batch, artifact)) * 1000
+            metrics[f'{prefix}/scale_{size}_ms'] = measure(lambda: artifact['scaler'].transform(X)) * 1000
+            seconds = measure(lambda: predict_proba_batch(X, artifact))
+            metrics[f'{prefix}/predict_{size}_ms'] = seconds * 1000
+            metrics[f'{prefix}/predict_{size}_rows_per_s'] = size / seconds
+        largest = min(max(sizes), MAX_PREDICT_ROWS.get(name, max(sizes)))
+        X = encode_features(df.iloc[:largest], artifact)
+        metrics[f'{prefix}/predict_{largest}_peak_mb'] = peak_memory_mb(lambda: predict_proba_batch(X, artifact))
+    return metrics
+
+
+def run_benchmarks(sizes=PREDICT_SIZES, dataset_rows=DATASET_ROWS, train_rows=TRAIN_ROWS, log=print):
+    metrics = {}
+    with tempfile.TemporaryDirectory(prefix='diabetes-bench-') as work_dir:
+        log(f"Dataset sintetis {dataset_rows:,} baris...")
+        metrics.update(bench_dataset(work_dir, dataset_rows))
+        log(f"Melatih model di {train_rows:,} baris sintetis...")
+        for name, paths in train_artifacts(work_dir, train_rows).items():
+            log(f"Benchmark {name}...")
+            metrics.update(bench_model(name, paths, sizes))
+    return metrics
+
+
+def environment():
+    import sklearn
+
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# ==============================================================================
+# 4. RIWAYAT & PERBANDINGAN DENGAN BASELINE
+# ==============================================================================
+def higher_is_better(metric):
+    return metric.endswith('_rows_per_s')
+
+
+def compare(metrics, baseline_metrics, tolerance=DEFAULT_TOLERANCE):
+    """List (metrik, baseline, sekarang, rasio, regresi?). Rasio > 1 = lebih buruk."""
+    rows = []
+    for metric, value in metrics.items():
+        base = baseline_metrics.get(metric)
+        if not base or not value:
+            continue
+        ratio = base / value if higher_is_better(metric) else value / base
+        rows.append((metric, base, value, ratio, ratio > tolerance))
+    return rows
+
+
+def append_history(record, path=HISTORY_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(record, path=BASELINE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def print_metrics(metrics):
+    print(f"{'Metrik':<55} | {'Nilai':>14}")
+    print("-" * 72)
+    for metric, value in metrics.items():
+        print(f"{metric:<55} | {value:>14,.2f}")
+
+
+def print_comparison(rows):
+    print(f"{'Metrik':<55} | {'Baseline':>12} | {'Sekarang':>12} | {'Rasio':>6}")
+    print("-" * 95)
+    for metric, base, value, ratio, regressed in rows:
+        flag = '  <-- REGRESI' if regressed else ''
+        print(f"{metric:<55} | {base:>12,.2f} | {value:>12,.2f} | {ratio:>6.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark load, preprocessing & prediksi")
+    parser.add_argument('--quick', action='store_true', help="Maks. 10 ribu baris, dataset lebih kecil")
+    parser.add_argument('--sizes', type=int, nargs='+', help="Jumlah baris prediksi yang diukur")
+    parser.add_argument('--dataset-rows', type=int, help="Jumlah baris dataset sintetis")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Rasio terhadap baseline yang dianggap regresi (default 1.25)")
+    parser.add_argument('--history', default=HISTORY_PATH)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="Simpan hasil ini sebagai baseline")
+    parser.add_argument('--check', action='store_true', help="Exit code 1 jika ada regresi")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_PREDICT_SIZES if args.quick else PREDICT_SIZES)
+    dataset_rows = args.dataset_rows or (QUICK_DATASET_ROWS if args.quick else DATASET_ROWS)
+
+    metrics = run_benchmarks(sizes, dataset_rows)
+    record = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment(),
+        'config': {'sizes': sizes, 'dataset_rows': dataset_rows, 'train_rows': TRAIN_ROWS},
+        'metrics': metrics,
+    }
+    append_history(record, args.history)
+    print()
+    print_metrics(metrics)
+
+    regressions = []
+    baseline = load_baseline(args.baseline)
+    if baseline:
+        print(f"\nDibandingkan dengan baseline {baseline['timestamp']}:")
+        if baseline['environment'] != record['environment']:
+            print(f"⚠️ Lingkungan berbeda dari baseline: {baseline['environment']}")
+        if baseline['config'] != record['config']:
+            print(f"⚠️ Konfigurasi berbeda dari baseline: {baseline['config']}")
+        rows = compare(metrics, baseline['metrics'], args.tolerance)
+        print_comparison(rows)
+        regressions = [row[0] for row in rows if row[4]]
+        print(f"\n{len(regressions)} regresi (toleransi {args.tolerance:.2f}x)")
+    if args.save_baseline or not baseline:
+        save_baseline(record, args.baseline)
+        print(f"✅ Baseline disimpan di '{args.baseline}'")
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
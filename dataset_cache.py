@@ -0,0 +1,159 @@
+# ==============================================================================
+# CACHE DATASET KOLOMNAR (PARQUET)
+# ==============================================================================
+# Membaca 'diabetes_dataset.csv' dengan pd.read_csv itu lambat (teks harus
+# di-parse ulang setiap kali) dan boros memori: semua angka jadi int64/float64
+# dan semua teks jadi object.
+#
+# Modul ini mengubah CSV SEKALI menjadi file Parquet dengan tipe data yang
+# lebih hemat:
+#   - kolom bilangan bulat diperkecil (int64 -> int8/int16/...),
+#   - kolom desimal jadi float32 HANYA jika nilainya tidak berubah (agar hasil
+#     training tetap sama persis dengan membaca CSV),
+#   - kolom teks (gender, smoking_status, ethnicity, ...) jadi category.
+# Cache otomatis dibuat ulang jika isi CSV berubah (dicek dengan hash SHA-256).
+#
+# Cara pakai:
+#   from dataset_cache import load_dataset
+#   df = load_dataset('diabetes_dataset.csv')
+#
+#   python dataset_cache.py diabetes_dataset.csv   # buat cache + bandingkan waktu & memori
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CSV_PATH = 'diabetes_dataset.csv'
+DEFAULT_CACHE_DIR = '.cache'
+CACHE_VERSION = 1
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_paths(csv_path, cache_dir=DEFAULT_CACHE_DIR):
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return (os.path.join(cache_dir, f'{name}.parquet'),
+            os.path.join(cache_dir, f'{name}.meta.json'))
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('cache_version') == CACHE_VERSION else None
+
+
+def _write_meta(meta_path, meta):
+    tmp_meta = f'{meta_path}.{os.getpid()}.tmp'
+    with open(tmp_meta, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_meta, meta_path)
+
+
+def dataset_hash(csv_path=DEFAULT_CSV_PATH, cache_dir=DEFAULT_CACHE_DIR):
+    """Hash SHA-256 isi CSV.
+
+    Hash yang tersimpan di cache dipakai ulang selama ukuran dan waktu
+    modifikasi file belum berubah, jadi CSV tidak perlu dibaca ulang.
+    """
+    stat = os.stat(csv_path)
+    meta = _read_meta(cache_paths(csv_path, cache_dir)[1])
+    if meta and meta['csv_size'] == stat.st_size and meta['csv_mtime_ns'] == stat.st_mtime_ns:
+        return meta['csv_sha256']
+    return file_sha256(csv_path)
+
+
+def optimize_dtypes(df):
+    """Kecilkan tipe data setiap kolom tanpa mengubah nilainya."""
+    df = df.copy()
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            as_float32 = series.astype(np.float32)
+            # Hanya jika kembali ke float64 nilainya persis sama
+            if np.array_equal(as_float32.astype(np.float64).to_numpy(), series.to_numpy(), equal_nan=True):
+                df[col] = as_float32
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            # Kategori diurutkan alfabetis, sama seperti urutan LabelEncoder
+            df[col] = series.astype('category')
+    return df
+
+
+def build_cache(csv_path=DEFAULT_CSV_PATH, cache_dir=DEFAULT_CACHE_DIR, csv_sha256=None):
+    """Parse CSV sekali dan simpan sebagai Parquet + metadata."""
+    parquet_path, meta_path = cache_paths(csv_path, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    stat = os.stat(csv_path)
+    df = optimize_dtypes(pd.read_csv(csv_path))
+
+    # Tulis ke file sementara dulu agar proses lain tidak membaca file setengah jadi
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+
+    meta = {
+        'cache_version': CACHE_VERSION,
+        'csv_path': os.path.abspath(csv_path),
+        'csv_sha256': csv_sha256 or file_sha256(csv_path),
+        'csv_size': stat.st_size,
+        'csv_mtime_ns': stat.st_mtime_ns,
+        'rows': len(df),
+        'dtypes': {col: str(dtype) for col, dtype in df.dtypes.items()},
+    }
+    _write_meta(meta_path, meta)
+    return df
+
+
+def load_dataset(csv_path=DEFAULT_CSV_PATH, cache_dir=DEFAULT_CACHE_DIR):
+    """Baca dataset dari cache Parquet; buat/perbarui cache jika CSV berubah.
+
+    Melempar FileNotFoundError jika file CSV tidak ada.
+    """
+    parquet_path, meta_path = cache_paths(csv_path, cache_dir)
+    current_hash = dataset_hash(csv_path, cache_dir)
+    meta = _read_meta(meta_path)
+    if meta and meta['csv_sha256'] == current_hash and os.path.exists(parquet_path):
+        stat = os.stat(csv_path)
+        if meta['csv_mtime_ns'] != stat.st_mtime_ns:
+            # Isi sama tapi file di-touch ulang: perbarui metadata saja
+            meta.update(csv_size=stat.st_size, csv_mtime_ns=stat.st_mtime_ns)
+            _write_meta(meta_path, meta)
+        return pd.read_parquet(parquet_path)
+    return build_cache(csv_path, cache_dir, csv_sha256=current_hash)
+
+
+def memory_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_PATH
+
+    start = time.perf_counter()
+    df_csv = pd.read_csv(csv_path)
+    t_csv = time.perf_counter() - start
+
+    load_dataset(csv_path)  # pastikan cache sudah ada
+    start = time.perf_counter()
+    df_cache = load_dataset(csv_path)
+    t_cache = time.perf_counter() - start
+
+    print(f"{'Sumber':<10} | {'Waktu baca':>12} | {'Memori':>10}")
+    print("-" * 40)
+    print(f"{'CSV':<10} | {t_csv * 1000:>9.1f} ms | {memory_mb(df_csv):>7.1f} MB")
+    print(f"{'Parquet':<10} | {t_cache * 1000:>9.1f} ms | {memory_mb(df_cache):>7.1f} MB")
@@ -0,0 +1,154 @@
+# ==============================================================================
+# CACHE STATISTIK & GRAFIK EDA
+# ==============================================================================
+# Halaman "Dataset" dan "Exploratory Data Analysis" dulu menghitung
+# df.describe() dan menggambar ulang grafik (termasuk scatterplot SEMUA baris)
+# setiap kali halaman dibuka. Di dataset besar, scatter itu saja butuh
+# beberapa detik, dan objek figure matplotlib tidak pernah ditutup.
+#
+# Modul ini menghitung semuanya SEKALI per versi dataset (hash CSV dari
+# dataset_cache.py) dan menyimpannya di disk:
+#   .cache/eda/v<versi>-<hash>/describe.parquet, head.parquet, target_count.png,
+#   age_vs_glucose.png, meta.json
+# Scatterplot digambar dari sampel terstratifikasi (per kelas target), bukan
+# semua baris. Grafik dibuat dengan matplotlib.figure.Figure (bukan pyplot),
+# jadi tidak ada figure yang tertinggal di memori.
+import io
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from dataset_cache import DEFAULT_CACHE_DIR, DEFAULT_CSV_PATH, dataset_hash, load_dataset
+
+EDA_CACHE_VERSION = 1
+TARGET = 'diagnosed_diabetes'
+# Jumlah titik maksimal per kelas pada scatterplot
+SCATTER_SAMPLE_PER_CLASS = 2500
+HEAD_ROWS = 10
+
+
+def eda_cache_dir(version, cache_dir=DEFAULT_CACHE_DIR):
+    return os.path.join(cache_dir, 'eda', f'v{EDA_CACHE_VERSION}-{version}')
+
+
+def stratified_sample(df, column, n_per_class, random_state=42):
+    """Ambil paling banyak n baris dari setiap nilai `column`."""
+    rng = np.random.default_rng(random_state)
+    parts = [rng.choice(idx, min(len(idx), n_per_class), replace=False)
+             for idx in df.groupby(column, observed=True).indices.values()]
+    return df.iloc[np.sort(np.concatenate(parts))]
+
+
+def _figure_png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', dpi=100)
+    return buf.getvalue()
+
+
+def plot_target_count(df):
+    """Diagram batang jumlah orang sehat vs diabetes (dari hitungan, bukan per baris)."""
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    counts = df[TARGET].value_counts().sort_index()
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    ax.bar(['Sehat (0)', 'Diabetes (1)'], counts.reindex([0, 1], fill_value=0).values,
+           color=sns.color_palette('pastel', 2))
+    ax.set_xlabel(TARGET)
+    ax.set_ylabel('count')
+    return _figure_png(fig)
+
+
+def plot_age_vs_glucose(df, n_per_class=SCATTER_SAMPLE_PER_CLASS):
+    """Scatterplot umur vs gula darah dari sampel terstratifikasi."""
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    sample = stratified_sample(df[['age', 'glucose_fasting', TARGET]], TARGET, n_per_class)
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    sns.scatterplot(x='age', y='glucose_fasting', hue=TARGET, data=sample, palette='coolwarm', ax=ax, s=12)
+    ax.set_title(f'Sampel {len(sample):,} dari {len(df):,} pasien', fontsize=9)
+    return _figure_png(fig)
+
+
+def compute_eda(df):
+    """Hitung semua statistik dan grafik untuk halaman Dataset & EDA."""
+    return {
+        'rows': int(df.shape[0]),
+        'cols': int(df.shape[1]),
+        'describe': df.describe(),
+        'head': df.head(HEAD_ROWS),
+        'figures': {
+            'target_count': plot_target_count(df),
+            'age_vs_glucose': plot_age_vs_glucose(df),
+        },
+    }
+
+
+def save_eda(summary, path):
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=parent)
+    try:
+        summary['describe'].to_parquet(os.path.join(tmp_dir, 'describe.parquet'))
+        summary['head'].to_parquet(os.path.join(tmp_dir, 'head.parquet'))
+        for name, png in summary['figures'].items():
+            with open(os.path.join(tmp_dir, f'{name}.png'), 'wb') as f:
+                f.write(png)
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump({'rows': summary['rows'], 'cols': summary['cols'],
+                       'figures': sorted(summary['figures'])}, f)
+        # Proses lain mungkin sudah selesai lebih dulu; hasilnya sama saja
+        try:
+            os.replace(tmp_dir, path)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def read_eda(path):
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    figures = {}
+    for name in meta['figures']:
+        with open(os.path.join(path, f'{name}.png'), 'rb') as f:
+            figures[name] = f.read()
+    return {
+        'rows': meta['rows'],
+        'cols': meta['cols'],
+        'describe': pd.read_parquet(os.path.join(path, 'describe.parquet')),
+        'head': pd.read_parquet(os.path.join(path, 'head.parquet')),
+        'figures': figures,
+    }
+
+
+def load_eda(csv_path=DEFAULT_CSV_PATH, cache_dir=DEFAULT_CACHE_DIR, version=None):
+    """Ambil statistik & grafik EDA dari cache; hitung dulu jika belum ada.
+
+    Dataset lengkap hanya dibaca jika cache untuk versi ini belum ada.
+    """
+    version = version or dataset_hash(csv_path, cache_dir)
+    path = eda_cache_dir(version, cache_dir)
+    if os.path.exists(os.path.join(path, 'meta.json')):
+        return read_eda(path)
+    summary = compute_eda(load_dataset(csv_path, cache_dir))
+    save_eda(summary, path)
+    prune_old_versions(path)
+    return summary
+
+
+def prune_old_versions(keep_path):
+    """Hapus cache EDA dari versi dataset sebelumnya."""
+    parent = os.path.dirname(keep_path)
+    for name in os.listdir(parent):
+        full = os.path.join(parent, name)
+        if full != keep_path and name.startswith('v') and os.path.isdir(full):
+            shutil.rmtree(full, ignore_errors=True)
@@ -0,0 +1,215 @@
+# ==============================================================================
+# EVALUASI REPEATED CROSS-VALIDATION (PARALEL + MEMORY-MAP)
+# ==============================================================================
+# Sel evaluasi di notebook menilai setiap model baseline & tuned hanya pada
+# SATU test split, satu per satu. Angka akurasi dari satu split bisa naik-turun
+# cukup jauh, jadi selisih kecil antar model belum tentu berarti.
+#
+# Di sini setiap kandidat (baseline & tuned setiap model) dinilai dengan
+# repeated stratified k-fold (default 5 fold x 3 ulangan) pada data train,
+# semua fold dari semua kandidat dijalankan paralel di process pool.
+#   - Matriks fitur ditulis SEKALI ke file .npy sementara dan dibuka worker
+#     dengan memory-map: semua worker membaca halaman memori yang sama,
+#     tidak ada salinan X per worker seperti GridSearchCV(n_jobs=-1).
+#   - Worker hanya menerima (kandidat, nomor split); indeks fold dihitung
+#     sendiri oleh worker dari y dan seed yang sama.
+#   - Hasilnya: rata-rata & interval kepercayaan 95% untuk akurasi, precision
+#     dan recall, plus confusion matrix per kandidat (dijumlah dari semua fold
+#     & ulangan, jadi setiap baris dihitung sekali per ulangan).
+#
+# Interval kepercayaan memakai corrected resampled t-test (Nadeau & Bengio):
+# skor antar fold saling berkorelasi karena data train-nya tumpang tindih,
+# jadi variansnya dikoreksi dengan faktor (1/J + n_val/n_train).
+#
+# Cara pakai:
+#   python evaluate.py                    # baseline + tuned (parameter dari cache train.py)
+#   python evaluate.py --repeats 10 --jobs 8
+#   python evaluate.py --baseline-only
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_score, recall_score
+from sklearn.model_selection import RepeatedStratifiedKFold
+
+from train import DEFAULT_CSV_PATH, MODEL_PARAMS
+
+EVAL_SPLITS = 5
+EVAL_REPEATS = 3
+EVAL_SEED = 42
+CONFIDENCE = 0.95
+METRICS = ('accuracy', 'precision', 'recall')
+
+
+# ==============================================================================
+# 1. DATA BERSAMA UNTUK WORKER (FILE .NPY + MEMORY-MAP)
+# ==============================================================================
+_worker_data = {}
+
+
+def _init_worker(paths, n_splits, n_repeats, seed):
+    X = np.load(paths['X'], mmap_mode='r')
+    y = np.load(paths['y'], mmap_mode='r')
+    classes = np.unique(y)
+    cv = RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=seed)
+    _worker_data.update(X=X, y=y, classes=classes, splits=list(cv.split(np.zeros(len(y)), y)),
+                        average='binary' if len(classes) == 2 else 'macro')
+
+
+def _evaluate_split(task):
+    """Latih satu kandidat pada satu split, kembalikan skor & confusion matrix fold tersebut."""
+    estimator, params, split = task
+    X, y = _worker_data['X'], _worker_data['y']
+    train_idx, val_idx = _worker_data['splits'][split]
+    start = time.perf_counter()
+    model = clone(estimator).set_params(**params)
+    model.fit(X[train_idx], y[train_idx])
+    y_val, y_pred = y[val_idx], model.predict(X[val_idx])
+    average = _worker_data['average']
+    return {
+        'accuracy': accuracy_score(y_val, y_pred),
+        'precision': precision_score(y_val, y_pred, average=average, zero_division=0),
+        'recall': recall_score(y_val, y_pred, average=average, zero_division=0),
+        'confusion': confusion_matrix(y_val, y_pred, labels=_worker_data['classes']),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+# ==============================================================================
+# 2. INTERVAL KEPERCAYAAN
+# ==============================================================================
+def confidence_interval(scores, n_train, n_val, confidence=CONFIDENCE):
+    """(rata-rata, batas bawah, batas atas) dengan corrected resampled t-test."""
+    scores = np.asarray(scores, dtype=np.float64)
+    mean = float(scores.mean())
+    if len(scores) < 2:
+        return mean, mean, mean
+    se = np.sqrt((1 / len(scores) + n_val / n_train) * scores.var(ddof=1))
+    half = float(stats.t.ppf((1 + confidence) / 2, df=len(scores) - 1) * se)
+    return mean, mean - half, mean + half
+
+
+# ==============================================================================
+# 3. MESIN EVALUASI
+# ==============================================================================
+def candidates_from_results(results, model_params=MODEL_PARAMS):
+    """Kandidat baseline & tuned dari hasil train.run_pipeline: {(nama, tahap): (estimator, params)}."""
+    candidates = {}
+    for name, config in model_params.items():
+        candidates[(name, 'baseline')] = (config['model'], {})
+        if results is not None:
+            candidates[(name, 'tuned')] = (config['model'], results['tuned'][name]['best_params'])
+    return candidates
+
+
+def run_evaluation(X, y, candidates, n_splits=EVAL_SPLITS, n_repeats=EVAL_REPEATS, n_jobs=None,
+                   seed=EVAL_SEED, confidence=CONFIDENCE):
+    """Nilai semua kandidat dengan repeated stratified k-fold, paralel.
+
+    `candidates` = {label: (estimator, params)}. Mengembalikan dict berisi
+    'summary' {label: {metrik: {'mean', 'lower', 'upper', 'scores'}}},
+    'confusion' {label: matriks} dan 'classes'.
+    """
+    start = time.perf_counter()
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    n_total = n_splits * n_repeats
+    tasks = [(label, split) for label in candidates for split in range(n_total)]
+    payload = [(*candidates[label], split) for label, split in tasks]
+
+    with tempfile.TemporaryDirectory(prefix='diabetes-eval-') as folder:
+        paths = {'X': os.path.join(folder, 'X.npy'), 'y': os.path.join(folder, 'y.npy')}
+        np.save(paths['X'], X)
+        np.save(paths['y'], y)
+        initargs = (paths, n_splits, n_repeats, seed)
+        if n_jobs == 1:
+            _init_worker(*initargs)
+            outputs = list(map(_evaluate_split, payload))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=initargs) as pool:
+                outputs = list(pool.map(_evaluate_split, payload))
+
+    per_label = {label: [] for label in candidates}
+    for (label, _), output in zip(tasks, outputs):
+        per_label[label].append(output)
+
+    n_val = len(y) / n_splits
+    summary, confusion = {}, {}
+    for label, folds in per_label.items():
+        summary[label] = {}
+        for metric in METRICS:
+            scores = [fold[metric] for fold in folds]
+            mean, lower, upper = confidence_interval(scores, len(y) - n_val, n_val, confidence)
+            summary[label][metric] = {'mean': mean, 'lower': lower, 'upper': upper, 'scores': scores}
+        confusion[label] = np.sum([fold['confusion'] for fold in folds], axis=0)
+    return {
+        'summary': summary,
+        'confusion': confusion,
+        'classes': np.unique(y),
+        'n_splits': n_splits,
+        'n_repeats': n_repeats,
+        'confidence': confidence,
+        'seconds': time.perf_counter() - start,
+        'cpu_seconds': sum(output['seconds'] for output in outputs),
+    }
+
+
+# ==============================================================================
+# 4. LAPORAN
+# ==============================================================================
+def print_evaluation(report):
+    pct = f"{report['confidence']:.0%}"
+    print(f"Repeated stratified {report['n_splits']}-fold x {report['n_repeats']} ulangan "
+          f"(rata-rata [interval kepercayaan {pct}])\n")
+    print(f"{'Model':<20} | {'Tahap':<8} | {'Akurasi':^23} | {'Precision':^23} | {'Recall':^23}")
+    print("-" * 108)
+    for (name, stage), metrics in report['summary'].items():
+        cells = [f"{m['mean']:.2%} [{m['lower']:.2%}, {m['upper']:.2%}]" for m in metrics.values()]
+        print(f"{name:<20} | {stage:<8} | " + " | ".join(f"{cell:^23}" for cell in cells))
+    print(f"\nWaktu: {report['seconds']:.1f} detik (total kerja semua worker: {report['cpu_seconds']:.1f} detik)")
+
+
+def plot_evaluation_confusion(report):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    for (name, stage), cm in report['confusion'].items():
+        label = 'Baseline' if stage == 'baseline' else 'Tuned'
+        sns.heatmap(cm, annot=True, fmt="d", cmap="Blues",
+                    xticklabels=report['classes'], yticklabels=report['classes'])
+        plt.xlabel("Predicted")
+        plt.ylabel("Actual")
+        plt.title(f"Confusion Matrix CV ({label}) - {name}, {report['n_repeats']} ulangan")
+        plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluasi repeated cross-validation semua model (paralel)")
+    parser.add_argument('--csv', default=DEFAULT_CSV_PATH)
+    parser.add_argument('--splits', type=int, default=EVAL_SPLITS)
+    parser.add_argument('--repeats', type=int, default=EVAL_REPEATS)
+    parser.add_argument('--jobs', type=int, default=None, help="Jumlah proses (default: semua core)")
+    parser.add_argument('--baseline-only', action='store_true',
+                        help="Hanya setting default, tanpa mencari parameter terbaik dulu")
+    args = parser.parse_args(argv)
+
+    from dataset_cache import load_dataset
+    from train import prepare_data, run_pipeline
+
+    data = prepare_data(load_dataset(args.csv))
+    # Parameter terbaik dari train.py; jika sudah pernah dilatih, langsung dari cache
+    results = None if args.baseline_only else run_pipeline(data, n_jobs=args.jobs)
+    report = run_evaluation(data['X_train'], data['y_train'], candidates_from_results(results),
+                            args.splits, args.repeats, n_jobs=args.jobs)
+    print_evaluation(report)
+    for (name, stage), cm in report['confusion'].items():
+        print(f"\nConfusion matrix CV ({stage}) - {name}:\n{cm}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+# ==============================================================================
+# PENJELASAN PREDIKSI: KONTRIBUSI SETIAP FITUR
+# ==============================================================================
+# Saat hasilnya "POSITIF (Berisiko)", tenaga kesehatan ingin tahu fitur mana
+# yang paling mendorong hasil tersebut. Explainer generik (misal mencoba
+# ribuan kombinasi fitur per pasien) terlalu lambat untuk dipakai di setiap
+# prediksi, jadi kontribusi dihitung langsung dari isi model:
+#
+#   - Decision Tree: kontribusi jalur pohon. Setiap percabangan di jalur
+#     keputusan mengubah probabilitas positif dari node induk ke node anak,
+#     dan perubahan itu dihitung untuk fitur yang dipakai percabangan tersebut.
+#     Setiap jalur dari akar ke daun unik, jadi kontribusi SETIAP DAUN
+#     dihitung sekali saat model dimuat. Saat prediksi cukup cari daun
+#     (sama seperti tree_kernel.py) lalu ambil barisnya.
+#       probabilitas positif = base (probabilitas di akar) + jumlah kontribusi
+#   - Naive Bayes: suku log-likelihood per fitur, dalam satuan log-odds
+#     (kelas positif dibanding negatif). Scaler dilipat ke dalam rumus, jadi
+#     setiap suku adalah a*x^2 + b*x + c pada data mentah dengan a, b, c
+#     dihitung sekali per fitur.
+#       log-odds positif = base (log rasio prior) + jumlah kontribusi
+#   - KNN tidak punya penguraian per fitur yang murah: tidak ada penjelasan.
+#
+# Cek bahwa base + jumlah kontribusi sama dengan hasil model:
+#   python explain.py diabetes_dataset.csv
+import sys
+
+import numpy as np
+
+from app_metrics import span
+from tree_kernel import build_kernel
+
+POSITIVE_CLASS = 1
+# Jumlah fitur yang ditampilkan di halaman Prediction
+TOP_FEATURES = 5
+
+
+class TreeExplainer:
+    """Kontribusi jalur pohon (probabilitas kelas positif) dari TreeKernel."""
+
+    unit = 'probabilitas'
+
+    def __init__(self, kernel, feature_names, positive_class=POSITIVE_CLASS):
+        self.kernel = kernel
+        self.feature_names = list(feature_names)
+        positive = list(kernel.classes_).index(positive_class)
+        p = kernel.leaf_proba[:, positive]
+
+        # Induk setiap node (akar = -1); daun di TreeKernel menunjuk ke dirinya sendiri
+        n_nodes = len(p)
+        nodes = np.arange(n_nodes)
+        split = kernel.left != nodes
+        self.parent = np.full(n_nodes, -1, dtype=np.intp)
+        self.parent[kernel.left[split]] = nodes[split]
+        self.parent[kernel.right[split]] = nodes[split]
+
+        # Isi tabel level demi level: kontribusi node = kontribusi induk + perubahan
+        # probabilitas di percabangan induk (dihitung untuk fitur percabangan itu)
+        self.table = np.zeros((n_nodes, len(self.feature_names)))
+        level = nodes[:1]
+        while level.size:
+            children = np.concatenate([kernel.left[level][split[level]], kernel.right[level][split[level]]])
+            parents = self.parent[children]
+            self.table[children] = self.table[parents]
+            self.table[children, kernel.feature[parents]] += p[children] - p[parents]
+            level = children
+        self.base = float(p[0])
+
+    def leaves(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[0] == 1:
+            return [self.kernel.apply_one(X[0].tolist())]
+        return self.kernel.apply(X)
+
+    def contributions(self, X):
+        """(n_baris x n_fitur) kontribusi untuk data MENTAH (sebelum scaling)."""
+        return np.take(self.table, self.leaves(X), axis=0)
+
+    def decision_path(self, x):
+        """Aturan di jalur keputusan 1 baris: list (fitur, '<=' / '>', ambang batas mentah, nilai)."""
+        leaf = self.kernel.apply_one(list(x))
+        path = []
+        node = leaf
+        while self.parent[node] != -1:
+            parent = self.parent[node]
+            j = self.kernel.feature[parent]
+            op = '<=' if node == self.kernel.left[parent] else '>'
+            path.append((self.feature_names[j], op, float(self.kernel.threshold[parent]), float(x[j])))
+            node = parent
+        return path[::-1]
+
+
+class NaiveBayesExplainer:
+    """Suku log-likelihood per fitur (log-odds kelas positif vs negatif) untuk GaussianNB."""
+
+    unit = 'log-odds'
+
+    def __init__(self, model, scaler, feature_names, positive_class=POSITIVE_CLASS):
+        classes = list(model.classes_)
+        if len(classes) != 2:
+            raise ValueError(f"Penjelasan Naive Bayes hanya untuk 2 kelas, model ini punya {len(classes)}")
+        self.feature_names = list(feature_names)
+        pos = classes.index(positive_class)
+        neg = 1 - pos
+        theta, var, prior = _nb_arrays(model)
+
+        # Di ruang data mentah: mean kelas = mean + scale * theta, varians = scale^2 * var
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+        scale = np.asarray(scaler.scale_, dtype=np.float64)
+        mu = mean + scale * theta
+        v = scale ** 2 * var
+        # log N(x; mu_pos, v_pos) - log N(x; mu_neg, v_neg) = a*x^2 + b*x + c
+        self.a = -0.5 * (1 / v[pos] - 1 / v[neg])
+        self.b = mu[pos] / v[pos] - mu[neg] / v[neg]
+        self.c = (-0.5 * (mu[pos] ** 2 / v[pos] - mu[neg] ** 2 / v[neg])
+                  - 0.5 * np.log(v[pos] / v[neg]))
+        self.base = float(np.log(prior[pos]) - np.log(prior[neg]))
+
+    def contributions(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return (self.a * X + self.b) * X + self.c
+
+
+def _nb_arrays(model):
+    if hasattr(model, 'theta_'):
+        return model.theta_, model.var_, model.class_prior_
+    return model.arrays['theta'], model.arrays['var'], model.arrays['class_prior']
+
+
+def build_explainer(artifact):
+    """Explainer untuk model di artifact (pkl atau format ringkas), None jika tidak didukung."""
+    model = artifact['model']
+    kernel = artifact.get('kernel') or build_kernel(artifact)
+    if kernel is not None:
+        return TreeExplainer(kernel, artifact['feature_names'])
+    if type(model).__name__ == 'GaussianNB' or getattr(model, 'model_type', None) == 'gaussian_nb':
+        if len(model.classes_) == 2:
+            return NaiveBayesExplainer(model, artifact['scaler'], artifact['feature_names'])
+    return None
+
+
+def explain_batch(X, artifact, chunk_size=50_000):
+    """Probabilitas (sama dengan prediction.predict_proba_batch) + kontribusi, per chunk.
+
+    Untuk Decision Tree daun hanya dicari SEKALI: probabilitas dan kontribusi
+    diambil dari daun yang sama.
+    """
+    from prediction import predict_proba_batch
+
+    explainer = artifact['explainer']
+    X = np.asarray(X, dtype=np.float64)
+    if not isinstance(explainer, TreeExplainer):
+        return predict_proba_batch(X, artifact, chunk_size), explainer.contributions(X)
+
+    kernel = explainer.kernel
+    probs = np.empty((X.shape[0], len(kernel.classes_)))
+    contributions = np.empty(X.shape)
+    with span('model_predict', path='kernel_explain'):
+        for start in range(0, X.shape[0], chunk_size):
+            leaves = explainer.leaves(X[start:start + chunk_size])
+            probs[start:start + chunk_size] = np.take(kernel.leaf_proba, leaves, axis=0)
+            contributions[start:start + chunk_size] = np.take(explainer.table, leaves, axis=0)
+    return probs, contributions
+
+
+def explain_one(x, artifact):
+    """Penjelasan 1 pasien untuk halaman Prediction, None jika model tidak didukung."""
+    from prediction import CATEGORICAL_ENCODERS
+
+    explainer = artifact.get('explainer')
+    if explainer is None:
+        return None
+
+    def show(name, value):
+        # Kode kategori ditampilkan sebagai teks aslinya
+        if name in CATEGORICAL_ENCODERS:
+            return str(artifact[CATEGORICAL_ENCODERS[name]].classes_[int(value)])
+        return f"{value:g}"
+
+    x = np.asarray(x, dtype=np.float64)
+    contributions = explainer.contributions(x[np.newaxis, :])[0]
+    top = top_contributions(explainer, contributions, x)
+    path = explainer.decision_path(x) if isinstance(explainer, TreeExplainer) else []
+    return {
+        'unit': explainer.unit,
+        'base': explainer.base,
+        'total': explainer.base + float(contributions.sum()),
+        'top': [(name, show(name, value), c) for name, value, c in top],
+        'path': [(name, op, threshold, show(name, value)) for name, op, threshold, value in path],
+    }
+
+
+def top_contributions(explainer, contributions, x, n=TOP_FEATURES):
+    """Fitur dengan kontribusi terbesar (nilai absolut) untuk 1 baris: list (fitur, nilai fitur, kontribusi).
+
+    Fitur yang tidak berpengaruh sama sekali (kontribusi 0, misal tidak ada di jalur pohon) dilewati.
+    """
+    order = np.argsort(-np.abs(contributions), kind='stable')[:n]
+    return [(explainer.feature_names[j], float(x[j]), float(contributions[j])) for j in order if contributions[j] != 0]
+
+
+def check_additivity(artifact, X_raw, explainer=None):
+    """Selisih terbesar antara base + jumlah kontribusi dan hasil model (harus ~0)."""
+    from prediction import predict_proba_batch
+
+    explainer = explainer or build_explainer(artifact)
+    X_raw = np.asarray(X_raw, dtype=np.float64)
+    probs = predict_proba_batch(X_raw, artifact)[:, list(artifact['model'].classes_).index(POSITIVE_CLASS)]
+    total = explainer.base + explainer.contributions(X_raw).sum(axis=1)
+    if explainer.unit == 'log-odds':
+        total = 1 / (1 + np.exp(-total))
+    return float(np.abs(total - probs).max())
+
+
+if __name__ == '__main__':
+    import time
+
+    import pandas as pd
+
+    from artifact_io import load_artifact
+    from prediction import encode_features, predict_proba_batch
+
+    artifact = load_artifact(sys.argv[2] if len(sys.argv) > 2 else None)
+    explainer = build_explainer(artifact)
+    if explainer is None:
+        sys.exit(f"Model {artifact['model_name']} belum punya penjelasan per fitur")
+    df = pd.read_csv(sys.argv[1] if len(sys.argv) > 1 else 'diabetes_dataset.csv')
+    X_raw = encode_features(df, artifact)
+
+    def best_ms(fn, repeat=3):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(X_raw, artifact)
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000
+
+    predict_ms = best_ms(predict_proba_batch)
+    explain_ms = best_ms(explain_batch)
+
+    print(f"Baris dicek: {len(X_raw)}, selisih maks. base + kontribusi vs model: "
+          f"{check_additivity(artifact, X_raw, explainer):.2e}")
+    print(f"predict_proba: {predict_ms:.1f} ms, predict_proba + kontribusi: {explain_ms:.1f} ms (terbaik dari 3)")
@@ -0,0 +1,170 @@
+# ==============================================================================
+# INDEKS KD-TREE UNTUK KNN (FLOAT32, BISA DI-MEMORY-MAP)
+# ==============================================================================
+# Jika KNN menjadi model juara, setiap prediksi harus mencari tetangga di
+# antara SEMUA baris data train (~80 ribu), dan file pkl menyimpan seluruh
+# matriks train sebagai float64.
+#
+# Modul ini membangun KD-tree scikit-learn (versi float32) SEKALI saat ekspor
+# dan menyimpan isinya sebagai array biasa (lihat artifact_io.py):
+#   - titik data train (float32) dan urutan titik per daun,
+#   - data setiap node (rentang titik, daun atau bukan) dan kotak batasnya,
+#   - label kelas setiap titik.
+# Saat dimuat, KD-tree dirakit langsung di atas array yang di-memory-map
+# (tanpa menyalin dan tanpa unpickle). Pencarian tetangga menelusuri pohon
+# dari akar dan melewati node yang kotaknya lebih jauh dari tetangga ke-k
+# yang sudah ditemukan, jadi setiap query hanya menyentuh sebagian kecil data.
+#
+# Jika KD-tree tidak bisa dirakit (misal struktur internal scikit-learn
+# berubah), pencarian otomatis jatuh ke brute-force NumPy di array yang sama:
+# hasilnya tetap benar, hanya lebih lambat.
+#
+# Karena titik disimpan dalam float32, jarak bisa berbeda sangat sedikit dari
+# sklearn. Cek kecocokan prediksi dan bandingkan kecepatannya dengan
+# KNeighborsClassifier.predict_proba:
+#   python knn_index.py diabetes_dataset.csv model_knn.pkl
+import sys
+
+import numpy as np
+
+LEAF_SIZE = 64
+# Baris query per potongan untuk brute-force (agar matriks jarak tidak meledak)
+BRUTE_CHUNK_SIZE = 2048
+# Urutan angka di 'index_meta', sama dengan urutan di state KD-tree sklearn
+META_FIELDS = ('leaf_size', 'n_levels', 'n_nodes', 'n_trims', 'n_leaves', 'n_splits', 'n_calls')
+
+
+def brute_kneighbors(X, fit_X, k, chunk_size=BRUTE_CHUNK_SIZE):
+    """Jarak dan indeks k tetangga terdekat dengan menghitung jarak ke SEMUA titik, per chunk."""
+    X = np.asarray(X, dtype=np.float64)
+    fit_sq = np.einsum('ij,ij->i', fit_X, fit_X, dtype=np.float64)
+
+    dist = np.empty((X.shape[0], k))
+    ind = np.empty((X.shape[0], k), dtype=np.intp)
+    for start in range(0, X.shape[0], chunk_size):
+        chunk = X[start:start + chunk_size]
+        # ||a - b||^2 = ||a||^2 - 2 a.b + ||b||^2
+        d2 = np.einsum('ij,ij->i', chunk, chunk)[:, np.newaxis] - 2 * chunk @ fit_X.T + fit_sq
+        np.maximum(d2, 0, out=d2)
+        part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        part_d2 = np.take_along_axis(d2, part, axis=1)
+        order = np.argsort(part_d2, axis=1)
+        ind[start:start + chunk_size] = np.take_along_axis(part, order, axis=1)
+        dist[start:start + chunk_size] = np.sqrt(np.take_along_axis(part_d2, order, axis=1))
+    return dist, ind
+
+
+def _restore_tree(arrays):
+    """Rakit KD-tree sklearn dari array (tanpa salinan), None jika tidak bisa."""
+    try:
+        from sklearn.metrics import DistanceMetric
+        from sklearn.neighbors._kd_tree import KDTree32
+    except ImportError:
+        return None
+    meta = [int(value) for value in arrays['index_meta']]
+    tree = KDTree32.__new__(KDTree32)
+    try:
+        tree.__setstate__((arrays['index_data'], arrays['index_idx'], arrays['index_nodes'], arrays['index_bounds'],
+                           *meta, DistanceMetric.get_metric('euclidean', dtype=np.float32), None))
+    except (TypeError, ValueError, IndexError):
+        return None
+    return tree
+
+
+class KDTreeIndex:
+    """KD-tree float32 yang disimpan sebagai array: titik, urutan per daun, node, kotak batas, label."""
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.labels = arrays['index_labels']    # label kelas per titik (urutan asli data train)
+        self.tree = _restore_tree(arrays)
+
+    @classmethod
+    def build(cls, X, y, leaf_size=LEAF_SIZE):
+        from sklearn.neighbors._kd_tree import KDTree32
+
+        state = KDTree32(np.asarray(X, dtype=np.float32), leaf_size=leaf_size).__getstate__()
+        data, idx, nodes, bounds = state[:4]
+        return cls({
+            'index_data': data,
+            'index_idx': idx,
+            'index_nodes': nodes,
+            'index_bounds': bounds,
+            'index_meta': np.array(state[4:4 + len(META_FIELDS)], dtype=np.int64),
+            'index_labels': np.asarray(y, dtype=np.min_scalar_type(max(int(np.max(y)), 1))),
+        })
+
+    def to_arrays(self):
+        return dict(self.arrays)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        if 'index_nodes' not in arrays:
+            raise ValueError("Indeks KNN di artifact ini memakai format lama, ekspor ulang dengan "
+                             "`python artifact_io.py diabetes_model.pkl diabetes_model`")
+        return cls(arrays)
+
+    def kneighbors(self, X, k):
+        """Jarak dan indeks (urutan data train asli) k tetangga terdekat, urut dari yang terdekat."""
+        if self.tree is not None:
+            # Telusuri node terdekat lebih dulu (breadth-first): lebih cepat untuk data ini
+            dist, ind = self.tree.query(np.asarray(X, dtype=np.float32), k, breadth_first=True)
+            return dist.astype(np.float64), ind
+        return brute_kneighbors(X, self.arrays['index_data'], k)
+
+    def neighbor_labels(self, ind):
+        return self.labels[ind]
+
+
+def check_parity(artifact, X_raw, index_model):
+    """Bandingkan prediksi model KNN asli dengan model berindeks pada data mentah.
+
+    Mengembalikan (jumlah prediksi berbeda, selisih probabilitas terbesar).
+    """
+    X = artifact['scaler'].transform(np.asarray(X_raw, dtype=np.float64))
+    expected = artifact['model'].predict_proba(X)
+    actual = index_model.predict_proba(X)
+    n_diff = int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+    return n_diff, float(np.abs(expected - actual).max())
+
+
+def compare_speed(artifact, X_raw, index_model, repeat=3):
+    """Waktu terbaik (detik) KNeighborsClassifier.predict_proba vs model berindeks untuk X_raw."""
+    import time
+
+    X = artifact['scaler'].transform(np.asarray(X_raw, dtype=np.float64))
+
+    def best(fn):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(X)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    return best(artifact['model'].predict_proba), best(index_model.predict_proba)
+
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    from artifact_io import DEFAULT_PICKLE_PATH, CompactKNNIndex, load_artifact, model_to_arrays
+    from prediction import encode_features
+
+    # Butuh model sklearn asli sebagai pembanding, jadi baca dari file pkl
+    artifact = load_artifact(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PICKLE_PATH)
+    model_type, arrays, params = model_to_arrays(artifact['model'])
+    if model_type != 'knn_kdtree':
+        sys.exit(f"Model di file ini bukan KNN ({type(artifact['model']).__name__})")
+    index_model = CompactKNNIndex(arrays, params)
+    if index_model.index.tree is None:
+        print("KD-tree tidak bisa dirakit dengan versi scikit-learn ini, memakai brute-force NumPy")
+
+    df = pd.read_csv(sys.argv[1] if len(sys.argv) > 1 else 'diabetes_dataset.csv')
+    X_raw = encode_features(df, artifact)
+    n_diff, max_diff = check_parity(artifact, X_raw, index_model)
+    print(f"Baris dicek: {len(X_raw)}, prediksi berbeda: {n_diff}, selisih probabilitas maks: {max_diff:.2e}")
+
+    sklearn_s, index_s = compare_speed(artifact, X_raw, index_model)
+    print(f"KNeighborsClassifier.predict_proba: {sklearn_s:.2f} detik, indeks: {index_s:.2f} detik "
+          f"({sklearn_s / index_s:.2f}x, terbaik dari 3)")
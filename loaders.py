@@ -0,0 +1,107 @@
+# ==============================================================================
+# FUNGSI LOAD DATA & MODEL (CACHING)
+# ==============================================================================
+# Dipakai bersama oleh semua halaman di folder views/. Library berat di-import
+# di dalam fungsi, jadi halaman yang tidak butuh data/model tidak ikut
+# menanggung waktu import-nya.
+import streamlit as st
+
+from app_metrics import cache_miss, track_cache
+
+
+# @st.cache_data: Agar data hanya dibaca sekali saja saat awal, biar aplikasi cepat.
+# Tidak perlu baca ulang setiap kali kita klik tombol.
+# track_cache menghitung hit/miss; cache_miss() hanya terpanggil jika body benar-benar dijalankan.
+@track_cache('load_data')
+@st.cache_data
+def load_data():
+    cache_miss('load_data')
+    from dataset_cache import load_dataset
+    try:
+        # Membaca cache Parquet dari file CSV (dibuat ulang otomatis jika CSV berubah)
+        return load_dataset('diabetes_dataset.csv')
+    except:
+        return None
+
+
+# @st.cache_resource: Sama seperti cache_data, tapi khusus untuk objek berat seperti Model AI.
+# Versi artifact ikut jadi argumen: jika update_model.py / train.py menerbitkan
+# versi baru, rerun berikutnya otomatis memuat model baru tanpa restart.
+@track_cache('load_model_artifact')
+@st.cache_resource(max_entries=2)
+def _load_model_artifact(version):
+    cache_miss('load_model_artifact')
+    from artifact_io import load_artifact
+    # Utamakan folder 'diabetes_model' (format ringkas), jika tidak ada pakai 'diabetes_model.pkl'
+    return load_artifact()
+
+
+def load_model_artifact():
+    from artifact_io import artifact_version
+    try:
+        return _load_model_artifact(artifact_version())
+    except:
+        return None
+
+
+# Statistik & grafik EDA di-cache per versi dataset (hash CSV), lihat eda_cache.py.
+# Versi ikut jadi argumen agar cache Streamlit otomatis berganti jika CSV berubah.
+@track_cache('load_eda_summary')
+@st.cache_data
+def _load_eda_summary(version):
+    cache_miss('load_eda_summary')
+    from eda_cache import load_eda
+    return load_eda('diabetes_dataset.csv', version=version)
+
+
+def load_eda_summary():
+    from dataset_cache import dataset_hash
+    try:
+        return _load_eda_summary(dataset_hash('diabetes_dataset.csv'))
+    except:
+        return None
+
+
+# Cache hasil prediksi dipakai bersama oleh semua sesi (lihat prediction_cache.py).
+# Versi model ikut jadi argumen: setelah model diganti, cache baru dibuat dan
+# diisi ulang (warm-up) untuk model baru.
+@track_cache('load_prediction_cache')
+@st.cache_resource(max_entries=2)
+def _load_prediction_cache(version):
+    cache_miss('load_prediction_cache')
+    from prediction_cache import PredictionCache, warm_from_dataset, warm_size_from_env
+    cache = PredictionCache()
+    top_n = warm_size_from_env()
+    artifact = load_model_artifact()
+    if top_n and artifact:
+        df = load_data()
+        if df is not None:
+            try:
+                warm_from_dataset(cache, df, artifact, top_n)
+            except Exception:
+                # Warm-up hanya mempercepat; jika gagal (misal kolom dataset berubah), mulai dari cache kosong
+                cache.clear()
+    return cache
+
+
+def load_prediction_cache():
+    from artifact_io import artifact_version
+    try:
+        version = artifact_version()
+    except OSError:
+        version = None
+    try:
+        return _load_prediction_cache(version)
+    except Exception:
+        # Halaman Prediction tetap jalan tanpa cache bersama
+        from prediction_cache import PredictionCache
+        return PredictionCache()
+
+
+# Pool prediksi latar belakang dipakai bersama oleh semua sesi (lihat prediction_pool.py).
+@track_cache('load_prediction_pool')
+@st.cache_resource
+def load_prediction_pool():
+    cache_miss('load_prediction_pool')
+    from prediction_pool import pool_from_env
+    return pool_from_env()
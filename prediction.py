@@ -0,0 +1,177 @@
+# ==============================================================================
+# MODUL PREDIKSI BATCH
+# ==============================================================================
+# Modul ini dipakai oleh halaman "Batch Prediction" di diabetes-app.py.
+# Alih-alih memprediksi pasien satu per satu lewat formulir, semua baris dari
+# file CSV diproses sekaligus (vectorized) dalam potongan (chunk) agar memori
+# tetap hemat walaupun jumlah pasien ribuan.
+import numpy as np
+import pandas as pd
+
+from app_metrics import span
+
+# Jumlah baris yang diproses dalam satu kali panggilan scaler + model
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Kolom teks yang harus diubah jadi angka dengan encoder dari file model
+CATEGORICAL_ENCODERS = {
+    'gender': 'encoder_gender',
+    'smoking_status': 'encoder_smoking',
+}
+
+# Nama kolom hasil yang ditambahkan ke file CSV
+PREDICTION_COLUMN = 'predicted_diabetes'
+PROBABILITY_COLUMN = 'probability_diabetes'
+# Awalan kolom kontribusi per fitur (predict_batch(..., explain=True), lihat explain.py)
+CONTRIBUTION_PREFIX = 'contribution_'
+# Kolom alasan baris tidak dinilai (hanya ada jika ada baris yang tidak valid)
+ERROR_COLUMN = 'prediction_error'
+
+# Jumlah angka desimal per fitur, sama dengan ketelitian di dataset. Nilai dengan
+# desimal lebih banyak (misal BMI = berat / tinggi^2 dari formulir) dibulatkan
+# sebelum dinilai, jadi setiap jalur (formulir, batch, serve.py, cache) memberi
+# hasil yang sama untuk pasien yang sama
+FEATURE_DECIMALS = {'bmi': 1}
+
+
+def missing_columns(df, artifact):
+    """Daftar kolom fitur yang tidak ada di DataFrame."""
+    return [col for col in artifact['feature_names'] if col not in df.columns]
+
+
+def canonical_features(X, feature_names):
+    """Salinan X dengan fitur di FEATURE_DECIMALS dibulatkan (dan -0.0 jadi 0.0)."""
+    X = np.array(X, dtype=np.float64)
+    for j, col in enumerate(feature_names):
+        if col in FEATURE_DECIMALS:
+            X[:, j] = np.round(X[:, j], FEATURE_DECIMALS[col])
+    X += 0.0
+    return X
+
+
+def encode_features_checked(df, artifact):
+    """Seperti encode_features, tapi baris yang tidak valid tidak menggagalkan semuanya.
+
+    Mengembalikan (X, errors): `errors` berisi pesan per baris ('' = valid).
+    Nilai angka yang kosong/bukan angka dan kategori yang kosong/tidak dikenal
+    membuat baris tidak valid; isi X untuk baris itu tidak boleh dipakai.
+    Fitur di FEATURE_DECIMALS sudah dibulatkan (canonical_features).
+    """
+    missing = missing_columns(df, artifact)
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {missing}")
+
+    feature_names = artifact['feature_names']
+    X = np.zeros((len(df), len(feature_names)), dtype=np.float64)
+    problems = {}
+    for j, col in enumerate(feature_names):
+        values = df[col]
+        if col in CATEGORICAL_ENCODERS:
+            # Kode sebuah nilai = posisinya di `classes_` LabelEncoder (sudah urut),
+            # jadi dengan pd.Index setiap nilai dicari lewat hash; tidak dikenal/kosong = -1
+            encoder = artifact[CATEGORICAL_ENCODERS[col]]
+            codes = pd.Index(encoder.classes_).get_indexer(values)
+            bad = codes < 0
+            X[~bad, j] = codes[~bad]
+            reason = f"tidak dikenal, pilihan yang valid: {list(encoder.classes_)}"
+        else:
+            numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+            bad = ~np.isfinite(numbers)
+            X[~bad, j] = numbers[~bad]
+            reason = "bukan angka"
+        for i in np.flatnonzero(bad):
+            value = values.iloc[i]
+            if pd.isna(value) or str(value).strip() == '':
+                problems.setdefault(i, []).append(f"'{col}' kosong")
+            else:
+                problems.setdefault(i, []).append(f"'{col}'={value!r} {reason}")
+    errors = np.full(len(df), '', dtype=object)
+    for i, messages in problems.items():
+        errors[i] = '; '.join(messages)
+    return canonical_features(X, feature_names), errors
+
+
+def encode_features(df, artifact):
+    """Susun matriks fitur (n_baris x n_fitur) sesuai urutan saat training.
+
+    Baris dengan nilai kosong, bukan angka, atau kategori tidak dikenal
+    ditolak dengan ValueError (lihat encode_features_checked).
+    """
+    X, errors = encode_features_checked(df, artifact)
+    invalid = np.flatnonzero(errors != '')
+    if invalid.size:
+        # Nomor baris mulai dari 1, sama seperti urutan baris data di file CSV
+        shown = ' | '.join(f"baris {i + 1}: {errors[i]}" for i in invalid[:5])
+        more = f" (dan {invalid.size - 5} baris lain)" if invalid.size > 5 else ''
+        raise ValueError(f"{invalid.size} baris tidak valid. {shown}{more}")
+    return X
+
+
+def predict_proba_batch(X, artifact, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Scaling + predict_proba untuk matriks fitur mentah, per chunk.
+
+    Jika artifact punya 'kernel' (Decision Tree yang sudah digabung dengan
+    scaler, lihat tree_kernel.py), data mentah langsung dinilai tanpa scaling.
+    """
+    scaler = artifact['scaler']
+    model = artifact['model']
+    kernel = artifact.get('kernel')
+    feature_names = artifact['feature_names']
+
+    probs = np.empty((X.shape[0], len(model.classes_)), dtype=np.float64)
+    with span('model_predict', path='kernel' if kernel is not None else type(model).__name__):
+        for start in range(0, X.shape[0], chunk_size):
+            chunk = X[start:start + chunk_size]
+            if kernel is not None:
+                probs[start:start + chunk_size] = kernel.predict_proba(chunk)
+                continue
+            # Scaler dilatih dengan DataFrame, jadi nama kolom ikut diberikan
+            chunk_scaled = scaler.transform(pd.DataFrame(chunk, columns=feature_names))
+            probs[start:start + chunk_size] = model.predict_proba(chunk_scaled)
+    return probs
+
+
+def predict_batch(df, artifact, chunk_size=DEFAULT_CHUNK_SIZE, explain=False):
+    """Prediksi seluruh baris DataFrame dan kembalikan salinan berisi hasilnya.
+
+    Label diambil dari matriks probabilitas yang sama (argmax), jadi model
+    hanya dipanggil sekali per chunk, bukan predict lalu predict_proba.
+    Jika `explain` dan model punya explainer, kontribusi setiap fitur ikut
+    ditambahkan sebagai kolom 'contribution_<fitur>'.
+    Baris dengan nilai kosong/tidak valid tidak diberi prediksi (kosong) dan
+    alasannya dicatat di kolom ERROR_COLUMN.
+    """
+    X, errors = encode_features_checked(df, artifact)
+    valid = errors == ''
+    X_valid = X if valid.all() else X[valid]
+    contributions = None
+    if explain and artifact.get('explainer') is not None:
+        from explain import explain_batch
+        probs, contributions = explain_batch(X_valid, artifact, chunk_size)
+    else:
+        probs = predict_proba_batch(X_valid, artifact, chunk_size)
+    classes = artifact['model'].classes_
+
+    result = df.copy()
+    if valid.all():
+        result[PREDICTION_COLUMN] = classes[probs.argmax(axis=1)]
+        result[PROBABILITY_COLUMN] = probs[:, list(classes).index(1)]
+        if contributions is not None:
+            for j, col in enumerate(artifact['feature_names']):
+                result[CONTRIBUTION_PREFIX + col] = contributions[:, j]
+        return result
+
+    # Baris yang tidak valid tidak diberi prediksi; alasannya ada di kolom ERROR_COLUMN
+    predicted = pd.array([pd.NA] * len(df), dtype=pd.Series(classes).convert_dtypes().dtype)
+    predicted[valid] = classes[probs.argmax(axis=1)]
+    result[PREDICTION_COLUMN] = predicted
+    probability = np.full(len(df), np.nan)
+    probability[valid] = probs[:, list(classes).index(1)]
+    result[PROBABILITY_COLUMN] = probability
+    if contributions is not None:
+        for j, col in enumerate(artifact['feature_names']):
+            values = np.full(len(df), np.nan)
+            values[valid] = contributions[:, j]
+            result[CONTRIBUTION_PREFIX + col] = values
+    result[ERROR_COLUMN] = errors
+    return result
@@ -0,0 +1,151 @@
+# ==============================================================================
+# CACHE HASIL PREDIKSI (LRU + TTL)
+# ==============================================================================
+# Formulir di halaman "Prediction" berisi angka bulat kecil dan beberapa
+# pilihan teks, jadi kombinasi input yang sama sering dikirim berulang kali.
+# Cache ini menyimpan probabilitas hasil model per vektor fitur, sehingga
+# input yang pernah dinilai langsung dijawab tanpa memanggil model.
+#
+# - Kunci = vektor fitur setelah encoding (urutan sama seperti training).
+#   Fitur turunan seperti BMI (berat / tinggi^2 dari formulir) dibulatkan ke
+#   ketelitian dataset (prediction.FEATURE_DECIMALS) SEBELUM dinilai model, jadi
+#   berat & tinggi berbeda dengan BMI sama memakai kunci yang sama. Semua jalur
+#   prediksi lain (batch, serve.py) juga menilai nilai yang sudah dibulatkan,
+#   jadi hasil dari cache selalu sama dengan hasil model untuk input yang sama.
+# - Terikat pada versi model: jika model berganti, cache otomatis dikosongkan.
+# - Ukuran dibatasi (LRU) dan setiap hasil kedaluwarsa setelah TTL detik.
+# - Aman dipakai bersama oleh banyak sesi Streamlit (thread) sekaligus.
+#
+# Cache bisa diisi lebih dulu dengan kombinasi input yang paling sering muncul
+# di dataset: set env DIABETES_APP_PREDICTION_CACHE_WARM=<jumlah kombinasi>.
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from prediction import canonical_features, encode_features_checked, predict_proba_batch
+
+DEFAULT_MAX_SIZE = 10_000
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+WARM_ENV_VAR = 'DIABETES_APP_PREDICTION_CACHE_WARM'
+
+
+def feature_key(row):
+    """Kunci cache untuk satu baris fitur: tuple float (-0.0 disamakan dengan 0.0)."""
+    return tuple(float(x) + 0.0 for x in row)
+
+
+class PredictionCache:
+    """Cache LRU + TTL: vektor fitur -> probabilitas setiap kelas."""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, ttl=DEFAULT_TTL_SECONDS, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.version = None
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def _check_version(self, version):
+        # Dipanggil dengan lock terkunci
+        if version != self.version:
+            self._items.clear()
+            self.version = version
+
+    def get(self, key, version):
+        with self._lock:
+            self._check_version(version)
+            item = self._items.get(key)
+            if item is not None and self.clock() - item[0] > self.ttl:
+                del self._items[key]
+                self.expired += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, key, proba, version):
+        with self._lock:
+            self._check_version(version)
+            self._items[key] = (self.clock(), proba)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._items),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'version': self.version,
+            }
+
+
+def predict_proba_cached(X, artifact, cache):
+    """Sama seperti predict_proba_batch, tapi baris yang sudah ada di cache tidak dinilai ulang.
+
+    Semua baris yang belum ada di cache dinilai model dalam SATU panggilan.
+    Baris dibulatkan dulu dengan canonical_features, untuk kunci dan model.
+    """
+    X = canonical_features(X, artifact['feature_names'])
+    version = artifact.get('version')
+    keys = [feature_key(row) for row in X]
+    probs = np.empty((X.shape[0], len(artifact['model'].classes_)), dtype=np.float64)
+
+    todo = []
+    for i, key in enumerate(keys):
+        cached = cache.get(key, version)
+        if cached is None:
+            todo.append(i)
+        else:
+            probs[i] = cached
+    if todo:
+        probs[todo] = predict_proba_batch(X[todo], artifact)
+        for i in todo:
+            cache.put(keys[i], probs[i].copy(), version)
+    return probs
+
+
+def warm_from_dataset(cache, df, artifact, top_n):
+    """Isi cache dengan `top_n` kombinasi fitur yang paling sering muncul di dataset.
+
+    Baris yang kosong/tidak valid (misal baris tambahan dari klinik) dilewati.
+    """
+    X, errors = encode_features_checked(df, artifact)
+    X = X[errors == '']
+    if len(X) == 0:
+        return 0
+    unique_rows, counts = np.unique(X, axis=0, return_counts=True)
+    top = unique_rows[np.argsort(-counts, kind='stable')[:top_n]]
+    probs = predict_proba_batch(top, artifact)
+    version = artifact.get('version')
+    for row, proba in zip(top, probs):
+        cache.put(feature_key(row), proba, version)
+    return len(top)
+
+
+def warm_size_from_env():
+    try:
+        return max(int(os.environ.get(WARM_ENV_VAR, '0')), 0)
+    except ValueError:
+        return 0
@@ -0,0 +1,126 @@
+# ==============================================================================
+# ANTREAN PREDIKSI DI LATAR BELAKANG (THREAD POOL + BATAS ANTREAN)
+# ==============================================================================
+# Dulu halaman "Prediction" menahan thread script Streamlit di dalam
+# st.spinner (sleep 1 detik + panggilan model). Setiap pengguna yang sedang
+# menunggu memegang satu thread server.
+#
+# Sekarang prediksi dikirim ke SATU pool bersama untuk semua sesi:
+#   - submit() langsung mengembalikan Future, script Streamlit tidak menunggu;
+#     halaman mengecek Future secara berkala dan menampilkan hasil saat selesai,
+#   - jumlah permintaan yang sedang diproses + menunggu dibatasi
+#     (workers + max_queue). Jika penuh, submit() langsung menolak dengan
+#     PoolSaturated, bukan menumpuk antrean tanpa batas,
+#   - kedalaman antrean, jumlah ditolak, dan lama menunggu dicatat (stats()
+#     dan app_metrics).
+#
+# Ukuran bisa diatur dengan environment variable:
+#   DIABETES_APP_PREDICTION_WORKERS=4   jumlah thread pekerja
+#   DIABETES_APP_PREDICTION_QUEUE=32    maks. permintaan yang menunggu
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import app_metrics
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE = 32
+WORKERS_ENV_VAR = 'DIABETES_APP_PREDICTION_WORKERS'
+QUEUE_ENV_VAR = 'DIABETES_APP_PREDICTION_QUEUE'
+
+
+class PoolSaturated(RuntimeError):
+    """Semua pekerja sibuk dan antrean penuh."""
+
+    def __init__(self, stats):
+        super().__init__(f"Antrean prediksi penuh ({stats['queued']} menunggu, {stats['running']} diproses)")
+        self.stats = stats
+
+
+class PredictionPool:
+    """Thread pool dengan antrean terbatas; submit() tidak pernah menunggu."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prediction')
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            app_metrics.count('prediction_pool_requests', result='rejected')
+            raise PoolSaturated(self.stats())
+        with self._lock:
+            self.queued += 1
+            self.submitted += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            self._report_depth()
+        app_metrics.count('prediction_pool_requests', result='accepted')
+        try:
+            future = self._executor.submit(self._run, time.perf_counter(), fn, args, kwargs)
+        except RuntimeError:
+            self._finish(started=False)
+            raise
+        future.add_done_callback(lambda f: self._finish(started=not f.cancelled()))
+        return future
+
+    def _run(self, submitted, fn, args, kwargs):
+        app_metrics.observe('prediction_queue_wait', time.perf_counter() - submitted)
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self._report_depth()
+        return fn(*args, **kwargs)
+
+    def _finish(self, started):
+        # Future yang dibatalkan sebelum sempat jalan masih terhitung menunggu
+        with self._lock:
+            if started:
+                self.running -= 1
+                self.completed += 1
+            else:
+                self.queued -= 1
+            self._report_depth()
+        self._slots.release()
+
+    def _report_depth(self):
+        # Dipanggil dengan lock terkunci
+        app_metrics.gauge('prediction_pool_queued', self.queued)
+        app_metrics.gauge('prediction_pool_running', self.running)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'queued': self.queued,
+                'running': self.running,
+                'max_queued': self.max_queued,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'rejected': self.rejected,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _env_int(name, default):
+    try:
+        return max(int(os.environ.get(name, default)), 1)
+    except ValueError:
+        return default
+
+
+def pool_from_env():
+    return PredictionPool(_env_int(WORKERS_ENV_VAR, DEFAULT_WORKERS), _env_int(QUEUE_ENV_VAR, DEFAULT_MAX_QUEUE))
@@ -0,0 +1,335 @@
+# ==============================================================================
+# SERVER SCORING (TANPA STREAMLIT)
+# ==============================================================================
+# Menjalankan model diabetes sebagai layanan terpisah dari UI Streamlit.
+# Model dimuat SEKALI saat server menyala, lalu permintaan yang datang
+# bersamaan dikumpulkan menjadi "micro-batch" (misal tiap 5 ms) dan diproses
+# dengan satu kali scaler.transform + predict_proba.
+#
+# Cara pakai:
+#   python serve.py http --port 8000          # HTTP: POST /predict, GET /stats
+#   python serve.py stdin < pasien.jsonl      # 1 baris JSON masuk = 1 baris hasil
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import load_artifact
+from prediction import encode_features_checked, predict_proba_batch
+
+DEFAULT_WINDOW_MS = 5
+DEFAULT_MAX_BATCH = 1024
+# Jumlah latensi terakhir yang disimpan untuk menghitung p50/p99
+LATENCY_WINDOW = 10_000
+# Mode stdin: maks. hasil yang belum ditulis. Jika penuh, pembacaan input menunggu
+# penulis, jadi memori tidak ikut membesar sepanjang file input
+STDIN_MAX_PENDING = 4 * DEFAULT_MAX_BATCH
+
+
+class LatencyTracker:
+    """Menyimpan latensi terakhir (detik) dan menghitung persentilnya."""
+
+    def __init__(self, size=LATENCY_WINDOW):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.total = 0
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+            self.total += 1
+
+    def summary(self):
+        with self._lock:
+            samples = np.array(self._samples)
+            total = self.total
+        if samples.size == 0:
+            return {'requests': total}
+        p50, p99 = np.percentile(samples, [50, 99]) * 1000
+        return {'requests': total, 'p50_ms': round(p50, 3), 'p99_ms': round(p99, 3)}
+
+
+class MicroBatcher:
+    """Mengumpulkan permintaan dari banyak thread lalu memprosesnya sekaligus.
+
+    Setiap `submit()` langsung mengembalikan Future. Thread pekerja menunggu
+    permintaan pertama, lalu menunggu paling lama `window_ms` (atau sampai
+    `max_batch` terkumpul) sebelum menjalankan model satu kali.
+    """
+
+    def __init__(self, artifact, window_ms=DEFAULT_WINDOW_MS, max_batch=DEFAULT_MAX_BATCH):
+        self.artifact = artifact
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.latency = LatencyTracker()
+        self.n_batches = 0
+
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, record):
+        future = Future()
+        # Data yang jelas salah ditolak sebelum masuk batch: kolom yang hilang
+        # tidak boleh terisi NaN hanya karena pasien lain di batch punya kolom itu
+        try:
+            self._check_record(record)
+        except ValueError as e:
+            future.set_exception(e)
+            return future
+        with self._cond:
+            self._pending.append((record, future, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def _check_record(self, record):
+        if not isinstance(record, dict):
+            raise ValueError(f"Data pasien harus berupa object JSON, bukan {type(record).__name__}")
+        missing = [col for col in self.artifact['feature_names'] if col not in record]
+        if missing:
+            raise ValueError(f"Kolom wajib tidak ditemukan: {missing}")
+        nested = [col for col in self.artifact['feature_names'] if isinstance(record[col], (list, dict))]
+        if nested:
+            raise ValueError(f"Nilai kolom {nested} harus berupa 1 angka atau teks, bukan list/object")
+
+    def predict(self, record):
+        return self.submit(record).result()
+
+    def stats(self):
+        stats = self.latency.summary()
+        if self.n_batches:
+            stats['batches'] = self.n_batches
+            stats['mean_batch_size'] = round(stats['requests'] / self.n_batches, 2)
+        return stats
+
+    def _take_batch(self):
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            deadline = time.perf_counter() + self.window
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            n = min(len(self._pending), self.max_batch)
+            return [self._pending.popleft() for _ in range(n)]
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            self.n_batches += 1
+            try:
+                results = self._score_safe([record for record, _, _ in batch])
+            except Exception as e:
+                # Error tak terduga tidak boleh mematikan thread pekerja
+                results = [e] * len(batch)
+
+            now = time.perf_counter()
+            for (_, future, submitted), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+                self.latency.add(now - submitted)
+
+    def _score_safe(self, records):
+        # Nilai kosong, bukan angka, atau kategori tidak dikenal hanya menggagalkan
+        # pasiennya sendiri; pasien lain di batch yang sama tetap dinilai
+        X, errors = encode_features_checked(pd.DataFrame.from_records(records), self.artifact)
+        results = [ValueError(error) if error else None for error in errors]
+        valid = np.flatnonzero(errors == '')
+        for i, result in zip(valid, self._predict_safe(X[valid])):
+            results[i] = result
+        return results
+
+    def _predict_safe(self, X):
+        # Error tak terduga saat model dipanggil: batch dibelah dua terus sampai
+        # baris penyebabnya ketemu, agar pasien lain tetap mendapat hasil
+        if len(X) == 0:
+            return []
+        try:
+            return self._predict(X)
+        except Exception as e:
+            if len(X) == 1:
+                return [e]
+            mid = len(X) // 2
+            return self._predict_safe(X[:mid]) + self._predict_safe(X[mid:])
+
+    def _predict(self, X):
+        probs = predict_proba_batch(X, self.artifact)
+        classes = self.artifact['model'].classes_
+        positive = list(classes).index(1)
+        labels = classes[probs.argmax(axis=1)]
+        return [
+            {'prediction': int(label), 'probability': float(p[positive])}
+            for label, p in zip(labels, probs)
+        ]
+
+
+# ==============================================================================
+# MODE HTTP
+# ==============================================================================
+def make_handler(batcher):
+    class Handler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, {'status': 'ok', 'model': batcher.artifact['model_name']})
+            elif self.path == '/stats':
+                self._send_json(200, batcher.stats())
+            else:
+                self._send_json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/predict':
+                self._send_json(404, {'error': 'not found'})
+                return
+            try:
+                length = int(self.headers['Content-Length'])
+                if length < 0:
+                    raise ValueError
+            except (TypeError, ValueError):
+                self._send_json(400, {'error': 'Header Content-Length tidak ada atau tidak valid'})
+                return
+            try:
+                payload = json.loads(self.rfile.read(length))
+            except ValueError as e:
+                # JSONDecodeError dan UnicodeDecodeError sama-sama turunan ValueError
+                self._send_json(400, {'error': f'JSON tidak valid: {e}'})
+                return
+
+            # Boleh kirim 1 pasien (object) atau banyak pasien (list)
+            if not isinstance(payload, list):
+                try:
+                    result = batcher.predict(payload)
+                except ValueError as e:
+                    self._send_json(422, {'error': str(e)})
+                    return
+                except Exception as e:
+                    self._send_json(500, {'error': str(e)})
+                    return
+                self._send_json(200, result)
+                return
+
+            # List: 1 hasil per pasien sesuai urutan. Pasien yang tidak valid mendapat
+            # {'index': posisinya di list, 'error': ...} tanpa menggagalkan pasien lain
+            futures = [batcher.submit(record) for record in payload]
+            results = []
+            for index, future in enumerate(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append({'index': index, 'error': str(e)})
+            self._send_json(200, results)
+
+        def log_message(self, format, *args):
+            # Matikan log per-request bawaan agar tidak memperlambat server
+            pass
+
+    return Handler
+
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    # Antrian koneksi bawaan (5) terlalu kecil untuk ratusan klien bersamaan
+    request_queue_size = 1024
+
+
+def serve_http(batcher, host, port):
+    server = ScoringHTTPServer((host, port), make_handler(batcher))
+    print(f"Server berjalan di http://{host}:{port} (POST /predict, GET /stats)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(batcher.stats()), file=sys.stderr)
+
+
+# ==============================================================================
+# MODE STDIN (JSON LINES)
+# ==============================================================================
+def serve_stdin(batcher, infile=sys.stdin, outfile=sys.stdout, max_pending=STDIN_MAX_PENDING):
+    # Setiap baris langsung dikirim ke micro-batcher begitu dibaca, dan thread
+    # penulis menulis hasilnya sesuai urutan input SEGERA setelah Future-nya
+    # selesai. Klien yang menulis 1 baris lalu menunggu jawaban di pipe yang
+    # tetap terbuka langsung mendapat jawabannya, tanpa menunggu EOF
+    pending = queue.Queue(maxsize=max_pending)
+    writer = threading.Thread(target=_write_results, args=(pending, outfile), daemon=True)
+    writer.start()
+    for number, line in enumerate(infile, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            # Baris yang rusak hanya menghasilkan error di barisnya sendiri
+            future = Future()
+            future.set_exception(ValueError(f"JSON tidak valid: {e}"))
+        else:
+            future = batcher.submit(record)
+        pending.put((number, future))
+    pending.put(None)
+    writer.join()
+    print(json.dumps(batcher.stats()), file=sys.stderr)
+
+
+def _write_results(pending, outfile):
+    broken = False
+    while True:
+        item = pending.get()
+        if item is None:
+            return
+        number, future = item
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {'error': f"Baris {number}: {e}"}
+        if broken:
+            # Pembaca output sudah menutup pipe: sisa hasil dibuang agar pembacaan input tidak macet
+            continue
+        try:
+            outfile.write(json.dumps(result) + '\n')
+            outfile.flush()
+        except OSError:
+            broken = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server scoring model diabetes")
+    parser.add_argument('mode', choices=['http', 'stdin'])
+    parser.add_argument('--model', default=None,
+                        help="Folder format ringkas atau file .pkl (default: diabetes_model/ lalu diabetes_model.pkl)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=DEFAULT_WINDOW_MS,
+                        help="Lama menunggu permintaan lain sebelum batch diproses")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args(argv)
+
+    batcher = MicroBatcher(load_artifact(args.model), args.window_ms, args.max_batch)
+    if args.mode == 'http':
+        serve_http(batcher, args.host, args.port)
+    else:
+        serve_stdin(batcher)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# ==============================================================================
+# LAPORAN WAKTU STARTUP
+# ==============================================================================
+# Dua cara melihat ke mana waktu startup aplikasi habis:
+#
+# 1. Saat aplikasi berjalan: set env DIABETES_APP_STARTUP_REPORT=1. Setiap
+#    kali script dijalankan ulang, satu baris JSON ditulis ke stderr berisi
+#    waktu tiap langkah (import halaman, render), modul baru yang ter-import,
+#    dan waktu "first paint" (sampai halaman selesai digambar) untuk sesi baru.
+#    Jika env tidak di-set, fungsi di sini tidak melakukan apa-apa.
+#
+# 2. Dari terminal, tanpa menjalankan server:
+#      python startup_profile.py
+#    Mengukur waktu import setiap modul halaman & library dengan
+#    `python -X importtime` di proses baru (kondisi cold start).
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+ENV_VAR = 'DIABETES_APP_STARTUP_REPORT'
+ENABLED = os.environ.get(ENV_VAR, '') not in ('', '0')
+
+# Waktu modul ini pertama kali di-import = awal proses server menjalankan app
+PROCESS_START = time.perf_counter()
+_first_run_done = False
+
+
+class RunProfile:
+    """Mencatat waktu langkah-langkah dalam satu kali script dijalankan."""
+
+    def __init__(self, run_start):
+        self.run_start = run_start
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        if not ENABLED:
+            yield
+            return
+        before = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            new_modules = {m.split('.')[0] for m in set(sys.modules) - before}
+            self.steps.append({
+                'step': name,
+                'ms': round((time.perf_counter() - start) * 1000, 2),
+                'new_packages': sorted(new_modules),
+            })
+
+    def finish(self, page, new_session):
+        """Tulis laporan ke stderr. `new_session` = True jika ini first paint sesi baru."""
+        global _first_run_done
+        if not ENABLED:
+            return
+        now = time.perf_counter()
+        record = {
+            'page': page,
+            'run_ms': round((now - self.run_start) * 1000, 2),
+            'new_session': new_session,
+            'steps': self.steps,
+        }
+        if new_session:
+            record['first_paint_ms'] = record['run_ms']
+        if not _first_run_done:
+            # Run pertama di proses ini: hitung sejak proses mulai (cold start)
+            record['cold_start_ms'] = round((now - PROCESS_START) * 1000, 2)
+            _first_run_done = True
+        print(json.dumps(record), file=sys.stderr, flush=True)
+
+
+# ==============================================================================
+# MODE TERMINAL: WAKTU IMPORT PER MODUL
+# ==============================================================================
+# Modul yang diukur. Streamlit selalu di-import duluan, jadi angka modul lain
+# adalah biaya TAMBAHAN di atas Streamlit.
+PROFILED_MODULES = [
+    'numpy', 'pandas', 'matplotlib.pyplot', 'seaborn', 'sklearn.preprocessing',
+    'artifact_io', 'prediction', 'loaders',
+    'views.home', 'views.dataset', 'views.eda', 'views.modelling',
+    'views.predict', 'views.batch_predict', 'views.about',
+]
+
+
+def import_time_ms(module, preload='streamlit'):
+    """Waktu import `module` (ms) di proses Python baru, setelah `preload`."""
+    code = f'import {preload}; import {module}' if preload else f'import {module}'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"Gagal import {module}: {result.stderr.strip().splitlines()[-1]}")
+    # Format baris: "import time: self [us] | cumulative | imported package"
+    # Modul tingkat atas tidak punya spasi di depan nama paketnya. Baris milik
+    # `preload` (dan semua import di dalamnya) muncul duluan, jadi dilewati.
+    total_us = 0
+    counting = not preload
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name[1:].startswith(' '):
+            continue
+        if counting:
+            total_us += int(cumulative)
+        elif name.strip() == preload:
+            counting = True
+    return total_us / 1000
+
+
+def main():
+    base = import_time_ms('streamlit', preload=None)
+    print(f"{'Modul':<25} | {'Import (ms)':>12}")
+    print("-" * 40)
+    print(f"{'streamlit':<25} | {base:>12.1f}")
+    for module in PROFILED_MODULES:
+        print(f"{module:<25} | {import_time_ms(module):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
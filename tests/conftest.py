@@ -0,0 +1,59 @@
+# ==============================================================================
+# DATA & MODEL SINTETIS UNTUK TEST
+# ==============================================================================
+# Test tidak butuh diabetes_dataset.csv: data dibuat dengan skema yang sama
+# (benchmark.make_synthetic_dataset), lalu model dilatih seperti di train.py.
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmark import make_synthetic_dataset  # noqa: E402
+from train import FEATURES, prepare_data  # noqa: E402
+
+N_ROWS = 4000
+
+
+@pytest.fixture(scope='session')
+def synthetic_df():
+    return make_synthetic_dataset(N_ROWS, seed=0)
+
+
+@pytest.fixture(scope='session')
+def synthetic_data(synthetic_df):
+    return prepare_data(synthetic_df)
+
+
+@pytest.fixture(scope='session')
+def make_artifact(synthetic_data):
+    """Latih `estimator` di data sintetis dan kembalikan dict artifact seperti diabetes_model.pkl."""
+    from sklearn.base import clone
+
+    def make(estimator):
+        model = clone(estimator).fit(synthetic_data['X_train'], synthetic_data['y_train'])
+        return {
+            'model': model,
+            'scaler': synthetic_data['scaler'],
+            'encoder_gender': synthetic_data['encoder_gender'],
+            'encoder_smoking': synthetic_data['encoder_smoking'],
+            'model_name': type(model).__name__,
+            'accuracy': float(model.score(synthetic_data['X_test'], synthetic_data['y_test'])),
+            'feature_names': FEATURES,
+            'history': [],
+        }
+
+    return make
+
+
+@pytest.fixture(scope='session')
+def raw_features(synthetic_df, make_artifact):
+    """Matriks fitur mentah (sebelum scaling) untuk semua baris data sintetis."""
+    from sklearn.naive_bayes import GaussianNB
+
+    from prediction import encode_features
+
+    return encode_features(synthetic_df, make_artifact(GaussianNB()))
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from artifact_io import export_artifact, load_artifact
+from explain import NaiveBayesExplainer, TreeExplainer, build_explainer, check_additivity
+
+
+@pytest.mark.parametrize('params', [{'max_depth': 3}, {'max_depth': 8, 'min_samples_leaf': 5}, {}])
+def test_tree_contributions_add_up(make_artifact, raw_features, params):
+    artifact = make_artifact(DecisionTreeClassifier(random_state=0, **params))
+    explainer = build_explainer(artifact)
+    assert isinstance(explainer, TreeExplainer)
+    assert check_additivity(artifact, raw_features, explainer) < 1e-9
+
+
+def test_naive_bayes_contributions_add_up(make_artifact, raw_features):
+    artifact = make_artifact(GaussianNB())
+    explainer = build_explainer(artifact)
+    assert isinstance(explainer, NaiveBayesExplainer)
+    assert check_additivity(artifact, raw_features, explainer) < 1e-9
+
+
+@pytest.mark.parametrize('estimator', [DecisionTreeClassifier(max_depth=10, random_state=0), GaussianNB()])
+def test_compact_contributions_add_up(make_artifact, raw_features, tmp_path, estimator):
+    artifact = make_artifact(estimator)
+    export_artifact(artifact, tmp_path / 'model')
+    compact = load_artifact(str(tmp_path / 'model'))
+    assert check_additivity(compact, raw_features, compact['explainer']) < 1e-9
+    np.testing.assert_allclose(compact['explainer'].contributions(raw_features),
+                               build_explainer(artifact).contributions(raw_features), atol=1e-12)
+
+
+def test_knn_has_no_explainer(make_artifact):
+    assert build_explainer(make_artifact(KNeighborsClassifier())) is None
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier
+
+from artifact_io import export_artifact, load_artifact
+
+
+@pytest.mark.parametrize('params', [{'n_neighbors': 5}, {'n_neighbors': 11, 'weights': 'distance'}])
+def test_index_matches_sklearn(make_artifact, synthetic_data, tmp_path, params):
+    artifact = make_artifact(KNeighborsClassifier(**params))
+    export_artifact(artifact, tmp_path / 'model')
+    compact = load_artifact(str(tmp_path / 'model'))
+    X = synthetic_data['X_test']
+
+    # Array indeks dibuka dengan memory-map, KD-tree dirakit di atasnya
+    assert compact['model'].index.tree is not None
+    assert isinstance(compact['model'].index.arrays['index_data'], np.memmap)
+    expected = artifact['model'].predict_proba(X)
+    np.testing.assert_array_equal(compact['model'].predict_proba(X).argmax(axis=1), expected.argmax(axis=1))
+    np.testing.assert_allclose(compact['model'].predict_proba(X), expected, atol=1e-6)
+
+    # Tanpa KD-tree (brute-force NumPy) hasilnya tetap sama
+    compact['model'].index.tree = None
+    np.testing.assert_allclose(compact['model'].predict_proba(X), expected, atol=1e-6)
@@ -0,0 +1,63 @@
+import numpy as np
+from sklearn.naive_bayes import GaussianNB
+from sklearn.tree import DecisionTreeClassifier
+
+from prediction import canonical_features, predict_batch, predict_proba_batch
+from prediction_cache import PredictionCache, predict_proba_cached, warm_from_dataset
+from train import FEATURES
+
+BMI = FEATURES.index('bmi')
+
+
+def test_bmi_from_form_shares_cache_entry(make_artifact, raw_features):
+    artifact = make_artifact(DecisionTreeClassifier(random_state=0))
+    artifact['version'] = 'v1'
+    cache = PredictionCache()
+    a, b = raw_features[:1].copy(), raw_features[:1].copy()
+    # Berat & tinggi berbeda, BMI hampir sama: 70 / 1.70^2 dan 71 / 1.712^2
+    a[0, BMI], b[0, BMI] = 70 / 1.70 ** 2, 71 / 1.712 ** 2
+
+    first = predict_proba_cached(a, artifact, cache)
+    second = predict_proba_cached(b, artifact, cache)
+    assert cache.stats()['hits'] == 1
+    np.testing.assert_array_equal(first, second)
+    # Hasil cache = hasil model untuk input yang sudah dibulatkan
+    np.testing.assert_array_equal(first, predict_proba_batch(canonical_features(a, FEATURES), artifact))
+
+
+def test_new_version_clears_cache(make_artifact, raw_features):
+    artifact = make_artifact(DecisionTreeClassifier(random_state=0))
+    cache = PredictionCache()
+    artifact['version'] = 'v1'
+    predict_proba_cached(raw_features[:5], artifact, cache)
+    artifact['version'] = 'v2'
+    predict_proba_cached(raw_features[:5], artifact, cache)
+    assert cache.stats()['hits'] == 0
+
+
+def test_batch_scores_rounded_bmi_like_form(make_artifact, synthetic_df):
+    # Naive Bayes: perubahan BMI sekecil apa pun mengubah probabilitasnya
+    artifact = make_artifact(GaussianNB())
+    artifact['version'] = 'v1'
+    df = synthetic_df.head(200).copy()
+    df['bmi'] = df['bmi'] + 0.0437  # BMI mentah dengan desimal lebih banyak dari dataset
+
+    batch = predict_batch(df, artifact)['probability_diabetes'].to_numpy()
+    X = df[FEATURES].copy()
+    X['gender'] = artifact['encoder_gender'].transform(X['gender'])
+    X['smoking_status'] = artifact['encoder_smoking'].transform(X['smoking_status'])
+    form = predict_proba_cached(X.to_numpy(dtype=np.float64), artifact, PredictionCache())[:, 1]
+    np.testing.assert_array_equal(batch, form)
+
+
+def test_warm_up_skips_invalid_rows(make_artifact, synthetic_df):
+    artifact = make_artifact(DecisionTreeClassifier(random_state=0))
+    artifact['version'] = 'v1'
+    df = synthetic_df.head(500).astype({'age': object, 'gender': object})
+    df.loc[0, 'age'] = ''
+    df.loc[1, 'gender'] = None
+    df.loc[2, 'age'] = 'abc'
+
+    cache = PredictionCache()
+    assert warm_from_dataset(cache, df, artifact, top_n=50) == 50
+    assert cache.stats()['size'] == 50
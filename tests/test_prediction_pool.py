@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from prediction_pool import PoolSaturated, PredictionPool
+
+
+def test_rejects_when_workers_and_queue_are_full():
+    pool = PredictionPool(workers=1, max_queue=1)
+    started, release = threading.Event(), threading.Event()
+
+    def job(value):
+        started.set()
+        release.wait(10)
+        return value
+
+    try:
+        running = pool.submit(job, 1)
+        assert started.wait(10)
+        queued = pool.submit(job, 2)
+        with pytest.raises(PoolSaturated) as e:
+            pool.submit(job, 3)
+        assert (e.value.stats['running'], e.value.stats['queued']) == (1, 1)
+
+        release.set()
+        assert (running.result(timeout=10), queued.result(timeout=10)) == (1, 2)
+        stats = pool.stats()
+        assert (stats['running'], stats['queued']) == (0, 0)
+        assert (stats['submitted'], stats['completed'], stats['rejected'], stats['max_queued']) == (2, 2, 1, 1)
+        # Slot yang sudah selesai bisa dipakai lagi
+        assert pool.submit(job, 4).result(timeout=10) == 4
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_failed_and_cancelled_jobs_free_their_slot():
+    pool = PredictionPool(workers=1, max_queue=1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(10)
+
+    def failing():
+        raise ValueError("model rusak")
+
+    try:
+        with pytest.raises(ValueError, match="model rusak"):
+            pool.submit(failing).result(timeout=10)
+
+        first = pool.submit(blocking)
+        assert started.wait(10)
+        waiting = pool.submit(blocking)
+        assert waiting.cancel()
+        assert pool.stats()['queued'] == 0
+        # Slot milik Future yang dibatalkan sudah kembali
+        second = pool.submit(lambda: 'ok')
+        release.set()
+        first.result(timeout=10)
+        assert second.result(timeout=10) == 'ok'
+
+        stats = pool.stats()
+        assert (stats['running'], stats['queued'], stats['rejected']) == (0, 0, 0)
+        assert stats['completed'] == 3
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,125 @@
+import io
+import json
+import os
+import select
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from prediction import encode_features, predict_proba_batch
+from serve import MicroBatcher, ScoringHTTPServer, make_handler, serve_stdin
+from train import FEATURES
+
+
+@pytest.fixture(scope='module')
+def artifact(make_artifact):
+    return make_artifact(DecisionTreeClassifier(max_depth=6, random_state=0))
+
+
+@pytest.fixture(scope='module')
+def records(synthetic_df):
+    return synthetic_df[FEATURES].head(50).to_dict('records')
+
+
+def expected(records, artifact):
+    probs = predict_proba_batch(encode_features(pd.DataFrame(records), artifact), artifact)
+    return probs[:, list(artifact['model'].classes_).index(1)]
+
+
+def test_concurrent_requests_share_a_batch(artifact, records):
+    batcher = MicroBatcher(artifact, window_ms=200)
+    futures = [batcher.submit(record) for record in records]
+    results = [future.result(timeout=10) for future in futures]
+    assert batcher.n_batches < len(records)
+    np.testing.assert_allclose([r['probability'] for r in results], expected(records, artifact))
+    assert batcher.stats()['requests'] == len(records)
+
+
+def test_bad_records_fail_alone_and_keep_order(artifact, records):
+    batcher = MicroBatcher(artifact, window_ms=200)
+    bad = [
+        {k: v for k, v in records[1].items() if k != 'age'},   # kolom hilang
+        dict(records[2], age=[1, 2]),                           # bukan nilai tunggal
+        dict(records[3], bmi=''),                               # kosong
+        dict(records[4], gender='X'),                           # kategori tidak dikenal
+        'bukan object',
+    ]
+    futures = [batcher.submit(record) for record in [records[0], *bad, records[5]]]
+
+    good = [futures[0].result(timeout=10), futures[-1].result(timeout=10)]
+    np.testing.assert_allclose([r['probability'] for r in good], expected([records[0], records[5]], artifact))
+    messages = []
+    for future in futures[1:-1]:
+        with pytest.raises(ValueError) as e:
+            future.result(timeout=10)
+        messages.append(str(e.value))
+    assert "['age']" in messages[0]
+    assert 'list/object' in messages[1]
+    assert "'bmi' kosong" in messages[2]
+    assert "'gender'='X'" in messages[3]
+    assert 'object JSON' in messages[4]
+
+
+def test_http_list_returns_per_record_errors(artifact, records):
+    server = ScoringHTTPServer(('127.0.0.1', 0), make_handler(MicroBatcher(artifact)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/predict'
+
+    def post(payload):
+        request = urllib.request.Request(url, json.dumps(payload).encode())
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    try:
+        status, results = post([records[0], dict(records[1], bmi=''), records[2]])
+        assert status == 200
+        assert results[1] == {'index': 1, 'error': "'bmi' kosong"}
+        np.testing.assert_allclose([results[0]['probability'], results[2]['probability']],
+                                   expected([records[0], records[2]], artifact))
+        assert post(dict(records[1], bmi=''))[0] == 422
+        assert post(records[0])[1]['probability'] == results[0]['probability']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_stdin_writes_results_in_input_order(artifact, records):
+    lines = [json.dumps(records[0]), '{rusak', '', json.dumps(dict(records[1], bmi='')), json.dumps(records[1])]
+    out = io.StringIO()
+    serve_stdin(MicroBatcher(artifact), io.StringIO('\n'.join(lines) + '\n'), out)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(results) == 4
+    assert results[1]['error'].startswith('Baris 2: JSON tidak valid')
+    assert results[2]['error'] == "Baris 4: 'bmi' kosong"
+    np.testing.assert_allclose([results[0]['probability'], results[3]['probability']],
+                               expected([records[0], records[1]], artifact))
+
+
+def test_stdin_answers_before_input_is_closed(artifact, records):
+    in_read, in_write = os.pipe()
+    out_read, out_write = os.pipe()
+    infile, outfile = os.fdopen(in_read), os.fdopen(out_write, 'w')
+    thread = threading.Thread(target=serve_stdin, args=(MicroBatcher(artifact), infile, outfile), daemon=True)
+    thread.start()
+    writer, reader = os.fdopen(in_write, 'w'), os.fdopen(out_read)
+    try:
+        # Klien menulis 1 baris lalu menunggu jawabannya, pipe input tetap terbuka
+        writer.write(json.dumps(records[0]) + '\n')
+        writer.flush()
+        ready, _, _ = select.select([reader], [], [], 5)
+        assert ready, "tidak ada hasil sebelum input ditutup"
+        assert 'probability' in json.loads(reader.readline())
+    finally:
+        writer.close()
+        thread.join(timeout=10)
+        outfile.close()
+        reader.close()
+    assert not thread.is_alive()
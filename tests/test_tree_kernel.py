@@ -0,0 +1,48 @@
+import pickle
+
+import numpy as np
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+import tree_kernel
+from artifact_io import export_artifact, load_artifact
+from tree_kernel import build_kernel, check_parity
+
+
+@pytest.mark.parametrize('params', [{}, {'max_depth': 3}, {'max_depth': 8, 'min_samples_leaf': 5},
+                                    {'criterion': 'entropy', 'max_depth': 12}])
+def test_kernel_matches_sklearn(make_artifact, raw_features, params):
+    artifact = make_artifact(DecisionTreeClassifier(random_state=0, **params))
+    assert check_parity(artifact, raw_features) == 0
+
+
+def test_kernel_matches_sklearn_at_thresholds(make_artifact, raw_features):
+    # Nilai yang persis sama dengan ambang batas adalah kasus paling rawan
+    # setelah scaler dilipat ke dalam pohon
+    artifact = make_artifact(DecisionTreeClassifier(max_depth=10, random_state=0))
+    kernel = build_kernel(artifact)
+    split = np.flatnonzero(kernel.left != np.arange(len(kernel.left)))
+    X = raw_features[:len(split)].copy()
+    X[np.arange(len(split)), kernel.feature[split]] = kernel.threshold[split]
+    assert check_parity(artifact, X, kernel) == 0
+
+
+def test_compact_kernel_matches_pickle(make_artifact, raw_features, tmp_path):
+    artifact = make_artifact(DecisionTreeClassifier(max_depth=10, random_state=0))
+    export_artifact(artifact, tmp_path / 'model')
+    compact = load_artifact(str(tmp_path / 'model'))
+    assert check_parity(compact, raw_features, compact['kernel']) == 0
+    np.testing.assert_array_equal(compact['kernel'].predict_proba(raw_features),
+                                  artifact['model'].predict_proba(artifact['scaler'].transform(raw_features)))
+
+
+def test_main_exit_code(make_artifact, synthetic_df, tmp_path, monkeypatch):
+    csv_path = tmp_path / 'data.csv'
+    pkl_path = tmp_path / 'model.pkl'
+    synthetic_df.to_csv(csv_path, index=False)
+    with open(pkl_path, 'wb') as f:
+        pickle.dump(make_artifact(DecisionTreeClassifier(max_depth=6, random_state=0)), f)
+
+    assert tree_kernel.main([str(csv_path), str(pkl_path)]) == 0
+    monkeypatch.setattr(tree_kernel, 'check_parity', lambda *args: 3)
+    assert tree_kernel.main([str(csv_path), str(pkl_path)]) == 1
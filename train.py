@@ -0,0 +1,544 @@
+# ==============================================================================
+# PIPELINE TRAINING (PARALEL + CACHE)
+# ==============================================================================
+# Dulu notebook melatih setiap model berkali-kali: di loop perbandingan, lagi
+# di sel classification report, lagi di sel confusion matrix, dan setiap sel
+# menjalankan ulang GridSearchCV (cv=5) dari nol.
+#
+# Di sini setiap kandidat dilatih SEKALI:
+#   - baseline (setting default) dilatih 1x pada data train,
+#   - setiap kombinasi parameter x setiap fold CV dilatih 1x,
+#   - kombinasi terbaik dilatih ulang 1x pada seluruh data train.
+# Semua pekerjaan dijalankan paralel dengan process pool, dan hasilnya
+# (model yang sudah dilatih + prediksi test, atau skor fold CV) disimpan di
+# .cache/train/ dengan kunci hash data + nama model + parameter. Menjalankan
+# ulang dengan data & grid yang sama langsung memakai cache; menambah satu
+# nilai parameter hanya melatih kombinasi yang baru.
+#
+# Hasilnya sama dengan GridSearchCV(cv=5) di notebook: fold StratifiedKFold
+# yang sama, skor akurasi yang sama, dan aturan pemilihan parameter terbaik
+# yang sama (rata-rata tertinggi, jika seri ambil yang muncul duluan).
+#
+# Cara pakai:
+#   python train.py                   # latih, cetak laporan, simpan diabetes_model.pkl + diabetes_model/
+#   python train.py --jobs 4 --no-cache
+#   python train.py --search halving  # successive halving, cocok untuk grid yang besar
+import argparse
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import sklearn
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from sklearn.model_selection import ParameterGrid, StratifiedKFold, train_test_split
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+DEFAULT_CSV_PATH = 'diabetes_dataset.csv'
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'train')
+CV_FOLDS = 5
+
+TARGET = 'diagnosed_diabetes'
+FEATURES = [
+    'age', 'gender', 'bmi', 'glucose_fasting',
+    'family_history_diabetes', 'hypertension_history', 'smoking_status',
+    'physical_activity_minutes_per_week', 'cholesterol_total',
+]
+
+# Sama dengan `model_params` di model.ipynb
+MODEL_PARAMS = {
+    'K-Nearest Neighbors': {
+        'model': KNeighborsClassifier(),
+        'params': {
+            'n_neighbors': [3, 5, 7, 9, 11],
+            'weights': ['uniform', 'distance'],
+        },
+    },
+    'Naive Bayes': {
+        'model': GaussianNB(),
+        'params': {
+            'var_smoothing': [1e-9, 1e-8, 1e-7],
+        },
+    },
+    'Decision Tree': {
+        'model': DecisionTreeClassifier(random_state=42),
+        'params': {
+            'criterion': ['gini', 'entropy'],
+            'max_depth': [None, 5, 10, 20],
+            'min_samples_split': [2, 5, 10],
+        },
+    },
+}
+
+
+# ==============================================================================
+# 1. PERSIAPAN DATA (SAMA DENGAN SEL PRE-PROCESSING DI NOTEBOOK)
+# ==============================================================================
+def prepare_data(df, test_size=0.2, random_state=42):
+    """Encoding, scaling, dan train-test split seperti di model.ipynb."""
+    df = df.copy()
+    le_gender = LabelEncoder()
+    df['gender'] = le_gender.fit_transform(df['gender'])
+    le_smoking = LabelEncoder()
+    df['smoking_status'] = le_smoking.fit_transform(df['smoking_status'])
+
+    X = df[FEATURES]
+    y = df[TARGET]
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=test_size, random_state=random_state)
+    return {
+        'X_train': X_train, 'X_test': X_test,
+        'y_train': np.asarray(y_train), 'y_test': np.asarray(y_test),
+        'scaler': scaler, 'encoder_gender': le_gender, 'encoder_smoking': le_smoking,
+    }
+
+
+def data_key(*arrays):
+    """Hash isi array; berubah jika data train/test berubah sedikit saja."""
+    h = hashlib.sha256(sklearn.__version__.encode())
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(str((arr.dtype.str, arr.shape)).encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+# ==============================================================================
+# 2. CACHE HASIL DI DISK
+# ==============================================================================
+class ResultCache:
+    """Simpan hasil tugas training (pickle) di folder, satu file per kunci."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, enabled=True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        if enabled:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.pkl')
+
+    def get(self, key):
+        if self.enabled and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), 'rb') as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        tmp_path = f'{self._path(key)}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, self._path(key))
+
+
+# ==============================================================================
+# 3. TUGAS YANG DIJALANKAN DI PROSES WORKER
+# ==============================================================================
+# Data dikirim SEKALI ke setiap worker lewat initializer, bukan di setiap tugas
+_worker_data = {}
+
+
+def _init_worker(data, folds):
+    _worker_data['data'] = data
+    _worker_data['folds'] = folds
+
+
+def _run_task(task):
+    """Jalankan satu tugas: 'fit' (latih penuh + prediksi test) atau 'cv' (1 fold)."""
+    kind, estimator, params, fold = task
+    data = _worker_data['data']
+    model = clone(estimator).set_params(**params)
+    start = time.perf_counter()
+
+    if kind == 'cv':
+        train_idx, val_idx = _worker_data['folds'][fold]
+        model.fit(data['X_train'][train_idx], data['y_train'][train_idx])
+        score = accuracy_score(data['y_train'][val_idx], model.predict(data['X_train'][val_idx]))
+        return {'score': score, 'seconds': time.perf_counter() - start}
+
+    model.fit(data['X_train'], data['y_train'])
+    y_pred = model.predict(data['X_test'])
+    return {
+        'model': model,
+        'y_pred': y_pred,
+        'accuracy': accuracy_score(data['y_test'], y_pred),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def run_tasks(tasks, data, folds, cache, dkey, n_jobs=None):
+    """Jalankan tugas yang belum ada di cache secara paralel.
+
+    `tasks` adalah dict {nama_tugas: (kind, estimator, params, fold)}.
+    """
+    results, todo = {}, {}
+    for name, task in tasks.items():
+        kind, estimator, params, fold = task
+        key = cache.key(dkey, kind, type(estimator).__name__, sorted(estimator.get_params().items()),
+                        sorted(params.items()), fold)
+        cached = cache.get(key)
+        if cached is not None:
+            # Ditandai agar waktu yang tercatat tidak dikira waktu proses ini
+            results[name] = dict(cached, from_cache=True)
+        else:
+            todo[name] = (key, task)
+
+    if todo:
+        if n_jobs == 1:
+            _init_worker(data, folds)
+            outputs = map(_run_task, [task for _, task in todo.values()])
+        else:
+            pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(data, folds))
+            outputs = pool.map(_run_task, [task for _, task in todo.values()])
+        try:
+            for (name, (key, _)), output in zip(todo.items(), outputs):
+                cache.put(key, output)
+                results[name] = output
+        finally:
+            if n_jobs != 1:
+                pool.shutdown()
+    return results
+
+
+# ==============================================================================
+# 4. MODE PENCARIAN: GRID PENUH ATAU SUCCESSIVE HALVING
+# ==============================================================================
+# Grid penuh melatih SEMUA kombinasi x 5 fold di seluruh data train.
+# Successive halving memulai semua kombinasi dengan sebagian kecil data,
+# lalu hanya 1/factor kandidat terbaik yang lanjut ke putaran berikutnya
+# dengan data factor kali lebih banyak. Putaran terakhir memakai seluruh
+# data train dengan fold yang sama seperti grid penuh.
+HALVING_FACTOR = 3
+HALVING_MIN_RESOURCES = 1000
+HALVING_SEED = 42
+
+
+def halving_schedule(n_candidates, n_samples, factor=HALVING_FACTOR, min_resources=HALVING_MIN_RESOURCES):
+    """Daftar (jumlah_kandidat, jumlah_data) untuk setiap putaran."""
+    counts = []
+    while n_candidates > 1:
+        counts.append(n_candidates)
+        n_candidates = -(-n_candidates // factor)
+    n_rungs = len(counts)
+    return [(count, min(n_samples, max(min_resources, n_samples // factor ** (n_rungs - 1 - i))))
+            for i, count in enumerate(counts)]
+
+
+def fold_id(resources, fold, n_samples):
+    # Putaran dengan seluruh data memakai fold yang sama dengan grid penuh (berbagi cache)
+    return fold if resources >= n_samples else ('halving', HALVING_SEED, resources, fold)
+
+
+def halving_folds(y, resources_list):
+    """Fold CV untuk setiap ukuran subset. Subset = r baris pertama dari urutan acak tetap."""
+    order = np.random.default_rng(HALVING_SEED).permutation(len(y))
+    folds = {}
+    for resources in set(resources_list):
+        if resources >= len(y):
+            continue
+        subset = order[:resources]
+        for fold, (train_idx, val_idx) in enumerate(StratifiedKFold(n_splits=CV_FOLDS).split(subset, y[subset])):
+            folds[fold_id(resources, fold, len(y))] = (subset[train_idx], subset[val_idx])
+    return folds
+
+
+def select_grid(stage1, model_params, grids):
+    """Pilih parameter terbaik: rata-rata skor CV tertinggi (seri -> yang pertama)."""
+    best_params, cv_results = {}, {}
+    for name in model_params:
+        scores = np.array([[stage1[(name, 'cv', i, fold)]['score'] for fold in range(CV_FOLDS)]
+                           for i in range(len(grids[name]))])
+        means = scores.mean(axis=1)
+        best = int(np.argmax(means))
+        best_params[name] = grids[name][best]
+        cv_results[name] = {'params': grids[name], 'mean_test_score': means, 'fold_scores': scores}
+    return best_params, cv_results
+
+
+def run_halving(run, model_params, grids, schedules, n_samples):
+    """Jalankan successive halving untuk semua model, putaran demi putaran.
+
+    Putaran ke-k semua model dijalankan bersamaan agar process pool tetap penuh.
+    """
+    start = time.perf_counter()
+    survivors = {name: list(range(len(grids[name]))) for name in model_params}
+    # Per kandidat: (jumlah_data, rata-rata detik per fold) pada putaran terakhirnya
+    last_cost = {name: {} for name in model_params}
+    rung_log, cv_results = [], {name: {'params': grids[name], 'rungs': []} for name in model_params}
+    cpu_seconds = 0.0
+    from_cache = False
+
+    n_rungs = max((len(schedule) for schedule in schedules.values()), default=0)
+    for rung in range(n_rungs):
+        tasks = {}
+        for name, config in model_params.items():
+            if rung >= len(schedules[name]):
+                continue
+            _, resources = schedules[name][rung]
+            for i in survivors[name]:
+                for fold in range(CV_FOLDS):
+                    tasks[(name, i, fold)] = ('cv', config['model'], grids[name][i],
+                                              fold_id(resources, fold, n_samples))
+        outputs = run(tasks)
+        from_cache = from_cache or any(out.get('from_cache') for out in outputs.values())
+
+        for name in model_params:
+            if rung >= len(schedules[name]):
+                continue
+            n_candidates, resources = schedules[name][rung]
+            means = {}
+            for i in survivors[name]:
+                fold_out = [outputs[(name, i, fold)] for fold in range(CV_FOLDS)]
+                means[i] = float(np.mean([out['score'] for out in fold_out]))
+                seconds = [out['seconds'] for out in fold_out]
+                cpu_seconds += sum(seconds)
+                last_cost[name][i] = (resources, float(np.mean(seconds)))
+            # Urutkan skor tertinggi dulu; jika seri, urutan grid yang lebih awal menang
+            ranked = sorted(survivors[name], key=lambda i: (-means[i], i))
+            n_keep = -(-n_candidates // HALVING_FACTOR)
+            survivors[name] = ranked[:n_keep]
+            cv_results[name]['rungs'].append({'resources': resources, 'mean_test_score': means})
+            rung_log.append({
+                'Model': name,
+                'Putaran': rung + 1,
+                'Jumlah Data': resources,
+                'Kandidat': n_candidates,
+                'Skor CV Terbaik': means[ranked[0]],
+            })
+
+    wall = time.perf_counter() - start
+    search = {
+        'mode': 'halving',
+        'rungs': rung_log,
+        'seconds': wall,
+        'cpu_seconds': cpu_seconds,
+        'from_cache': from_cache,
+    }
+    if not from_cache:
+        # PERKIRAAN biaya grid penuh: setiap kandidat x 5 fold di seluruh data,
+        # diekstrapolasi linear dari ukuran data di putaran terakhir kandidat itu.
+        # Tidak dihitung jika sebagian hasil dari cache: waktu di cache berasal
+        # dari proses lain, jadi tidak bisa dibandingkan dengan waktu proses ini.
+        grid_cpu = sum(CV_FOLDS * seconds * n_samples / resources
+                       for costs in last_cost.values() for resources, seconds in costs.values())
+        speedup = cpu_seconds / wall if wall > 0 and cpu_seconds > 0 else 1.0
+        search['estimated_grid_cpu_seconds'] = grid_cpu
+        search['estimated_grid_seconds'] = grid_cpu / speedup
+        search['estimated_saved_seconds'] = search['estimated_grid_seconds'] - wall
+    best_params = {name: grids[name][survivors[name][0]] for name in model_params}
+    return best_params, cv_results, search
+
+
+# ==============================================================================
+# 5. PIPELINE LENGKAP
+# ==============================================================================
+def run_pipeline(data, model_params=MODEL_PARAMS, n_jobs=None, cache_dir=DEFAULT_CACHE_DIR, use_cache=True,
+                 search='grid'):
+    """Latih baseline + tuning semua model, lalu kembalikan semua hasilnya.
+
+    `search` = 'grid' (semua kombinasi, sama seperti GridSearchCV) atau
+    'halving' (successive halving, lihat run_halving).
+    Hasil berisi 'comparison_log' (format yang sama dengan history di file
+    model), model & prediksi baseline/tuned per model, dan model juara.
+    """
+    if search not in ('grid', 'halving'):
+        raise ValueError(f"Mode pencarian '{search}' tidak dikenal (pilih 'grid' atau 'halving')")
+
+    start = time.perf_counter()
+    cache = ResultCache(cache_dir, enabled=use_cache)
+    worker_data = {key: np.asarray(data[key]) for key in ('X_train', 'y_train', 'X_test', 'y_test')}
+    dkey = data_key(*worker_data.values())
+    n_samples = len(worker_data['y_train'])
+    folds = dict(enumerate(StratifiedKFold(n_splits=CV_FOLDS).split(worker_data['X_train'], worker_data['y_train'])))
+
+    grids = {name: list(ParameterGrid(config['params'])) for name, config in model_params.items()}
+    if search == 'halving':
+        schedules = {name: halving_schedule(len(grids[name]), n_samples) for name in model_params}
+        folds.update(halving_folds(worker_data['y_train'],
+                                   [r for schedule in schedules.values() for _, r in schedule]))
+
+    def run(tasks):
+        return run_tasks(tasks, worker_data, folds, cache, dkey, n_jobs)
+
+    # Tahap 1: semua baseline (+ semua kombinasi parameter x fold untuk grid penuh), sekaligus
+    tasks = {}
+    for name, config in model_params.items():
+        tasks[(name, 'baseline')] = ('fit', config['model'], {}, None)
+        if search == 'grid':
+            for i, params in enumerate(grids[name]):
+                for fold in range(CV_FOLDS):
+                    tasks[(name, 'cv', i, fold)] = ('cv', config['model'], params, fold)
+    stage1 = run(tasks)
+
+    if search == 'grid':
+        best_params, cv_results = select_grid(stage1, model_params, grids)
+        search_info = {'mode': 'grid'}
+    else:
+        best_params, cv_results, search_info = run_halving(run, model_params, grids, schedules, n_samples)
+
+    # Tahap 2: latih ulang kombinasi terbaik di seluruh data train
+    refit_tasks = {(name, 'tuned'): ('fit', config['model'], best_params[name], None)
+                   for name, config in model_params.items()}
+    stage2 = run(refit_tasks)
+
+    baseline, tuned, comparison_log = {}, {}, []
+    for name in model_params:
+        baseline[name] = stage1[(name, 'baseline')]
+        tuned[name] = dict(stage2[(name, 'tuned')], best_params=best_params[name], cv=cv_results[name])
+        comparison_log.append({
+            'Model': name,
+            'Akurasi Awal': baseline[name]['accuracy'],
+            'Akurasi Tuned': tuned[name]['accuracy'],
+            'Improvement': tuned[name]['accuracy'] - baseline[name]['accuracy'],
+        })
+
+    best_name = max(tuned, key=lambda name: tuned[name]['accuracy'])
+    return {
+        'baseline': baseline,
+        'tuned': tuned,
+        'comparison_log': comparison_log,
+        'best_name': best_name,
+        'search': search_info,
+        'y_test': worker_data['y_test'],
+        'seconds': time.perf_counter() - start,
+        'cache_hits': cache.hits,
+        'cache_misses': cache.misses,
+    }
+
+
+def build_artifact(results, data):
+    """Susun dict artifact yang sama dengan sel terakhir di model.ipynb."""
+    best_name = results['best_name']
+    return {
+        'model': results['tuned'][best_name]['model'],
+        'scaler': data['scaler'],
+        'encoder_gender': data['encoder_gender'],
+        'encoder_smoking': data['encoder_smoking'],
+        'model_name': best_name,
+        'accuracy': results['tuned'][best_name]['accuracy'],
+        'feature_names': FEATURES,
+        'history': results['comparison_log'],
+    }
+
+
+# ==============================================================================
+# 6. LAPORAN (DARI HASIL YANG SUDAH ADA, TANPA MELATIH ULANG)
+# ==============================================================================
+def print_comparison(results):
+    print(f"{'Nama Model':<20} | {'Nilai Awal':<12} | {'Nilai Akhir':<12} | {'Kenaikan':<10}")
+    print("-" * 65)
+    for row in results['comparison_log']:
+        print(f"{row['Model']:<20} | {row['Akurasi Awal']:.2%}     | {row['Akurasi Tuned']:.2%}     | {row['Improvement']:+.2%}")
+
+
+def print_search_summary(results):
+    """Ringkasan successive halving: putaran dan perkiraan waktu yang dihemat dibanding grid penuh."""
+    search = results['search']
+    if search['mode'] != 'halving':
+        return
+    print(f"{'Model':<20} | {'Putaran':>7} | {'Jumlah Data':>11} | {'Kandidat':>8} | {'Skor CV Terbaik':>15}")
+    print("-" * 75)
+    for row in search['rungs']:
+        print(f"{row['Model']:<20} | {row['Putaran']:>7} | {row['Jumlah Data']:>11} | "
+              f"{row['Kandidat']:>8} | {row['Skor CV Terbaik']:>15.2%}")
+    if search.get('from_cache'):
+        print(f"\nWaktu halving: {search['seconds']:.1f} detik (sebagian hasil dari cache, "
+              f"perkiraan penghematan dibanding grid penuh tidak dihitung)")
+        return
+    print(f"\nWaktu halving: {search['seconds']:.1f} detik, perkiraan grid penuh (ekstrapolasi): "
+          f"~{search['estimated_grid_seconds']:.1f} detik -> perkiraan hemat ~{search['estimated_saved_seconds']:.1f} detik")
+
+
+def print_reports(results):
+    for name in results['tuned']:
+        print("\n====================================")
+        print(f"Model: {name}  (parameter terbaik: {results['tuned'][name]['best_params']})")
+        for stage in ('baseline', 'tuned'):
+            label = 'Baseline' if stage == 'baseline' else 'Tuned'
+            print(f"\nClassification Report ({label}) - {name}")
+            print(classification_report(results['y_test'], results[stage][name]['y_pred']))
+
+
+def confusion_matrices(results):
+    """{(nama_model, 'baseline'/'tuned'): confusion matrix}"""
+    return {(name, stage): confusion_matrix(results['y_test'], results[stage][name]['y_pred'])
+            for name in results['tuned'] for stage in ('baseline', 'tuned')}
+
+
+def plot_confusion_matrices(results):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    for (name, stage), cm in confusion_matrices(results).items():
+        label = 'Baseline' if stage == 'baseline' else 'Tuned'
+        sns.heatmap(cm, annot=True, fmt="d", cmap="Blues")
+        plt.xlabel("Predicted")
+        plt.ylabel("Actual")
+        plt.title(f"Confusion Matrix ({label}) - {name}")
+        plt.show()
+
+
+def save_artifact(artifact, filename='diabetes_model.pkl', compact_dir='diabetes_model'):
+    from artifact_io import export_artifact
+
+    # Tulis ke file sementara dulu, lalu ganti sekaligus: aplikasi yang sedang
+    # berjalan tidak pernah membaca file pkl yang setengah jadi
+    tmp_path = f'{filename}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(artifact, f)
+    os.replace(tmp_path, filename)
+    if compact_dir:
+        export_artifact(artifact, compact_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Training model diabetes (paralel + cache)")
+    parser.add_argument('--csv', default=DEFAULT_CSV_PATH)
+    parser.add_argument('--jobs', type=int, default=None, help="Jumlah proses (default: semua core)")
+    parser.add_argument('--no-cache', action='store_true', help="Latih ulang semua tanpa cache")
+    parser.add_argument('--search', choices=['grid', 'halving'], default='grid',
+                        help="grid = semua kombinasi; halving = successive halving (lebih cepat)")
+    parser.add_argument('--output', default='diabetes_model.pkl')
+    parser.add_argument('--compact-dir', default='diabetes_model')
+    args = parser.parse_args(argv)
+
+    from dataset_cache import load_dataset
+
+    data = prepare_data(load_dataset(args.csv))
+    results = run_pipeline(data, n_jobs=args.jobs, use_cache=not args.no_cache, search=args.search)
+
+    print_search_summary(results)
+    print_comparison(results)
+    print_reports(results)
+    print(f"\n🏆 JUARA UMUM ADALAH: {results['best_name']}")
+    print(f"Waktu: {results['seconds']:.1f} detik "
+          f"(cache: {results['cache_hits']} dipakai, {results['cache_misses']} dilatih)")
+
+    save_artifact(build_artifact(results, data), args.output, args.compact_dir)
+    print(f"✅ Berhasil! File tersimpan sebagai '{args.output}'")
+
+
+if __name__ == '__main__':
+    main()
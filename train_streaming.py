@@ -0,0 +1,351 @@
+# ==============================================================================
+# TRAINING OUT-OF-CORE (DATASET LEBIH BESAR DARI MEMORI)
+# ==============================================================================
+# train.py / model.ipynb membaca seluruh CSV dengan pandas lalu membuat
+# salinan untuk X, y, matriks hasil scaling, dan hasil train_test_split.
+# Memori puncak jadi beberapa kali ukuran dataset.
+#
+# Di sini data tidak pernah dimuat utuh ke memori:
+#   1. CSV dibaca SEKALI per chunk. Kategori gender & smoking_status dikumpulkan
+#      sambil jalan, dan fitur ditulis ke file biner di .cache/streaming/
+#      (kategori sementara diberi kode menurut urutan kemunculan).
+#   2. Setelah semua kategori diketahui, encoder dibuat (urutan kelas sama
+#      dengan LabelEncoder.fit di notebook) dan kode di file diperbaiki.
+#      Scaler di-fit dengan StandardScaler.partial_fit per chunk, lalu matriks
+#      di-scale di tempat. Semua langkah ini membaca file lewat memory-map.
+#   3. Train/test split dilakukan pada INDEKS baris (train_test_split dengan
+#      test_size & random_state yang sama, jadi barisnya sama persis dengan
+#      train.py), bukan dengan menyalin matriks.
+#   4. Naive Bayes dilatih per chunk (partial_fit). KNN & Decision Tree butuh
+#      semua baris sekaligus, jadi dilatih pada baris train yang dimuat ke
+#      memori, maks. MAX_IN_MEMORY_ROWS baris (sampel terstratifikasi jika lebih).
+#   5. Parameter terbaik dicari dengan train.run_pipeline pada sampel
+#      terstratifikasi maks. TUNE_ROWS baris train, lalu model baseline &
+#      tuned dilatih dengan cara di atas dan dinilai pada SELURUH data test per chunk.
+#
+# Memori puncak setiap tahap (alokasi Python & NumPy, diukur dengan
+# tracemalloc) dan RSS puncak proses dicetak di akhir.
+#
+# Cara pakai:
+#   python train_streaming.py --csv diabetes_dataset.csv
+#   python train_streaming.py --chunk-rows 100000 --max-in-memory-rows 500000 --tune-rows 50000
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from train import (DEFAULT_CSV_PATH, FEATURES, MODEL_PARAMS, TARGET, build_artifact, print_comparison,
+                   print_reports, print_search_summary, run_pipeline, save_artifact)
+
+DEFAULT_WORK_DIR = os.path.join('.cache', 'streaming')
+CHUNK_ROWS = 200_000
+MAX_IN_MEMORY_ROWS = 1_000_000
+TUNE_ROWS = 100_000
+CATEGORICAL = {'gender': 'encoder_gender', 'smoking_status': 'encoder_smoking'}
+
+
+# ==============================================================================
+# 1. PENCATAT MEMORI PER TAHAP
+# ==============================================================================
+def peak_rss_bytes():
+    """RSS puncak proses (termasuk halaman file memory-map yang sedang ada di RAM)."""
+    try:
+        import resource
+    except ImportError:
+        from app_metrics import process_rss_bytes
+        return process_rss_bytes()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+class MemoryReport:
+    """Catat waktu & memori puncak (tracemalloc) setiap tahap training."""
+
+    def __init__(self):
+        self.stages = []
+        self._start = None
+
+    def __enter__(self):
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        tracemalloc.stop()
+
+    def begin(self):
+        tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    def end(self, stage):
+        _, peak = tracemalloc.get_traced_memory()
+        self.stages.append({'Tahap': stage, 'Detik': time.perf_counter() - self._start, 'Puncak MB': peak / 1e6})
+
+    @property
+    def peak_mb(self):
+        return max((row['Puncak MB'] for row in self.stages), default=0.0)
+
+    def print(self):
+        print(f"{'Tahap':<46} | {'Detik':>7} | {'Memori Puncak':>13}")
+        print("-" * 73)
+        for row in self.stages:
+            print(f"{row['Tahap']:<46} | {row['Detik']:>7.1f} | {row['Puncak MB']:>10.1f} MB")
+        print(f"\nMemori puncak (Python & NumPy): {self.peak_mb:.1f} MB, "
+              f"RSS puncak proses: {peak_rss_bytes() / 1e6:.1f} MB")
+
+
+# ==============================================================================
+# 2. CSV -> MATRIKS FITUR DI DISK (SATU KALI BACA)
+# ==============================================================================
+def _frame(block):
+    # Scaler di-fit dengan nama kolom, sama seperti prepare_data di train.py
+    return pd.DataFrame(block, columns=FEATURES)
+
+
+def _row_blocks(n_rows, chunk_rows):
+    for start in range(0, n_rows, chunk_rows):
+        yield slice(start, min(start + chunk_rows, n_rows))
+
+
+def build_feature_store(csv_path, work_dir=DEFAULT_WORK_DIR, chunk_rows=CHUNK_ROWS):
+    """Tulis fitur (sudah di-encode & di-scale) dan target ke file memory-map.
+
+    Mengembalikan dict berisi X (memmap float64, n_baris x n_fitur), y (memmap
+    int64), scaler, dan encoder, siap dipakai seperti hasil prepare_data.
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    x_path = os.path.join(work_dir, 'features.f64')
+    y_path = os.path.join(work_dir, 'target.i64')
+    columns = {name: FEATURES.index(name) for name in CATEGORICAL}
+    seen = {name: {} for name in CATEGORICAL}  # nilai kategori -> kode sementara
+
+    n_rows = 0
+    with open(x_path, 'wb') as fx, open(y_path, 'wb') as fy:
+        for chunk in pd.read_csv(csv_path, usecols=FEATURES + [TARGET], chunksize=chunk_rows):
+            for name in CATEGORICAL:
+                if chunk[name].isna().any():
+                    raise ValueError(f"Kolom '{name}' berisi nilai kosong (baris sekitar {n_rows + 1})")
+                codes = seen[name]
+                for value in chunk[name].unique():
+                    codes.setdefault(value, len(codes))
+                chunk[name] = chunk[name].map(codes)
+            fx.write(chunk[FEATURES].to_numpy(dtype=np.float64).tobytes())
+            fy.write(chunk[TARGET].to_numpy(dtype=np.int64).tobytes())
+            n_rows += len(chunk)
+    if n_rows == 0:
+        raise ValueError(f"File '{csv_path}' tidak berisi data")
+
+    X = np.memmap(x_path, dtype=np.float64, mode='r+', shape=(n_rows, len(FEATURES)))
+    y = np.memmap(y_path, dtype=np.int64, mode='r', shape=(n_rows,))
+
+    # Encoder: kelas diurutkan, sama dengan LabelEncoder.fit pada seluruh kolom
+    encoders, lookups = {}, {}
+    for name, key in CATEGORICAL.items():
+        encoder = LabelEncoder().fit(np.array(list(seen[name]), dtype=object))
+        lookup = np.empty(len(seen[name]))
+        for value, code in seen[name].items():
+            lookup[code] = np.searchsorted(encoder.classes_, value)
+        encoders[key], lookups[name] = encoder, lookup
+
+    scaler = StandardScaler()
+    for block in _row_blocks(n_rows, chunk_rows):
+        for name, j in columns.items():
+            X[block, j] = lookups[name][X[block, j].astype(np.intp)]
+        scaler.partial_fit(_frame(X[block]))
+    for block in _row_blocks(n_rows, chunk_rows):
+        X[block] = scaler.transform(_frame(X[block]))
+    X.flush()
+    return {'X': X, 'y': y, 'n_rows': n_rows, 'scaler': scaler, **encoders}
+
+
+def split_indices(n_rows, test_size=0.2, random_state=42):
+    """Indeks baris train & test, sama persis dengan train_test_split di prepare_data."""
+    return train_test_split(np.arange(n_rows), test_size=test_size, random_state=random_state)
+
+
+def take_rows(store, idx, chunk_rows=CHUNK_ROWS):
+    """Muat baris `idx` (urutan dipertahankan) dari memmap ke array di memori, per chunk."""
+    X = np.empty((len(idx), store['X'].shape[1]))
+    for block in _row_blocks(len(idx), chunk_rows):
+        X[block] = store['X'][idx[block]]
+    return X, np.asarray(store['y'][idx])
+
+
+def sample_rows(store, idx, max_rows, random_state=42):
+    """Sampel terstratifikasi maks. `max_rows` indeks dari `idx` (semua jika sudah cukup kecil)."""
+    if len(idx) <= max_rows:
+        return idx
+    # Sampel per kelas dengan NumPy saja: train_test_split(stratify=...) jauh
+    # lebih lambat saat tracemalloc menyala
+    rng = np.random.default_rng(random_state)
+    y = np.asarray(store['y'][idx])
+    classes, counts = np.unique(y, return_counts=True)
+    sizes = counts * max_rows // len(idx)
+    parts = [rng.permutation(np.flatnonzero(y == c))[:size] for c, size in zip(classes, sizes)]
+    # Diurutkan agar baris dibaca dari file secara berurutan
+    return idx[np.sort(np.concatenate(parts))]
+
+
+# ==============================================================================
+# 3. LATIH & NILAI MODEL PER CHUNK
+# ==============================================================================
+def fit_model(estimator, store, train_idx, in_memory=None, chunk_rows=CHUNK_ROWS):
+    """Latih per chunk jika model punya partial_fit, jika tidak pakai baris di memori.
+
+    `in_memory` = (X, y) baris train yang sudah dimuat (lihat take_rows).
+    """
+    model = clone(estimator)
+    if not hasattr(model, 'partial_fit'):
+        model.fit(*in_memory)
+        return model
+
+    # Baris diurutkan agar file dibaca berurutan; hasil partial_fit tidak
+    # bergantung pada urutan baris
+    idx = np.sort(train_idx)
+    classes = np.unique(store['y'])
+    for block in _row_blocks(len(idx), chunk_rows):
+        rows = idx[block]
+        model.partial_fit(store['X'][rows], store['y'][rows], classes=classes)
+    return model
+
+
+def predict_rows(model, store, idx, chunk_rows=CHUNK_ROWS):
+    y_pred = None
+    for block in _row_blocks(len(idx), chunk_rows):
+        part = model.predict(store['X'][idx[block]])
+        if y_pred is None:
+            y_pred = np.empty(len(idx), dtype=part.dtype)
+        y_pred[block] = part
+    return y_pred
+
+
+# ==============================================================================
+# 4. PIPELINE LENGKAP
+# ==============================================================================
+def tune_params(store, train_idx, test_idx, tune_rows, model_params, search, n_jobs):
+    """Cari parameter terbaik dengan train.run_pipeline pada sampel data train."""
+    if tune_rows <= 0:
+        return {name: {} for name in model_params}, {'mode': 'none'}
+    tune_train = sample_rows(store, train_idx, tune_rows)
+    tune_test = sample_rows(store, test_idx, max(1, tune_rows * len(test_idx) // len(train_idx)))
+    X_train, y_train = take_rows(store, tune_train)
+    X_test, y_test = take_rows(store, tune_test)
+    data = {'X_train': X_train, 'y_train': y_train, 'X_test': X_test, 'y_test': y_test}
+    results = run_pipeline(data, model_params, n_jobs=n_jobs, search=search)
+    return {name: results['tuned'][name]['best_params'] for name in model_params}, results['search']
+
+
+def run_streaming(csv_path=DEFAULT_CSV_PATH, model_params=MODEL_PARAMS, work_dir=DEFAULT_WORK_DIR,
+                  chunk_rows=CHUNK_ROWS, max_in_memory_rows=MAX_IN_MEMORY_ROWS, tune_rows=TUNE_ROWS,
+                  search='grid', n_jobs=None, report=None):
+    """Pipeline out-of-core. Hasilnya berformat sama dengan train.run_pipeline.
+
+    Mengembalikan (results, store); `store` berisi scaler & encoder untuk build_artifact.
+    """
+    report = report or MemoryReport()
+    start = time.perf_counter()
+
+    report.begin()
+    store = build_feature_store(csv_path, work_dir, chunk_rows)
+    report.end(f"Baca CSV + encoding + scaling ({store['n_rows']} baris)")
+
+    report.begin()
+    train_idx, test_idx = split_indices(store['n_rows'])
+    best_params, search_info = tune_params(store, train_idx, test_idx, tune_rows, model_params, search, n_jobs)
+    report.end(f"Split indeks + tuning ({min(tune_rows, len(train_idx))} baris)")
+
+    # Model tanpa partial_fit memakai baris train yang sama (dimuat sekali)
+    in_memory = None
+    fit_rows = {name: len(train_idx) for name in model_params}
+    if any(not hasattr(config['model'], 'partial_fit') for config in model_params.values()):
+        report.begin()
+        memory_idx = sample_rows(store, train_idx, max_in_memory_rows)
+        in_memory = take_rows(store, memory_idx, chunk_rows)
+        report.end(f"Muat baris train ke memori ({len(memory_idx)} baris)")
+        for name, config in model_params.items():
+            if not hasattr(config['model'], 'partial_fit'):
+                fit_rows[name] = len(memory_idx)
+
+    y_test = np.asarray(store['y'][test_idx])
+    baseline, tuned, comparison_log = {}, {}, []
+    for name, config in model_params.items():
+        report.begin()
+        stages = {}
+        for stage, params in (('baseline', {}), ('tuned', best_params[name])):
+            model = fit_model(clone(config['model']).set_params(**params), store, train_idx, in_memory, chunk_rows)
+            y_pred = predict_rows(model, store, test_idx, chunk_rows)
+            stages[stage] = {'model': model, 'y_pred': y_pred, 'accuracy': accuracy_score(y_test, y_pred)}
+        baseline[name] = stages['baseline']
+        tuned[name] = dict(stages['tuned'], best_params=best_params[name], train_rows=fit_rows[name])
+        comparison_log.append({
+            'Model': name,
+            'Akurasi Awal': baseline[name]['accuracy'],
+            'Akurasi Tuned': tuned[name]['accuracy'],
+            'Improvement': tuned[name]['accuracy'] - baseline[name]['accuracy'],
+        })
+        mode = 'per chunk' if hasattr(config['model'], 'partial_fit') else 'di memori'
+        report.end(f"{name} ({mode}, {fit_rows[name]} baris)")
+
+    best_name = max(tuned, key=lambda name: tuned[name]['accuracy'])
+    results = {
+        'baseline': baseline,
+        'tuned': tuned,
+        'comparison_log': comparison_log,
+        'best_name': best_name,
+        'search': search_info,
+        'y_test': y_test,
+        'seconds': time.perf_counter() - start,
+        'memory': report.stages,
+    }
+    return results, store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Training model diabetes tanpa memuat dataset utuh ke memori")
+    parser.add_argument('--csv', default=DEFAULT_CSV_PATH)
+    parser.add_argument('--work-dir', default=DEFAULT_WORK_DIR, help="Folder file matriks fitur (memory-map)")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="Baris per chunk baca/latih")
+    parser.add_argument('--max-in-memory-rows', type=int, default=MAX_IN_MEMORY_ROWS,
+                        help="Baris train maks. untuk KNN & Decision Tree")
+    parser.add_argument('--tune-rows', type=int, default=TUNE_ROWS,
+                        help="Baris train untuk mencari parameter terbaik (0 = pakai parameter default)")
+    parser.add_argument('--search', choices=['grid', 'halving'], default='grid')
+    parser.add_argument('--jobs', type=int, default=None, help="Jumlah proses untuk tuning")
+    parser.add_argument('--memory-report', default=None, help="Simpan laporan memori per tahap ke file JSON")
+    parser.add_argument('--output', default='diabetes_model.pkl')
+    parser.add_argument('--compact-dir', default='diabetes_model')
+    args = parser.parse_args(argv)
+
+    with MemoryReport() as report:
+        try:
+            results, store = run_streaming(args.csv, work_dir=args.work_dir, chunk_rows=args.chunk_rows,
+                                           max_in_memory_rows=args.max_in_memory_rows, tune_rows=args.tune_rows,
+                                           search=args.search, n_jobs=args.jobs, report=report)
+        except ValueError as e:
+            sys.exit(f"❌ Training dibatalkan: {e}")
+
+    print_search_summary(results)
+    print_comparison(results)
+    print_reports(results)
+    print(f"\n🏆 JUARA UMUM ADALAH: {results['best_name']}")
+    print(f"Waktu: {results['seconds']:.1f} detik\n")
+    report.print()
+    if args.memory_report:
+        with open(args.memory_report, 'w') as f:
+            json.dump({'stages': report.stages, 'peak_mb': report.peak_mb,
+                       'peak_rss_mb': peak_rss_bytes() / 1e6}, f, indent=2)
+
+    save_artifact(build_artifact(results, store), args.output, args.compact_dir)
+    print(f"✅ Berhasil! File tersimpan sebagai '{args.output}'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# ==============================================================================
+# MESIN INFERENSI DECISION TREE (NUMPY)
+# ==============================================================================
+# Model produksi adalah Decision Tree. Jalur biasa untuk memprediksi adalah:
+#   data mentah -> scaler.transform -> model.predict_proba
+# dan setiap panggilan sklearn melakukan validasi input yang memakan waktu.
+#
+# Modul ini "meratakan" pohon menjadi beberapa array (fitur, ambang batas,
+# anak kiri/kanan, probabilitas daun) dan MELIPAT StandardScaler ke dalam
+# ambang batas. Jadi data mentah bisa langsung dibandingkan tanpa scaling.
+# Semua baris ditelusuri bersamaan, satu level pohon per langkah.
+#
+# Hasil probabilitasnya identik (bit-per-bit) dengan sklearn. Cek dengan:
+#   python tree_kernel.py diabetes_dataset.csv [diabetes_model.pkl]   # kode keluar 1 jika ada yang berbeda
+import sys
+
+import numpy as np
+
+_SIGN_MASK = np.int64(0x7FFFFFFFFFFFFFFF)
+
+
+def _float_to_key(x):
+    """Ubah float64 jadi int64 yang urutannya sama dengan urutan nilai float."""
+    bits = np.asarray(x, dtype=np.float64).view(np.int64)
+    return np.where(bits >= 0, bits, -(bits & _SIGN_MASK))
+
+
+def _key_to_float(key):
+    key = np.asarray(key, dtype=np.int64)
+    bits = np.where(key >= 0, key, (-key) | ~_SIGN_MASK)
+    return bits.view(np.float64)
+
+
+def fold_thresholds(threshold, mean, scale):
+    """Hitung ambang batas pada data MENTAH yang setara dengan ambang batas scaled.
+
+    Di sklearn, sebuah baris masuk ke kiri jika
+        float32((x - mean) / scale) <= threshold
+    Fungsi di kiri tidak pernah turun saat x naik, jadi ada satu nilai float64
+    terbesar x* yang masih masuk ke kiri, dan syaratnya sama dengan x <= x*.
+    x* dicari dengan binary search atas representasi bit float64, sehingga
+    hasilnya tepat, bukan sekadar threshold * scale + mean yang bisa meleset
+    karena pembulatan.
+    """
+    def goes_left(key):
+        x = _key_to_float(key)
+        # Nilai sangat besar memang meluap jadi +-inf di float32, sama seperti sklearn
+        with np.errstate(over='ignore'):
+            scaled = ((x - mean) / scale).astype(np.float32)
+        return scaled <= threshold
+
+    # Invarian: goes_left(lo) benar, goes_left(hi) salah
+    lo = np.full(threshold.shape, _float_to_key(-np.inf), dtype=np.int64)
+    hi = np.full(threshold.shape, _float_to_key(np.inf), dtype=np.int64)
+    searching = goes_left(lo) & ~goes_left(hi)
+    while True:
+        active = searching & (hi - 1 > lo)
+        if not active.any():
+            break
+        # Titik tengah tanpa overflow int64
+        mid = (lo >> 1) + (hi >> 1) + (lo & hi & 1)
+        left = goes_left(mid)
+        lo = np.where(active & left, mid, lo)
+        hi = np.where(active & ~left, mid, hi)
+
+    folded = _key_to_float(lo)
+    # Ambang batas yang tidak pernah/selalu terpenuhi
+    folded = np.where(goes_left(lo), folded, -np.inf)
+    return np.where(goes_left(hi), np.inf, folded)
+
+
+class TreeKernel:
+    """Decision Tree yang sudah diratakan dan digabung dengan scaler.
+
+    `predict_proba` menerima data MENTAH (sebelum scaling), sama seperti
+    `scaler.transform` lalu `model.predict_proba` di sklearn.
+    """
+
+    def __init__(self, children_left, children_right, feature, threshold, value, mean, scale, classes):
+        is_leaf = children_left == -1
+        nodes = np.arange(len(children_left))
+
+        # Daun menunjuk ke dirinya sendiri, jadi penelusuran boleh berjalan
+        # sebanyak max_depth langkah untuk semua baris tanpa pengecekan daun
+        self.left = np.where(is_leaf, nodes, children_left).astype(np.intp)
+        self.right = np.where(is_leaf, nodes, children_right).astype(np.intp)
+        self.feature = np.where(is_leaf, 0, feature).astype(np.intp)
+
+        raw_threshold = np.full(len(nodes), np.inf)
+        split = ~is_leaf
+        f = feature[split]
+        raw_threshold[split] = fold_thresholds(threshold[split], mean[f], scale[f])
+        self.threshold = raw_threshold
+
+        # Probabilitas daun dihitung sekali, dengan operasi yang sama seperti sklearn
+        proba = np.array(value, dtype=np.float64)
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+        self.leaf_proba = proba
+
+        self.classes_ = np.asarray(classes)
+        self.max_depth = int(self._depth(children_left, children_right))
+
+        # Salinan list Python untuk jalur 1 baris (lebih cepat dari NumPy)
+        self._py_nodes = list(zip(self.feature.tolist(), self.threshold.tolist(),
+                                  self.left.tolist(), self.right.tolist(), is_leaf.tolist()))
+
+    @staticmethod
+    def _depth(children_left, children_right):
+        depth = np.zeros(len(children_left), dtype=np.intp)
+        for node in range(len(children_left)):
+            if children_left[node] != -1:
+                depth[children_left[node]] = depth[node] + 1
+                depth[children_right[node]] = depth[node] + 1
+        return depth.max()
+
+    @classmethod
+    def from_sklearn(cls, model, scaler):
+        tree = model.tree_
+        return cls(tree.children_left, tree.children_right, tree.feature, tree.threshold,
+                   tree.value[:, 0, :], scaler.mean_, scaler.scale_, model.classes_)
+
+    @classmethod
+    def from_compact(cls, model, scaler):
+        a = model.arrays
+        return cls(a['children_left'], a['children_right'], a['feature'], a['threshold'],
+                   a['value'], scaler.mean_, scaler.scale_, model.classes_)
+
+    def apply_one(self, x):
+        """Indeks daun untuk 1 baris (list/tuple angka mentah)."""
+        node = 0
+        nodes = self._py_nodes
+        while True:
+            feature, threshold, left, right, is_leaf = nodes[node]
+            if is_leaf:
+                return node
+            node = left if x[feature] <= threshold else right
+
+    def apply(self, X):
+        """Indeks daun untuk setiap baris, ditelusuri satu level per langkah."""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        flat = X.ravel()
+        offsets = np.arange(X.shape[0], dtype=np.intp) * X.shape[1]
+        node = np.zeros(X.shape[0], dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = flat[offsets + self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[0] == 1:
+            return self.leaf_proba[[self.apply_one(X[0].tolist())]]
+        return self.leaf_proba[self.apply(X)]
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def build_kernel(artifact):
+    """Buat TreeKernel dari artifact (pkl atau format ringkas), None jika bukan tree."""
+    model = artifact['model']
+    if type(model).__name__ == 'DecisionTreeClassifier':
+        return TreeKernel.from_sklearn(model, artifact['scaler'])
+    if getattr(model, 'model_type', None) == 'decision_tree':
+        return TreeKernel.from_compact(model, artifact['scaler'])
+    return None
+
+
+def check_parity(artifact, X_raw, kernel=None):
+    """Bandingkan probabilitas kernel dengan scaler + model asli pada data mentah.
+
+    Mengembalikan jumlah baris yang hasilnya berbeda (harus 0).
+    """
+    kernel = kernel or build_kernel(artifact)
+    X_raw = np.asarray(X_raw, dtype=np.float64)
+    expected = artifact['model'].predict_proba(artifact['scaler'].transform(X_raw))
+    actual = kernel.predict_proba(X_raw)
+    mismatched = (expected != actual).any(axis=1)
+    # Jalur 1 baris juga harus identik
+    for i in range(min(len(X_raw), 1000)):
+        if not np.array_equal(kernel.predict_proba(X_raw[i:i + 1])[0], expected[i]):
+            mismatched[i] = True
+    return int(mismatched.sum())
+
+
+def main(argv=None):
+    """Cek kernel vs sklearn pada file CSV; kode keluar 1 jika ada baris yang berbeda."""
+    import pandas as pd
+
+    from artifact_io import load_artifact
+    from prediction import encode_features
+
+    argv = sys.argv[1:] if argv is None else argv
+    artifact = load_artifact(argv[1] if len(argv) > 1 else None)
+    if artifact['kernel'] is None:
+        sys.exit(f"Model {artifact['model_name']} bukan Decision Tree, kernel tidak dipakai")
+    df = pd.read_csv(argv[0] if argv else 'diabetes_dataset.csv')
+    X_raw = encode_features(df, artifact)
+    n_bad = check_parity(artifact, X_raw, artifact['kernel'])
+    print(f"Baris dicek: {len(X_raw)}, berbeda dari sklearn: {n_bad}")
+    return 1 if n_bad else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,312 @@
+# ==============================================================================
+# UPDATE MODEL BERTAHAP (DATA PASIEN BARU)
+# ==============================================================================
+# Menambah data pasien baru dulu berarti menjalankan ulang seluruh
+# model.ipynb: baca ulang CSV, fit ulang encoder & scaler, grid search ulang,
+# lalu tulis ulang diabetes_model.pkl.
+#
+# Script ini hanya membaca baris BARU (per chunk) dan memperbarui model yang ada:
+#   - statistik scaler (mean & variance) diperbarui secara berjalan
+#     (StandardScaler.partial_fit, melanjutkan n_samples_seen_ dari training),
+#   - Naive Bayes: partial_fit dengan baris baru,
+#   - KNN tidak punya partial_fit: data tetangga lama + baris baru di-fit ulang
+#     SEKALI per update (KD-tree dibangun ulang dari semua baris),
+#   - Decision Tree tidak bisa diperbarui sebagian. Baris baru disimpan dulu,
+#     dan pohon dilatih ulang (parameter sama, tanpa grid search) hanya jika
+#     data baru sudah bergeser (drift) melewati DRIFT_THRESHOLD.
+# Jika drift melewati batas, model APA PUN dilatih ulang dengan scaler baru
+# pada dataset + semua baris tambahan. Model lama dan model baru dinilai pada
+# test split yang sama, jadi akurasinya bisa langsung dibandingkan.
+#
+# Encoder TIDAK diubah: kategori baru (misal gender yang belum pernah ada)
+# membuat update dibatalkan, karena kode angka kategori lama akan bergeser.
+#
+# Hasilnya disimpan sebagai versi artifact baru (pkl + folder ringkas) secara
+# atomik; aplikasi yang sedang berjalan otomatis memakainya di rerun berikutnya.
+# Status update (scaler berjalan, baris tambahan) disimpan di .cache/update/.
+#
+# Cara pakai:
+#   python update_model.py pasien_baru.csv
+#   python update_model.py pasien_baru.csv --drift-threshold 0.1
+import argparse
+import copy
+import glob
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from artifact_io import DEFAULT_ARTIFACT_DIR, DEFAULT_PICKLE_PATH, artifact_version, load_artifact
+from prediction import encode_features
+from train import DEFAULT_CSV_PATH, TARGET, save_artifact
+
+DEFAULT_STATE_DIR = os.path.join('.cache', 'update')
+CHUNK_SIZE = 10_000
+# Drift = pergeseran rata-rata fitur data baru dibanding scaler model, dalam satuan
+# standar deviasi (fitur yang paling bergeser). 0.25 = seperempat standar deviasi.
+DRIFT_THRESHOLD = 0.25
+# Drift baru dinilai setelah cukup banyak baris baru, agar tidak terpicu oleh noise
+MIN_DRIFT_ROWS = 500
+
+
+# ==============================================================================
+# 1. STATUS UPDATE (DISIMPAN DI ANTARA PEMANGGILAN)
+# ==============================================================================
+class UpdateState:
+    """Scaler berjalan + statistik baris baru sejak model terakhir dilatih penuh."""
+
+    def __init__(self, artifact_version, scaler):
+        self.artifact_version = artifact_version
+        # Statistik SEMUA baris (training + tambahan), dipakai saat model dilatih ulang
+        self.running_scaler = copy.deepcopy(scaler)
+        # Statistik baris tambahan sejak pelatihan penuh terakhir, untuk menghitung drift
+        self.pending_scaler = None
+        self.rows_since_build = 0
+        self.rows_added = 0
+        self.n_batches = 0
+
+    @staticmethod
+    def path(state_dir):
+        return os.path.join(state_dir, 'state.pkl')
+
+    @classmethod
+    def load(cls, state_dir, artifact):
+        try:
+            with open(cls.path(state_dir), 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return cls(artifact['version'], artifact['scaler'])
+        if state.artifact_version != artifact['version']:
+            # Model diganti dari luar (misal train.py dijalankan ulang): mulai dari awal
+            print("⚠️ Model sudah berganti sejak update terakhir, status update lama diabaikan.")
+            clear_rows(state_dir)
+            return cls(artifact['version'], artifact['scaler'])
+        return state
+
+    def save(self, state_dir):
+        os.makedirs(state_dir, exist_ok=True)
+        tmp_path = f'{self.path(state_dir)}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self, f)
+        os.replace(tmp_path, self.path(state_dir))
+
+
+def rows_dir(state_dir):
+    return os.path.join(state_dir, 'rows')
+
+
+def clear_rows(state_dir):
+    for path in glob.glob(os.path.join(rows_dir(state_dir), '*.parquet')):
+        os.remove(path)
+
+
+def load_added_rows(state_dir, feature_names):
+    """Semua baris tambahan yang sudah di-encode: (X_mentah, y)."""
+    paths = sorted(glob.glob(os.path.join(rows_dir(state_dir), '*.parquet')))
+    if not paths:
+        return np.empty((0, len(feature_names))), np.empty(0, dtype=np.int64)
+    df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+    return df[feature_names].to_numpy(dtype=np.float64), df[TARGET].to_numpy()
+
+
+# ==============================================================================
+# 2. UPDATE PER CHUNK
+# ==============================================================================
+def drift_score(pending_scaler, model_scaler):
+    """Pergeseran rata-rata terbesar (dalam standar deviasi model) dari baris baru."""
+    if pending_scaler is None:
+        return 0.0
+    return float(np.max(np.abs(pending_scaler.mean_ - model_scaler.mean_) / model_scaler.scale_))
+
+
+def partial_update(model, X_scaled, y):
+    """Perbarui model dengan baris baru.
+
+    Mengembalikan cara model diperbarui ('partial_fit' atau 'refit'), None jika
+    model tidak bisa diperbarui tanpa latih ulang penuh (Decision Tree).
+    """
+    name = type(model).__name__
+    if name == 'GaussianNB':
+        model.partial_fit(X_scaled, y)
+        return 'partial_fit'
+    if name == 'KNeighborsClassifier':
+        # Tidak ada partial_fit: gabungkan dengan data tetangga lama lalu fit ulang
+        fit_X = np.vstack([model._fit_X, X_scaled])
+        fit_y = np.concatenate([model.classes_[model._y], y])
+        model.fit(fit_X, fit_y)
+        return 'refit'
+    return None
+
+
+def read_new_rows(csv_path, artifact, chunk_size=CHUNK_SIZE):
+    """Baca CSV baru per chunk, hasilkan (X_mentah, y) yang sudah di-encode."""
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+        if TARGET not in chunk.columns:
+            raise ValueError(f"Kolom target '{TARGET}' tidak ditemukan di '{csv_path}'")
+        yield encode_features(chunk, artifact), chunk[TARGET].to_numpy()
+
+
+# ==============================================================================
+# 3. LATIH ULANG PENUH (HANYA JIKA DRIFT)
+# ==============================================================================
+def rebuild(artifact, state, dataset_csv, state_dir):
+    """Latih ulang model (parameter sama) pada dataset + semua baris tambahan.
+
+    Model lama (dengan scaler lamanya) dan model baru dinilai pada test split
+    yang SAMA. Mengembalikan (model, scaler, akurasi baru, akurasi lama).
+    """
+    from dataset_cache import load_dataset
+
+    feature_names = artifact['feature_names']
+    df = load_dataset(dataset_csv)
+    X_added, y_added = load_added_rows(state_dir, feature_names)
+    X_raw = pd.DataFrame(np.vstack([encode_features(df, artifact), X_added]), columns=feature_names)
+    y = np.concatenate([df[TARGET].to_numpy(), y_added])
+
+    scaler = state.running_scaler
+    if scaler.n_samples_seen_ != len(X_raw):
+        # Dataset tidak sama dengan yang dipakai saat training: hitung ulang dari semua baris
+        print(f"⚠️ Jumlah baris ({len(X_raw)}) tidak sama dengan statistik scaler "
+              f"({scaler.n_samples_seen_}), scaler di-fit ulang.")
+        scaler = StandardScaler().fit(X_raw)
+
+    # Split yang sama seperti train.prepare_data (split baris mentah = split setelah scaling).
+    # Model lama bisa saja sudah melihat sebagian baris tambahan lewat partial update,
+    # jadi akurasi lamanya sedikit optimis, bukan sebaliknya.
+    X_train, X_test, y_train, y_test = train_test_split(X_raw, y, test_size=0.2, random_state=42)
+    model = clone(artifact['model']).fit(scaler.transform(X_train), y_train)
+    accuracy = accuracy_score(y_test, model.predict(scaler.transform(X_test)))
+    old_accuracy = accuracy_score(y_test, artifact['model'].predict(artifact['scaler'].transform(X_test)))
+    return model, scaler, accuracy, old_accuracy
+
+
+# ==============================================================================
+# 4. ALUR UTAMA
+# ==============================================================================
+def run_update(new_csv, pkl_path=DEFAULT_PICKLE_PATH, compact_dir=DEFAULT_ARTIFACT_DIR,
+               dataset_csv=DEFAULT_CSV_PATH, state_dir=DEFAULT_STATE_DIR,
+               drift_threshold=DRIFT_THRESHOLD, chunk_size=CHUNK_SIZE):
+    """Perbarui model dengan baris dari `new_csv` lalu terbitkan versi artifact baru.
+
+    Mengembalikan ringkasan update (dict). Jika ada baris yang tidak valid
+    (kolom hilang, kategori baru) atau `pkl_path` bukan file pkl, ValueError
+    dilempar dan tidak ada yang ditulis.
+    """
+    if os.path.isdir(pkl_path):
+        # Folder ringkas hanya berisi array untuk prediksi, tanpa model sklearn yang bisa di-fit
+        raise ValueError(f"'{pkl_path}' adalah folder artifact ringkas. Beri file .pkl di --model; "
+                         f"folder ringkas diberikan lewat --compact-dir dan ditulis ulang otomatis")
+    artifact = load_artifact(pkl_path)
+    state = UpdateState.load(state_dir, artifact)
+    model = artifact['model']
+    scaler = artifact['scaler']
+    feature_names = artifact['feature_names']
+
+    n_rows, n_correct = 0, 0
+    new_parts, scaled_parts = [], []
+    for X_raw, y in read_new_rows(new_csv, artifact, chunk_size):
+        X_frame = pd.DataFrame(X_raw, columns=feature_names)
+        X_scaled = scaler.transform(X_frame)
+        # Akurasi model LAMA di baris baru; model baru diperbarui setelah semua chunk dibaca
+        n_correct += int((model.predict(X_scaled) == y).sum())
+        n_rows += len(y)
+
+        state.running_scaler.partial_fit(X_frame)
+        if state.pending_scaler is None:
+            state.pending_scaler = StandardScaler()
+        state.pending_scaler.partial_fit(X_frame)
+        scaled_parts.append((X_scaled, y))
+        new_parts.append(X_frame.assign(**{TARGET: y}))
+
+    if n_rows == 0:
+        return {'rows': 0, 'action': 'none'}
+
+    state.rows_added += n_rows
+    state.rows_since_build += n_rows
+    drift = drift_score(state.pending_scaler, scaler)
+
+    # Simpan baris baru dulu (dipakai saat pelatihan ulang sekarang atau nanti).
+    # Jika langkah berikutnya gagal, file ini dihapus lagi agar status tetap konsisten.
+    os.makedirs(rows_dir(state_dir), exist_ok=True)
+    rows_path = os.path.join(rows_dir(state_dir), f'{time.strftime("%Y%m%d-%H%M%S")}-{state.n_batches:05d}.parquet')
+    pd.concat(new_parts, ignore_index=True).to_parquet(rows_path, index=False)
+    try:
+        summary = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'rows': n_rows,
+            'accuracy_on_new_rows': n_correct / n_rows,
+            'drift': drift,
+        }
+        if state.rows_since_build >= MIN_DRIFT_ROWS and drift > drift_threshold:
+            action = 'rebuild'
+            model, scaler, accuracy, old_accuracy = rebuild(artifact, state, dataset_csv, state_dir)
+            state.running_scaler = copy.deepcopy(scaler)
+            state.pending_scaler = None
+            state.rows_since_build = 0
+            artifact.update(model=model, scaler=scaler, accuracy=float(accuracy))
+            summary.update(accuracy_before=float(old_accuracy), accuracy_after=float(accuracy))
+        else:
+            X_scaled = np.vstack([part[0] for part in scaled_parts])
+            method = partial_update(model, X_scaled, np.concatenate([part[1] for part in scaled_parts]))
+            # None = Decision Tree tanpa drift: model tidak berubah
+            action = 'stored' if method is None else 'partial_update'
+            summary['method'] = method
+        summary['action'] = action
+        if action != 'stored':
+            artifact['updates'] = list(artifact.get('updates', [])) + [summary]
+            # Kernel, explainer & versi dibuat ulang saat artifact baru dimuat
+            for key in ('kernel', 'explainer', 'version'):
+                artifact.pop(key, None)
+            save_artifact(artifact, pkl_path, compact_dir)
+            state.artifact_version = artifact_version(pkl_path)
+        state.n_batches += 1
+        state.save(state_dir)
+    except BaseException:
+        os.remove(rows_path)
+        raise
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update model bertahap dengan data pasien baru")
+    parser.add_argument('csv', help="File CSV berisi pasien baru (kolom fitur + diagnosed_diabetes)")
+    parser.add_argument('--model', default=DEFAULT_PICKLE_PATH)
+    parser.add_argument('--compact-dir', default=DEFAULT_ARTIFACT_DIR)
+    parser.add_argument('--dataset', default=DEFAULT_CSV_PATH, help="Dataset asli, dipakai saat latih ulang")
+    parser.add_argument('--state-dir', default=DEFAULT_STATE_DIR)
+    parser.add_argument('--drift-threshold', type=float, default=DRIFT_THRESHOLD)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        summary = run_update(args.csv, args.model, args.compact_dir, args.dataset, args.state_dir,
+                             args.drift_threshold, args.chunk_size)
+    except ValueError as e:
+        sys.exit(f"❌ Update dibatalkan, model tidak diubah: {e}")
+    if summary['rows'] == 0:
+        print("Tidak ada baris baru.")
+        return
+    messages = {
+        'partial_fit': "model diperbarui dengan baris baru (partial_fit)",
+        'refit': "KNN di-fit ulang pada data tetangga lama + baris baru (KD-tree dibangun ulang)",
+        'rebuild': "drift melewati batas, model dilatih ulang",
+        'stored': "baris disimpan, model tidak berubah (drift masih di bawah batas)",
+    }
+    print(f"{summary['rows']} baris baru | akurasi model lama di baris baru: {summary['accuracy_on_new_rows']:.2%} "
+          f"| drift: {summary['drift']:.3f}")
+    action = summary['action']
+    print(f"✅ {messages[summary.get('method') if action == 'partial_update' else action]}")
+    if action == 'rebuild':
+        print(f"Akurasi di test split yang sama: model lama {summary['accuracy_before']:.2%}, "
+              f"model baru {summary['accuracy_after']:.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+# ==============================================================================
+# DAFTAR HALAMAN APLIKASI
+# ==============================================================================
+# Setiap halaman ada di modulnya sendiri dan punya fungsi render().
+# diabetes-app.py hanya meng-import modul halaman yang sedang dibuka, jadi
+# library berat (pandas, matplotlib, sklearn) dan data baru dimuat saat
+# halaman yang membutuhkannya dipilih.
+
+# Nama menu -> nama modul di dalam package views
+PAGES = {
+    "Home": "views.home",
+    "Dataset": "views.dataset",
+    "Exploratory Data Analysis": "views.eda",
+    "Modelling": "views.modelling",
+    "Prediction": "views.predict",
+    "Batch Prediction": "views.batch_predict",
+    "About": "views.about",
+}
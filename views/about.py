@@ -0,0 +1,31 @@
+# ==============================================================================
+# HALAMAN: ABOUT
+# ==============================================================================
+# Profil pembuat aplikasi.
+import streamlit as st
+
+
+def render():
+    st.header("Tentang Saya")
+    st.image("photos/foto-profil.jpg", width=150)
+    
+    st.write("""
+    **Assoc. Prof. Mega Novita**
+    
+    Saya adalah seorang akademisi dan peneliti terkemuka yang saat ini menjabat sebagai Kepala Kantor Urusan Internasional (Head of International Affairs) di Universitas PGRI Semarang (UPGRIS). 
+             
+    Dengan memiliki latar belakang pendidikan yang kuat dengan gelar MSc dan PhD di bidang Kimia dari Kwansei Gakuin University, Jepang, serta pengalaman postdoctoral di Jepang dan Korea Selatan.
+    Menguasai keahlian secara interdisipliner, mencakup bidang kimia, biologi, dan matematika.
+
+    Dalam dunia pendidikan nasional, saya berperan aktif dalam reformasi pendidikan di Indonesia. 
+    Sejak tahun 2022, telah menjadi fasilitator bagi lebih dari 60 sekolah dalam Program Sekolah Penggerak dan membimbing lebih dari 150 mahasiswa sebagai Dosen Pembimbing Lapangan di Program Kampus Mengajar.
+
+    Di ranah ilmiah, Mega Novita aktif dalam kolaborasi riset internasional.
+    Fokus penelitiannya mendalami terbagi menjadi 2 yaitu pada bidang Informatika dan Kimia.
+             
+    Pada Bidang Informatika berupa penggunaan data science sederhana.
+    Dan pada bidang Kimia mengenai struktur elektronik logam transisi dan ion tanah jarang (rare-earth ions), khususnya untuk material fosfor merah.
+    """)
+    st.markdown("---")
+
+    st.caption("© 2025 Diabetes Prediction Project")
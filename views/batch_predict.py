@@ -0,0 +1,61 @@
+# ==============================================================================
+# HALAMAN: BATCH PREDICTION
+# ==============================================================================
+# Prediksi banyak pasien sekaligus dari file CSV (lihat prediction.py).
+import time
+
+import pandas as pd
+import streamlit as st
+
+from loaders import load_model_artifact
+from prediction import predict_batch, ERROR_COLUMN, PREDICTION_COLUMN, PROBABILITY_COLUMN
+
+
+def render():
+    artifact = load_model_artifact()
+    st.header("📑 Prediksi Banyak Pasien (Batch)")
+    st.markdown("Upload file CSV berisi data pasien. Semua baris akan dianalisis sekaligus.")
+
+    if artifact:
+        st.caption(f"Kolom wajib: {', '.join(artifact['feature_names'])}")
+        uploaded = st.file_uploader("Upload file CSV", type="csv")
+        explainer = artifact.get('explainer')
+        explain = st.checkbox(
+            "Sertakan kontribusi setiap fitur (kolom contribution_*)", value=False, disabled=explainer is None,
+            help=("Satuan: probabilitas (Decision Tree) atau log-odds (Naive Bayes)." if explainer is not None
+                  else "Belum tersedia untuk model ini (hanya Decision Tree & Naive Bayes)."))
+
+        if uploaded is not None:
+            try:
+                # File kosong/rusak (EmptyDataError, ParserError, UnicodeDecodeError) juga turunan ValueError
+                df_batch = pd.read_csv(uploaded)
+                with st.spinner(f'Sedang menganalisis {len(df_batch)} pasien...'):
+                    start = time.perf_counter()
+                    df_result = predict_batch(df_batch, artifact, explain=explain)
+                    elapsed = time.perf_counter() - start
+            except ValueError as e:
+                st.error(f"File tidak bisa diproses: {e}")
+            else:
+                n_positive = int((df_result[PREDICTION_COLUMN] == 1).sum())
+                n_invalid = int((df_result[ERROR_COLUMN] != '').sum()) if ERROR_COLUMN in df_result else 0
+                n_scored = len(df_result) - n_invalid
+                st.success(f"Selesai! {n_scored} pasien dianalisis dalam {elapsed:.2f} detik.")
+                if n_invalid:
+                    st.warning(f"{n_invalid} baris tidak dinilai karena datanya kosong/tidak valid. "
+                               f"Alasannya ada di kolom '{ERROR_COLUMN}'.")
+                    st.dataframe(df_result[df_result[ERROR_COLUMN] != ''].head(20))
+
+                col_b1, col_b2 = st.columns(2)
+                col_b1.metric("Positif (Berisiko)", n_positive)
+                col_b2.metric("Negatif (Sehat)", n_scored - n_positive)
+
+                # Tampilkan sebagian hasil, file lengkap bisa diunduh
+                st.dataframe(df_result.sort_values(PROBABILITY_COLUMN, ascending=False).head(100))
+                st.download_button(
+                    "⬇️ Download Hasil Prediksi (CSV)",
+                    data=df_result.to_csv(index=False).encode('utf-8'),
+                    file_name="hasil_prediksi_diabetes.csv",
+                    mime="text/csv",
+                )
+    else:
+        st.error("File model 'diabetes_model.pkl' tidak ditemukan.")
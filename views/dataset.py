@@ -0,0 +1,124 @@
+# ==============================================================================
+# HALAMAN: DATASET
+# ==============================================================================
+# Tinjauan dataset. Statistik diambil dari cache EDA (lihat eda_cache.py),
+# jadi dataset lengkap tidak perlu dibaca setiap halaman ini dibuka.
+import streamlit as st
+
+from loaders import load_eda_summary
+
+
+def render():
+    summary = load_eda_summary()
+    st.header("📂 Tinjauan Dataset")
+    
+    if summary is not None:
+        st.write("""
+        **1. Tentang Apa Dataset Ini?**
+                 
+        Dataset ini diambil dari platform Kaggle dengan url https://www.kaggle.com/datasets/mohankrishnathalla/diabetes-health-indicators-dataset
+        
+        Dataset ini berisi data rekam medis pasien yang bertujuan untuk mendiagnosis atau memprediksi risiko penyakit Diabetes (Tipe 2). 
+        
+        Data ini menghubungkan kebiasaan hidup seseorang (makan, tidur, olahraga) 
+        dengan hasil laboratorium medis mereka (gula darah, kolesterol) 
+        untuk menentukan apakah mereka menderita diabetes atau tidak.
+
+        """)
+        st.write("""
+        **2. Target Variable (Label/Kunci Jawaban)**
+        Ini adalah kolom yang biasanya ingin kita prediksi menggunakan Machine Learning:
+
+        diagnosed_diabetes (Target Utama):
+
+        Tipe: Kategorikal / Biner (1 atau 0).
+
+        Isi: 1 (Positif Diabetes) atau 0 (Negatif/Sehat).
+
+        Kegunaan: Untuk Supervised Learning jenis Klasifikasi.
+
+        Target Alternatif (Opsional):
+
+        diabetes_stage: Jika ingin memprediksi tahapan (misal: "No Diabetes", "Pre-diabetes", "Type 2"). Ini untuk Multi-class Classification.
+
+        diabetes_risk_score: Jika ingin memprediksi skor risiko (angka kontinu). Ini untuk Regression.
+        """)
+
+        st.write("""
+        **3. Fitur (Features / Input Variables)**
+        Kolom-kolom ini adalah "Soal" atau data pendukung untuk melakukan prediksi. Kita bisa mengelompokkannya menjadi 3 kategori besar:
+
+        A. Data Demografis & Sosial (Siapa Pasiennya?)
+        age: Umur pasien.
+
+        gender: Jenis kelamin (Male/Female).
+
+        ethnicity: Suku bangsa/Etnis.
+
+        education_level: Tingkat pendidikan.
+
+        income_level: Tingkat pendapatan.
+
+        employment_status: Status pekerjaan.
+
+        B. Data Gaya Hidup (Lifestyle) - Faktor Risiko Eksternal
+        smoking_status: Status merokok (Never, Former, Current).
+
+        alcohol_consumption_per_week: Konsumsi alkohol mingguan.
+
+        physical_activity_minutes_per_week: Durasi olahraga per minggu.
+
+        diet_score: Skor kualitas diet/makan (kemungkinan skala angka).
+
+        sleep_hours_per_day: Jam tidur per hari.
+
+        screen_time_hours_per_day: Lama menatap layar (HP/Laptop) per hari.
+
+        C. Data Riwayat Medis & Klinis (Hasil Lab) - Faktor Risiko Internal
+        Riwayat Penyakit:
+
+        family_history_diabetes: Apakah ada keluarga yang diabetes? (0/1).
+
+        hypertension_history: Riwayat darah tinggi.
+
+        cardiovascular_history: Riwayat penyakit jantung.
+
+        Pengukuran Fisik:
+
+        bmi (Body Mass Index): Indeks massa tubuh (Berat/Tinggi). Indikator obesitas.
+
+        waist_to_hip_ratio: Rasio lingkar pinggang dan pinggul (indikator lemak perut).
+
+        systolic_bp & diastolic_bp: Tekanan darah (atas dan bawah).
+
+        heart_rate: Detak jantung.
+
+        Laboratorium Darah (PENTING):
+
+        glucose_fasting: Gula darah puasa.
+
+        glucose_postprandial: Gula darah setelah makan.
+
+        hba1c: Rata-rata gula darah dalam 3 bulan terakhir (Indikator emas diabetes).
+
+        insulin_level: Kadar insulin.
+
+        cholesterol_total, hdl, ldl, triglycerides: Profil lemak darah.
+        """)
+
+        st.write(f"**Total Dataset**")
+        st.write(f"**Jumlah Baris Data:** {summary['rows']}")
+        st.write(f"**Jumlah Kolom Fitur:** {summary['cols']}")
+
+        st.write("Ini adalah contoh data mentah yang digunakan untuk melatih model AI:")
+        # Menampilkan 10 baris pertama data
+        st.dataframe(summary['head'])
+        
+        # # Membuat 2 kolom berdampingan untuk info statistik
+        # col1, col2 = st.columns(2)
+        # with col1:
+        # with col2:
+        st.write("**Statistik Singkat:**")
+        st.dataframe(summary['describe'])
+    else:
+        st.error("File 'diabetes_dataset.csv' tidak ditemukan. Harap upload file tersebut.")
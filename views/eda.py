@@ -0,0 +1,73 @@
+# ==============================================================================
+# HALAMAN: EDA (EXPLORATORY DATA ANALYSIS)
+# ==============================================================================
+# Visualisasi data. Grafik sudah digambar sebelumnya dan disimpan sebagai PNG
+# per versi dataset (lihat eda_cache.py), jadi halaman ini hanya menampilkannya.
+import streamlit as st
+# Sklearn: Diperlukan di sini hanya untuk demonstrasi preprocessing
+from sklearn.preprocessing import StandardScaler, LabelEncoder
+
+from app_metrics import span
+from loaders import load_eda_summary
+
+
+def render():
+    summary = load_eda_summary()
+    st.header("📊 Analisis Data Eksploratif & Preprocessing")
+    
+    if summary is not None:
+        # --- TAB 1: VISUALISASI ---
+        st.subheader("1. Visualisasi Data")
+        tab1, tab2 = st.tabs(["Distribusi Target", "Hubungan Fitur"])
+        
+        with tab1:
+            st.write("**Perbandingan Orang Sehat vs Diabetes**")
+            # Diagram batang jumlah data (gambar dari cache)
+            with span('figure', page='eda', figure='target_count'):
+                st.image(summary['figures']['target_count'])
+            
+        with tab2:
+            st.write("**Hubungan Gula Darah dengan Umur**")
+            # Scatterplot untuk melihat sebaran titik data (sampel per kelas, gambar dari cache)
+            with span('figure', page='eda', figure='age_vs_glucose'):
+                st.image(summary['figures']['age_vs_glucose'])
+
+        st.divider() # Garis pembatas
+
+        # --- TAB 2: PREPROCESSING (PERMINTAAN NO 1) ---
+        st.subheader("2. Proses Pengolahan Data (Preprocessing)")
+        st.write("""
+        Sebelum data masuk ke mesin AI, data harus 'dimasak' dulu agar mesin mengerti.
+        Proses ini disebut **Preprocessing**.
+        """)
+
+        # Tahap A: Data Mentah
+        st.write("#### Langkah A: Data Awal (Masih Bahasa Manusia)")
+        st.dataframe(summary['head'][['gender', 'age', 'glucose_fasting']].head(3))
+        st.caption("Lihat kolom 'gender', isinya masih teks 'Male'/'Female'. Komputer tidak bisa hitung teks.")
+
+        # Tahap B: Encoding & Scaling (Simulasi)
+        # Kita buat copy data biar data asli tidak rusak
+        df_demo = summary['head'][['gender', 'age', 'glucose_fasting']].head(5).copy()
+        
+        # Encoding: Ubah Teks -> Angka
+        le_demo = LabelEncoder()
+        df_demo['gender_encoded'] = le_demo.fit_transform(df_demo['gender'])
+        
+        # Scaling: Ubah Angka -> Skala Standar
+        scaler_demo = StandardScaler()
+        # Kita scale umur dan gula darah
+        scaled_values = scaler_demo.fit_transform(df_demo[['age', 'glucose_fasting']])
+        df_demo['age_scaled'] = scaled_values[:, 0]
+        df_demo['glucose_scaled'] = scaled_values[:, 1]
+
+        st.write("#### Langkah B: Data Setelah Preprocessing (Bahasa Mesin)")
+        st.dataframe(df_demo[['gender_encoded', 'age_scaled', 'glucose_scaled']].head(3))
+        st.caption("""
+        **Perubahan:**
+        1. **Encoding:** 'Male/Female' berubah jadi angka 0 atau 1.
+        2. **Scaling:** Umur '50' dan Gula '150' diubah jadi angka desimal kecil (misal -0.5 sampai 1.2) agar setara.
+        """)
+
+    else:
+        st.warning("Data tidak tersedia.")
@@ -0,0 +1,28 @@
+# ==============================================================================
+# HALAMAN: HOME
+# ==============================================================================
+# Halaman sambutan. Hanya butuh Streamlit, jadi tampil paling cepat.
+import streamlit as st
+
+
+def render():
+    st.title("🏥 Klasifikasi Risiko Diabetes")
+    st.write("""
+    **Selamat Datang!**
+    
+    Aplikasi ini dibuat untuk membantu orang awam mengecek risiko diabetes secara dini
+    menggunakan kecerdasan buatan (*Artificial Intelligence*).
+    
+    Kami menggunakan data medis standar seperti Gula Darah, BMI, dan HbA1c untuk
+    melakukan prediksi.
+    """)
+    
+    # Menampilkan gambar ilustrasi dari internet
+    
+    st.info("💡 **Panduan Menu:**")
+    st.info("Pilih menu 'Dataset' untuk melihat sample dataset yang digunakan dalam pemodelan.")
+    st.info("Pilih menu 'Exploratory Data Analysis' untuk melihat Visualisasi Data.")
+    st.info("Pilih menu 'Modelling' untuk melihat hasil perbandingan model yang digunakan.")
+    st.info("Pilih menu 'Prediction' untuk memulai diagnosa.")
+    st.info("Pilih menu 'Batch Prediction' untuk mendiagnosa banyak pasien sekaligus dari file CSV.")
+    st.info("Pilih menu 'About' untuk melihat profil.")
@@ -0,0 +1,63 @@
+# ==============================================================================
+# HALAMAN: MODELLING
+# ==============================================================================
+# Perbandingan performa model dari histori yang tersimpan di file model.
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+import streamlit as st
+
+from app_metrics import span
+from loaders import load_model_artifact
+
+
+def render():
+    artifact = load_model_artifact()
+    st.header("⚙️ Performa Model AI")
+    
+    st.write("""
+    Kami melatih 3 algoritma berbeda: **KNN**, **Naive Bayes**, dan **Decision Tree**.
+    Proses pelatihan dilakukan dalam 2 tahap:
+    1. **Baseline:** Menggunakan pengaturan standar (pabrikan).
+    2. **Tuned:** Menggunakan pengaturan yang sudah dioptimalkan (hyperparameter tuning).
+    """)
+    
+    if artifact and 'history' in artifact:
+        # 1. Mengambil data history dari file model
+        history_data = artifact['history']
+        
+        # 2. Membuat DataFrame
+        df_compare = pd.DataFrame(history_data)
+        
+        # 3. Formatting Tampilan Angka (Agar jadi persen %)
+        # Kita format kolom angka agar terlihat cantik (misal 0.82 jadi 82.00%)
+        st.subheader("Tabel Perbandingan Akurasi")
+        
+        # Menggunakan Styler untuk format
+        st.dataframe(
+            df_compare.style.format({
+                'Akurasi Awal': '{:.2%}',
+                'Akurasi Tuned': '{:.2%}',
+                'Improvement': '{:+.2%}' # Tanda + biar kelihatan naik/turun
+            })
+        )
+        
+        # 4. Membuat Grafik Perbandingan
+        st.subheader("Grafik Peningkatan Performa")
+        
+        # Kita reshape data biar mudah di-plot (Melt)
+        df_melted = df_compare.melt(id_vars="Model", value_vars=["Akurasi Awal", "Akurasi Tuned"], var_name="Kondisi", value_name="Akurasi")
+        
+        with span('figure', page='modelling', figure='accuracy_comparison'):
+            fig, ax = plt.subplots(figsize=(10, 5))
+            sns.barplot(data=df_melted, x="Model", y="Akurasi", hue="Kondisi", palette="viridis", ax=ax)
+            ax.set_ylim(0, 1.0) # Set batas Y dari 0 sampai 100%
+            for container in ax.containers:
+                ax.bar_label(container, fmt='%.2f')
+            st.pyplot(fig)
+            plt.close(fig) # Tutup figure agar tidak menumpuk di memori
+        
+        st.success(f"🏆 **Model Terpilih:** {artifact['model_name']} dengan akurasi **{artifact['accuracy']:.2%}**")
+        
+    else:
+        st.warning("⚠️ Data histori perbandingan tidak ditemukan di dalam file model. Harap jalankan ulang `models.py` yang baru.")
@@ -0,0 +1,216 @@
+# ==============================================================================
+# HALAMAN: PREDICTION
+# ==============================================================================
+# Formulir prediksi untuk satu pasien.
+# Prediksi dijalankan di pool latar belakang (prediction_pool.py): setelah
+# formulir dikirim, script langsung selesai, dan bagian "menunggu hasil"
+# mengecek hasilnya setiap POLL_SECONDS detik sampai selesai.
+from concurrent.futures import CancelledError
+
+import numpy as np
+import streamlit as st
+
+from app_metrics import span
+from explain import explain_one
+from loaders import load_model_artifact, load_prediction_cache, load_prediction_pool
+from prediction import canonical_features
+from prediction_cache import predict_proba_cached
+from prediction_pool import PoolSaturated
+
+POLL_SECONDS = 0.2
+
+
+def _predict_job(X, artifact, cache):
+    # Dijalankan di thread pekerja pool. BMI dibulatkan seperti di dataset (sama seperti
+    # encode_features), jadi prediksi, cache, dan penjelasan memakai nilai yang sama.
+    X = canonical_features(X, artifact['feature_names'])
+    with span('predict_form'):
+        probs = predict_proba_cached(X, artifact, cache)  # Persentase keyakinan
+    # Kontribusi setiap fitur: tabel yang sudah dihitung saat model dimuat (lihat explain.py)
+    with span('predict_explain'):
+        explanation = explain_one(X[0], artifact)
+    return probs, explanation
+
+
+def render():
+    artifact = load_model_artifact()
+    st.header("🔮 Prediksi Risiko Diabetes")
+    st.markdown("Silakan isi formulir di bawah ini sesuai data pasien.")
+    
+    if artifact:
+        model = artifact['model']
+        # Panggil kedua encoder
+        enc_gender = artifact['encoder_gender']
+        enc_smoking = artifact['encoder_smoking'] # Ambil encoder rokok
+        
+        with st.form("pred_form"):
+            st.subheader("Data Pasien")
+            c1, c2, c3 = st.columns(3) # Bagi jadi 3 kolom biar rapi
+            
+            # --- KOLOM 1: DEMOGRAFI & FISIK ---
+            with c1:
+                st.markdown("##### 1. Fisik & Demografi")
+                age = st.number_input("Umur", 20, 90, 45)
+                gender = st.selectbox("Jenis Kelamin", ["Male", "Female"])
+                # Input BMI otomatis
+                weight = st.number_input("Berat (kg)", 30, 150, 70)
+                height = st.number_input("Tinggi (cm)", 100, 250, 170)
+                bmi = weight / ((height/100)**2)
+                st.caption(f"BMI Terhitung: {bmi:.1f}")
+
+            # --- KOLOM 2: GAYA HIDUP (FITUR BARU) ---
+            with c2:
+                st.markdown("##### 2. Gaya Hidup")
+                # Mengambil opsi rokok langsung dari encoder biar cocok 100%
+                smoking_options = ['Perokok', 'Sudah Berhenti Merokok', 'Tidak Pernah Merokok'] 
+                smoking = st.selectbox("Status Merokok", smoking_options)
+
+                if (smoking == 'Perokok'):
+                    smoking = 'Current'
+                elif (smoking == 'Sudah Berhenti Merokok'):
+                    smoking = 'Former'
+                else :
+                    smoking = 'Never'
+                
+                activity = st.number_input("Olahraga (menit/minggu)", 0, 1000, 150, help="Saran WHO: Minimal 150 menit/minggu")
+                
+                # Riwayat Keluarga & Hipertensi
+                family = st.selectbox("Riwayat Diabetes Keluarga?", ["No", "Yes"])
+                hyper = st.selectbox("Riwayat Hipertensi?", ["No", "Yes"])
+
+            # --- KOLOM 3: MEDIS & LAB (FITUR BARU) ---
+            with c3:
+                st.markdown("##### 3. Cek Laboratorium")
+                glucose = st.number_input("Gula Darah Puasa (mg/dL)", 50, 400, 100)
+                # hba1c = st.number_input("HbA1c (%)", 3.0, 15.0, 5.5)
+                cholesterol = st.number_input("Kolesterol Total (mg/dL)", 100, 400, 180, help="Normal: < 200 mg/dL")
+            
+            # Tombol untuk memulai prediksi
+            submit_btn = st.form_submit_button("🔍 Analisis Risiko Sekarang")
+
+        # --- LOGIKA KETIKA TOMBOL DITEKAN ---
+        if submit_btn:
+            # 1. Hitung BMI (Rumus: Berat / Tinggi Meter Kuadrat)
+            height_m = height / 100
+            bmi_calculated = weight / (height_m ** 2)
+            
+            # 2. Terjemahkan Input User (Preprocessing)
+            # Ubah Male/Female jadi angka
+            gender_val = enc_gender.transform([gender])[0]
+            smoke_val = enc_smoking.transform([smoking])[0]
+            # Ubah Yes/No jadi 1/0
+            family_val = 1 if family == "Yes" else 0
+            hyper_val = 1 if hyper == "Yes" else 0
+            
+            # 3. Susun Data Input sesuai urutan saat Training
+            # Urutan: [age, gender, bmi, glucose, hba1c, family, hyper]
+            # input_data = [[
+            #     age, gender_val, bmi, glucose, hba1c, family_val, hyper_val, 
+            #     smoke_val, activity, cholesterol
+            # ]]
+            input_data = [[
+                age, gender_val, bmi, glucose, family_val, hyper_val, 
+                smoke_val, activity, cholesterol
+            ]]
+            
+            # 4. Scaling + Prediksi oleh Model
+            # Data baru harus disetarakan skalanya menggunakan scaler yang sama dengan training.
+            # Untuk Decision Tree, scaler sudah dilipat ke dalam pohon (lihat tree_kernel.py).
+            # Input yang sama persis dengan pasien sebelumnya diambil dari cache, tanpa memanggil model.
+            cache = load_prediction_cache()
+            pool = load_prediction_pool()
+            try:
+                future = pool.submit(_predict_job, np.array(input_data, dtype=np.float64), artifact, cache)
+            except PoolSaturated as e:
+                st.warning(f"⚠️ Server sedang sibuk: {e.stats['running']} prediksi sedang diproses dan "
+                           f"{e.stats['queued']} menunggu (antrean penuh). Silakan kirim ulang sebentar lagi.")
+            else:
+                st.session_state['predict_job'] = {'future': future, 'classes': model.classes_,
+                                                   'bmi': bmi_calculated}
+
+        # 5. Tampilkan hasil jika sudah selesai, jika belum tunggu tanpa menahan script
+        job = st.session_state.get('predict_job')
+        if job is not None:
+            if job['future'].done():
+                # Hasil hanya ditampilkan sekali, sama seperti sebelumnya (setelah tombol ditekan)
+                del st.session_state['predict_job']
+                _render_result(job, load_prediction_cache())
+            else:
+                _wait_for_result()
+
+
+@st.fragment(run_every=POLL_SECONDS)
+def _wait_for_result():
+    job = st.session_state.get('predict_job')
+    if job is None or job['future'].done():
+        # Gambar ulang seluruh halaman, kali ini dengan hasil prediksi
+        st.rerun()
+    stats = load_prediction_pool().stats()
+    st.info(f"⏳ Sedang menganalisis pola kesehatan... (antrean: {stats['queued']} menunggu, "
+            f"{stats['running']} diproses)")
+
+
+def _render_result(job, cache):
+    st.info(f"ℹ️ BMI Pasien Terhitung: **{job['bmi']:.1f}**")
+    try:
+        probs, explanation = job['future'].result()
+    except (Exception, CancelledError) as e:
+        # Error di thread pool tidak boleh menjatuhkan halaman, cukup pesan seperti saat antrean penuh
+        st.error(f"❌ Prediksi gagal: {str(e) or type(e).__name__}. Silakan kirim ulang sebentar lagi.")
+        return
+    prediction = job['classes'][probs[0].argmax()]  # Hasil 0 atau 1
+
+    # 6. Tampilkan Hasil
+    st.divider()
+    confidence = probs[0][prediction] * 100
+
+    col_res1, col_res2 = st.columns([1, 2])
+
+    with col_res1:
+        # Tampilkan ikon sesuai hasil
+        if prediction == 1:
+            st.image("https://cdn-icons-png.flaticon.com/512/564/564619.png", width=120)
+        else:
+            st.image("https://cdn-icons-png.flaticon.com/512/2966/2966334.png", width=120)
+
+    with col_res2:
+        if prediction == 1:
+            st.error(f"### HASIL: POSITIF (Berisiko)")
+            st.write("Sistem mendeteksi adanya pola yang mirip dengan pasien diabetes.")
+            st.markdown("**Saran:** Segera konsultasi ke dokter dan atur pola makan.")
+        else:
+            st.success(f"### HASIL: NEGATIF (Sehat)")
+            st.write("Sistem tidak mendeteksi risiko diabetes yang signifikan.")
+            st.markdown("**Saran:** Pertahankan gaya hidup sehat dan olahraga teratur.")
+
+    _render_explanation(explanation)
+
+    stats = cache.stats()
+    st.caption(f"Cache prediksi: {stats['hits']} dari {stats['hits'] + stats['misses']} permintaan "
+               f"langsung dijawab ({stats['hit_rate']:.0%}), {stats['size']} hasil tersimpan.")
+
+
+def _render_explanation(explanation):
+    # 7. Fitur yang paling mendorong hasil (lihat explain.py)
+    st.markdown("##### 🧭 Faktor yang Paling Berpengaruh")
+    if explanation is None:
+        st.caption("Penjelasan per fitur belum tersedia untuk model ini (hanya Decision Tree & Naive Bayes).")
+        return
+
+    if explanation['unit'] == 'probabilitas':
+        fmt = lambda c: f"{c * 100:+.1f} poin %"
+        st.caption(f"Rata-rata risiko di data latih {explanation['base']:.1%}; setiap fitur menaikkan (+) "
+                   f"atau menurunkan (-) risiko pasien ini hingga {explanation['total']:.1%}.")
+    else:
+        fmt = lambda c: f"{c:+.2f}"
+        st.caption("Kontribusi dalam log-odds: nilai + menaikkan risiko, nilai - menurunkan risiko.")
+
+    st.table([
+        {'Fitur': name, 'Nilai Pasien': value, 'Kontribusi': fmt(c),
+         'Arah': '⬆️ menaikkan risiko' if c > 0 else '⬇️ menurunkan risiko'}
+        for name, value, c in explanation['top']
+    ])
+    if explanation['path']:
+        with st.expander("Jalur keputusan Decision Tree"):
+            st.markdown("\n".join(f"{i}. `{name}` = {value} {op} {threshold:.2f}"
+                                   for i, (name, op, threshold, value) in enumerate(explanation['path'], 1)))